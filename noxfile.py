@@ -162,6 +162,35 @@ def tests(session: Session) -> None:
             session.notify("coverage", posargs=[])
 
 
+@session(python=python_versions[0])
+def benchmarks(session: Session) -> None:
+    """Run the benchmark suite and compare it against the pinned baseline run.
+
+    The first run saves the baseline. Remove the .benchmarks/baseline directory to pin a new one.
+    """
+    args = session.posargs or ["--benchmark-compare-fail=mean:10%"]
+    storage = Path(".benchmarks", "baseline")
+    session.install(".")
+    session.install("pytest", "pytest-benchmark")
+    if not any(storage.glob("*/0001_*.json")):
+        session.run(
+            "pytest",
+            "tests/benchmarks",
+            "--benchmark-only",
+            f"--benchmark-storage={storage}",
+            "--benchmark-save=baseline",
+        )
+        return
+    session.run(
+        "pytest",
+        "tests/benchmarks",
+        "--benchmark-only",
+        f"--benchmark-storage={storage}",
+        "--benchmark-compare=0001",
+        *args,
+    )
+
+
 @session(python=python_versions[0])
 def coverage(session: Session) -> None:
     """Produce the coverage report."""
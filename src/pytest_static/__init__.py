@@ -1 +1,10 @@
 """pytest-static."""
+
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version
+
+
+try:
+    __version__: str = version("pytest-static")
+except PackageNotFoundError:
+    __version__ = "unknown"
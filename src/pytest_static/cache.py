@@ -0,0 +1,78 @@
+"""Module containing the caches used to avoid re-running type handlers."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+from typing import Generic
+from typing import NamedTuple
+
+from pytest_static.custom_typing import KT
+from pytest_static.custom_typing import VT
+
+
+DEFAULT_CACHE_SIZE: int = 1024
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a LRUCache, mirroring functools' cache_info."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[KT, VT]):
+    """Bounded least recently used cache that silently skips unhashable keys."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Sets up the cache."""
+        if maxsize < 0:
+            raise ValueError(f"Cache maxsize must be non-negative. Got {maxsize}")
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._data: OrderedDict[KT, VT] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of cached entries."""
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        """Returns whether the key is cached without counting a hit or miss."""
+        try:
+            return key in self._data
+        except TypeError:
+            return False
+
+    def get(self, key: KT, default: Any = None) -> Any:
+        """Returns the cached value for key, or default if it is missing or unhashable."""
+        try:
+            value: VT = self._data[key]
+        except (KeyError, TypeError):
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: KT, value: VT) -> None:
+        """Caches value under key, evicting the least recently used entry when full."""
+        if self.maxsize == 0:
+            return
+        try:
+            self._data[key] = value
+        except TypeError:
+            return
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every cached entry while keeping the hit and miss counters."""
+        self._data.clear()
+
+    def info(self) -> CacheInfo:
+        """Returns the current hit, miss, and size statistics."""
+        return CacheInfo(hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self._data))
@@ -0,0 +1,366 @@
+"""Module containing the strategies used to choose which combinations of parameter instances are generated."""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+import re
+import sys
+from collections.abc import Sequence
+from operator import itemgetter
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import overload
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+
+PRODUCT: str = "product"
+PAIRWISE: str = "pairwise"
+EACH_CHOICE: str = "each-choice"
+STRATEGIES: tuple[str, ...] = (PRODUCT, PAIRWISE, EACH_CHOICE, "t-wise(n)")
+
+_T_WISE_PATTERN: re.Pattern[str] = re.compile(r"t-wise\((\d+)\)")
+
+
+_Row = list[Optional[int]]
+_Interactions = dict[tuple[int, ...], dict[Any, int]]
+
+
+def parse_strategy(strategy: str) -> int | None:
+    """Returns the interaction strength covered by the strategy, or None for the full product."""
+    normalized: str = strategy.strip().lower()
+    if normalized == PRODUCT:
+        return None
+    if normalized == PAIRWISE:
+        return 2
+    if normalized == EACH_CHOICE:
+        return 1
+
+    match: re.Match[str] | None = _T_WISE_PATTERN.fullmatch(normalized)
+    if match is None or int(match.group(1)) < 1:
+        raise ValueError(f"Unknown combination strategy {strategy!r}. Expected one of {', '.join(STRATEGIES)}.")
+    return int(match.group(1))
+
+
+class ProductIndices(Sequence[tuple[int, ...]]):
+    """Random access view over the cartesian product of ranges, decoded with mixed-radix arithmetic.
+
+    Indices follow itertools.product ordering, so the last parameter varies fastest. Use size rather than len() for
+    products larger than sys.maxsize.
+    """
+
+    def __init__(self, sizes: Sequence[int]) -> None:
+        """Stores the number of values of each parameter."""
+        self.sizes: tuple[int, ...] = tuple(sizes)
+        self.size: int = math.prod(self.sizes)
+
+    def __len__(self) -> int:
+        """Returns the number of combinations."""
+        return self.size
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        """Iterates over every combination in order."""
+        return itertools.product(*map(range, self.sizes))
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[int, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[tuple[int, ...]]: ...
+
+    def __getitem__(self, index: int | slice) -> tuple[int, ...] | Sequence[tuple[int, ...]]:
+        """Returns the combination at the given index, or a lazy view of the combinations in a slice."""
+        if isinstance(index, slice):
+            return CombinationView(self, range(self.size)[index])
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Combination index {index} out of range for {self.size} combinations.")
+
+        digits: list[int] = []
+        for size in reversed(self.sizes):
+            index, digit = divmod(index, size)
+            digits.append(digit)
+        return tuple(reversed(digits))
+
+
+class CombinationView(Sequence[tuple[int, ...]]):
+    """Lazy view of the combinations found at a range of positions in another sequence of combinations."""
+
+    def __init__(self, combinations: Sequence[tuple[int, ...]], positions: range) -> None:
+        """Stores the viewed combinations and the positions included in the view."""
+        self.combinations: Sequence[tuple[int, ...]] = combinations
+        self.positions: range = positions
+        self.size: int = max(0, -(-(positions.stop - positions.start) // positions.step))
+
+    def __len__(self) -> int:
+        """Returns the number of combinations in the view."""
+        return self.size
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        """Iterates over the viewed combinations in order."""
+        return (self.combinations[position] for position in self.positions)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[int, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[tuple[int, ...]]: ...
+
+    def __getitem__(self, index: int | slice) -> tuple[int, ...] | Sequence[tuple[int, ...]]:
+        """Returns the combination at the given index of the view, or a narrower view for a slice."""
+        if isinstance(index, slice):
+            return CombinationView(self.combinations, self.positions[index])
+        return self.combinations[self.positions[index]]
+
+
+def get_combination_indices(sizes: Sequence[int], strategy: str = PRODUCT) -> Sequence[tuple[int, ...]]:
+    """Returns the index combinations chosen by the strategy for parameters with the given number of values."""
+    strength: int | None = parse_strategy(strategy)
+    if strength is None:
+        return ProductIndices(sizes)
+    if strength == 1:
+        return each_choice(sizes)
+    return covering_array(sizes, strength)
+
+
+def count_combinations(combinations: Sequence[tuple[int, ...]]) -> int:
+    """Returns the number of combinations, including products too large for len()."""
+    if isinstance(combinations, (ProductIndices, CombinationView)):
+        return combinations.size
+    return len(combinations)
+
+
+def min_combinations(sizes: Sequence[int], strategy: str = PRODUCT) -> int:
+    """Returns a lower bound on the number of combinations the strategy chooses, without generating any of them.
+
+    The bound is exact for the product, each-choice and covering arrays whose strength spans every parameter. Other
+    covering arrays of strength t have at least the product of the t largest sizes rows, since each value combination
+    of those parameters needs a row of its own.
+    """
+    strength: int | None = parse_strategy(strategy)
+    if not sizes:
+        return 1
+    if 0 in sizes:
+        return 0
+    if strength is None or strength >= len(sizes):
+        return math.prod(sizes)
+    if strength == 1:
+        return max(sizes)
+    return math.prod(sorted(sizes, reverse=True)[:strength])
+
+
+def parse_shard(shard: str) -> tuple[int, int]:
+    """Parses a 1-based "i/n" shard into a 0-based shard index and the shard count."""
+    index, _, count = shard.partition("/")
+    try:
+        shard_index, shard_count = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"Expected a shard formatted as i/n. Got {shard!r}") from None
+    if not 1 <= shard_index <= shard_count:
+        raise ValueError(f"Expected a shard i/n with 1 <= i <= n. Got {shard!r}")
+    return shard_index - 1, shard_count
+
+
+def shard_combinations(
+    combinations: Sequence[tuple[int, ...]], shard_index: int, shard_count: int
+) -> Sequence[tuple[int, ...]]:
+    """Returns only the combinations whose position modulo shard_count is shard_index, without building the rest."""
+    return combinations[shard_index::shard_count]
+
+
+def sample_combinations(
+    combinations: Sequence[tuple[int, ...]], max_cases: int, seed: int | None = None
+) -> Sequence[tuple[int, ...]]:
+    """Returns a reproducible uniform sample of at most max_cases combinations, kept in their original order.
+
+    Only the sampled positions are decoded, so the combinations never have to be enumerated.
+    """
+    total: int = count_combinations(combinations)
+    if max_cases >= total:
+        return combinations
+    return [combinations[position] for position in sample_positions(total, max_cases, seed)]
+
+
+def sample_positions(total: int, k: int, seed: int | None = None) -> list[int]:
+    """Returns a reproducible, sorted uniform sample of at most k positions out of range(total)."""
+    if k < 0:
+        raise ValueError(f"max_cases must be non-negative. Got {k}")
+    if k >= total:
+        return list(range(total))
+
+    rng: random.Random = random.Random(seed)  # noqa: S311
+    positions: Iterable[int]
+    if total <= sys.maxsize:
+        positions = rng.sample(range(total), k)
+    else:
+        chosen: set[int] = set()
+        while len(chosen) < k:
+            chosen.add(rng.randrange(total))
+        positions = chosen
+    return sorted(positions)
+
+
+def each_choice(sizes: Sequence[int]) -> list[tuple[int, ...]]:
+    """Returns the fewest rows in which every value of every parameter appears at least once."""
+    if not sizes:
+        return [()]
+    if 0 in sizes:
+        return []
+    return [tuple(row % size for size in sizes) for row in range(max(sizes))]
+
+
+def covering_array(sizes: Sequence[int], strength: int) -> Sequence[tuple[int, ...]]:
+    """Returns rows covering every value combination of any `strength` parameters, built with IPOG.
+
+    IPOG starts from the full product of the first `strength` parameters and then adds one parameter at a time,
+    first choosing its value in each existing row to cover as many new interactions as possible (horizontal growth)
+    and then adding rows for whatever is still uncovered (vertical growth). Strength 1 is left to each_choice, and
+    a strength spanning every parameter returns a lazy ProductIndices.
+    """
+    if strength < 1:
+        raise ValueError(f"Covering array strength must be at least 1. Got {strength}")
+    if strength == 1:
+        return each_choice(sizes)
+    if 0 in sizes:
+        return []
+    if strength >= len(sizes):
+        return ProductIndices(sizes)
+
+    # Placing the largest domains first keeps both the initial product and the vertical growth small.
+    order: list[int] = sorted(range(len(sizes)), key=lambda parameter: -sizes[parameter])
+    ordered_sizes: list[int] = [sizes[parameter] for parameter in order]
+
+    rows: list[_Row] = [list(row) for row in itertools.product(*map(range, ordered_sizes[:strength]))]
+    for column in range(strength, len(ordered_sizes)):
+        uncovered: _Interactions = _get_interactions(ordered_sizes, column, strength)
+        _grow_horizontally(rows, ordered_sizes[column], uncovered)
+        _grow_vertically(rows, column, uncovered)
+
+    results: list[tuple[int, ...]] = []
+    for row_number, row in enumerate(rows):
+        filled: list[int] = [
+            row_number % ordered_sizes[column] if value is None else value for column, value in enumerate(row)
+        ]
+        original: list[int] = [0] * len(sizes)
+        for column, parameter in enumerate(order):
+            original[parameter] = filled[column]
+        results.append(tuple(original))
+    return results
+
+
+def _get_interactions(sizes: Sequence[int], column: int, strength: int) -> _Interactions:
+    """Returns a bitmask of the uncovered values of column for each value combination of earlier columns.
+
+    Combinations are keyed the way operator.itemgetter returns them, so single columns use plain values.
+    """
+    values: int = (1 << sizes[column]) - 1
+    interactions: _Interactions = {}
+    for columns in itertools.combinations(range(column), strength - 1):
+        keys: Iterable[Any] = range(sizes[columns[0]])
+        if len(columns) > 1:
+            keys = itertools.product(*(range(sizes[c]) for c in columns))
+        interactions[columns] = dict.fromkeys(keys, values)
+    return interactions
+
+
+def _grow_horizontally(rows: list[_Row], size: int, uncovered: _Interactions) -> None:
+    remaining: dict[tuple[int, ...], int] = {
+        columns: size * len(combinations) for columns, combinations in uncovered.items()
+    }
+    getters: dict[tuple[int, ...], Callable[[_Row], Any]] = {columns: itemgetter(*columns) for columns in uncovered}
+
+    for row_number, row in enumerate(rows):
+        if not remaining:
+            row.append(row_number % size)
+            continue
+
+        pending: list[tuple[tuple[int, ...], Any]] = []
+        masks: list[int] = []
+        for columns in remaining:
+            combination: Any = getters[columns](row)
+            mask: int = uncovered[columns].get(combination, 0)
+            if mask:
+                masks.append(mask)
+                pending.append((columns, combination))
+
+        value: int = _most_common_bit(masks, size, preferred=row_number % size)
+        row.append(value)
+
+        bit: int = 1 << value
+        for columns, combination in pending:
+            combinations: dict[Any, int] = uncovered[columns]
+            if combinations[combination] & bit:
+                combinations[combination] ^= bit
+                remaining[columns] -= 1
+                if not remaining[columns]:
+                    del remaining[columns]
+
+
+def _most_common_bit(masks: Sequence[int], size: int, preferred: int) -> int:
+    """Returns the bit set in the most masks, breaking ties with the first candidate at or after preferred.
+
+    The masks are summed into a bit-sliced counter so each value's count is spread across the planes in binary,
+    which lets the values with the highest count be found by narrowing from the most significant plane down.
+    """
+    planes: list[int] = []
+    for mask in masks:
+        carry: int = mask
+        for index, plane in enumerate(planes):
+            planes[index] = plane ^ carry
+            carry &= plane
+            if not carry:
+                break
+        if carry:
+            planes.append(carry)
+
+    candidates: int = (1 << size) - 1
+    for plane in reversed(planes):
+        narrowed: int = candidates & plane
+        if narrowed:
+            candidates = narrowed
+
+    later: int = candidates >> preferred << preferred
+    chosen: int = later if later else candidates
+    return (chosen & -chosen).bit_length() - 1
+
+
+def _grow_vertically(rows: list[_Row], column: int, uncovered: _Interactions) -> None:
+    added: dict[int, list[_Row]] = {}
+    for columns, combinations in uncovered.items():
+        for key, remaining in combinations.items():
+            combination: tuple[int, ...] = key if len(columns) > 1 else (key,)
+            while remaining:
+                value: int = (remaining & -remaining).bit_length() - 1
+                remaining &= remaining - 1
+                _cover(rows, added, column, columns, combination, value)
+
+
+def _cover(
+    rows: list[_Row],
+    added: dict[int, list[_Row]],
+    column: int,
+    columns: tuple[int, ...],
+    combination: tuple[int, ...],
+    value: int,
+) -> None:
+    """Covers an interaction with a compatible row from this vertical growth, or a new row of don't-cares."""
+    for candidate in added.get(value, []):
+        if all(candidate[c] is None or candidate[c] == v for c, v in zip(columns, combination)):
+            for c, v in zip(columns, combination):
+                candidate[c] = v
+            return
+
+    row: _Row = [None] * (column + 1)
+    row[column] = value
+    for c, v in zip(columns, combination):
+        row[c] = v
+    rows.append(row)
+    added.setdefault(value, []).append(row)
@@ -1,6 +1,10 @@
 """Module containing custom types used throughout pytest-static."""
 
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
 from collections.abc import Generator
+from collections.abc import Iterable
 from typing import Any
 from typing import Callable
 from typing import TypeVar
@@ -14,6 +18,10 @@ from typing_extensions import TypeAlias
 __all__: list[str] = [
     "KT",
     "VT",
+    "AnyTypeHandler",
+    "AsyncTypeHandler",
+    "InstanceCounter",
+    "InstanceSet",
     "P",
     "T",
     "T_co",
@@ -48,5 +56,36 @@ class Missing:
 MISSING: Missing = Missing()
 
 
+class InstanceSet(tuple[T_co, ...]):
+    """Immutable, insertion ordered collection of unique instances with constant time membership checks.
+
+    Unlike a frozenset, iteration order does not depend on PYTHONHASHSEED, so every process parametrizes the same
+    instances in the same order.
+    """
+
+    _members: frozenset[Any]
+
+    def __new__(cls, iterable: Iterable[T_co] = ()) -> InstanceSet[T_co]:
+        """Keeps the first occurrence of each instance in iteration order."""
+        unique: dict[T_co, None] = dict.fromkeys(iterable)
+        instance: InstanceSet[T_co] = super().__new__(cls, unique)
+        instance._members = frozenset(unique)
+        return instance
+
+    def __contains__(self, value: object) -> bool:
+        """Checks membership against a frozenset of the instances."""
+        try:
+            return value in self._members
+        except TypeError:
+            return False
+
+    def __repr__(self) -> str:
+        """Returns the instances wrapped in the class name."""
+        return f"{type(self).__name__}({tuple.__repr__(self)})"
+
+
 TypeHandler: TypeAlias = Callable[[Any, tuple[Any, ...]], Generator[Any, None, None]]
+AsyncTypeHandler: TypeAlias = Callable[[Any, tuple[Any, ...]], AsyncGenerator[Any, None]]
+AnyTypeHandler: TypeAlias = Union[TypeHandler, AsyncTypeHandler]
+InstanceCounter: TypeAlias = Callable[[Any, tuple[Any, ...]], int]
 TypeConstructor: TypeAlias = Callable[..., T]
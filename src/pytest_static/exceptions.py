@@ -0,0 +1,7 @@
+"""Module containing the warnings and exceptions raised by pytest-static."""
+
+import pytest
+
+
+class MaxCasesWarning(pytest.PytestWarning):
+    """Warning emitted when a parametrize_types marker generates more cases than --static-max-cases allows."""
@@ -0,0 +1,50 @@
+"""Module containing the plugin that stops running a parametrize_types family once enough of its cases failed."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from pytest_static.marks import MARKER_NAME
+
+
+FAIL_FAST_PLUGIN_NAME: str = "pytest-static-fail-fast-family"
+
+
+class FamilyFailFast:
+    """Skips the remaining cases of a parametrize_types family once max_failures of them have failed.
+
+    A family is every item generated from one test function by its parametrize_types markers. Failures count when
+    the setup or the call of an item fails, and the remaining items of the family are skipped before their fixtures
+    are set up.
+    """
+
+    def __init__(self, max_failures: int) -> None:
+        """Stores the number of failures after which a family is skipped."""
+        self.max_failures: int = max_failures
+        self.failures: Counter[str] = Counter()
+        self.families: dict[str, str] = {}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item: pytest.Item) -> None:
+        """Skips item when its family already failed max_failures times."""
+        family: str | None = get_family(item)
+        if family is None:
+            return
+        self.families[item.nodeid] = family
+        if self.failures[family] >= self.max_failures:
+            pytest.skip(f"{self.failures[family]} cases of {family} already failed (--static-fail-fast-family).")
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Counts the failed setups and calls of each family."""
+        family: str | None = self.families.get(report.nodeid)
+        if family is not None and report.failed and report.when != "teardown":
+            self.failures[family] += 1
+
+
+def get_family(item: pytest.Item) -> str | None:
+    """Returns the node id of the test function item was generated from by parametrize_types, or None otherwise."""
+    if item.get_closest_marker(MARKER_NAME) is None or not hasattr(item, "callspec"):
+        return None
+    return item.nodeid[: len(item.nodeid) - len(item.name)] + getattr(item, "originalname", item.name)
@@ -0,0 +1,30 @@
+"""Hook specifications added to pytest by the pytest-static plugin."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pluggy
+
+
+if TYPE_CHECKING:
+    from pytest_static.type_handler import TypeHandlerRegistry
+
+
+hookspec: pluggy.HookspecMarker = pluggy.HookspecMarker("pytest")
+
+
+@hookspec
+def pytest_static_register_handlers(registry: TypeHandlerRegistry) -> None:
+    """Registers additional type handlers before the first parametrize_types marker is expanded.
+
+    The type handlers are only imported once a parametrize_types marker is found, so plugins implementing this hook
+    do not slow down test suites that never use the marker. The hook is called once per session.
+
+    Example:
+        def pytest_static_register_handlers(registry):
+            registry.register(Money)(_iter_money_instances)
+
+    Args:
+        registry: The TypeHandlerRegistry used by parametrize_types.
+    """
@@ -0,0 +1,129 @@
+"""Module containing the generation of test ids for parametrize_types combinations."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+    from pathlib import Path
+
+
+REPR: str = "repr"
+COMPACT: str = "compact"
+ID_STYLES: tuple[str, ...] = (REPR, COMPACT)
+DEFAULT_ID_MAX_LENGTH: int = 40
+ID_CACHE_KEY: str = "pytest_static/ids"
+
+ID_DIGESTS_KEY: pytest.StashKey[dict[str, str]] = pytest.StashKey()
+
+
+class IdMaker:
+    """Builds combination ids from per-instance reprs that are computed at most once per instance.
+
+    With the compact style any repr longer than max_length is replaced by its type name and a short stable digest,
+    and the digest is recorded in digests so that the full repr can be looked up later. Arguments given a label in
+    labels are identified by the label and the instance index instead, like pytest's own ids, so that their instances
+    do not have to be built.
+    """
+
+    def __init__(
+        self,
+        parameter_sets: Sequence[Sequence[Any]],
+        style: str = REPR,
+        max_length: int = DEFAULT_ID_MAX_LENGTH,
+        labels: Sequence[str | None] = (),
+    ) -> None:
+        """Sets up an empty repr cache for each argument."""
+        if style not in ID_STYLES:
+            raise ValueError(f"Unknown id style {style!r}. Expected one of {', '.join(ID_STYLES)}.")
+        self.parameter_sets: Sequence[Sequence[Any]] = parameter_sets
+        self.style: str = style
+        self.max_length: int = max_length
+        self.labels: Sequence[str | None] = labels
+        self.digests: dict[str, str] = {}
+        self._value_ids: list[dict[int, str]] = [{} for _ in parameter_sets]
+
+    def get_id(self, combination: Sequence[int]) -> str:
+        """Returns the id of the combination of instance indices."""
+        return ", ".join(self.get_value_id(argument, index) for argument, index in enumerate(combination))
+
+    def get_value_id(self, argument: int, index: int) -> str:
+        """Returns the id of a single instance of the given argument."""
+        value_ids: dict[int, str] = self._value_ids[argument]
+        value_id: str | None = value_ids.get(index)
+        if value_id is None:
+            label: str | None = self.labels[argument] if argument < len(self.labels) else None
+            if label is not None:
+                value_id = value_ids[index] = f"{label}{index}"
+            else:
+                value_id = value_ids[index] = self._make_value_id(self.parameter_sets[argument][index])
+        return value_id
+
+    def _make_value_id(self, value: Any) -> str:
+        full_repr: str = stable_repr(value)
+        if self.style == REPR or len(full_repr) <= self.max_length:
+            return full_repr
+
+        compact_id: str = f"{type(value).__name__}-{make_digest(full_repr)}"
+        self.digests[compact_id] = full_repr
+        return compact_id
+
+
+def stable_repr(value: Any) -> str:
+    """Returns the repr of value with the elements of any set or frozenset in it sorted by their own stable repr.
+
+    The iteration order of sets of strings and bytes depends on PYTHONHASHSEED, so their plain repr would give a
+    different test id in every process. Lists, tuples, dicts, dataclasses, NamedTuples and attrs classes are recursed
+    into, and their repr rebuilt the way their default repr is, so that sets nested in them are sorted too.
+    """
+    if type(value) in (set, frozenset):
+        if not value:
+            return repr(value)
+        elements: str = ", ".join(sorted(map(stable_repr, value)))
+        return f"{{{elements}}}" if type(value) is set else f"frozenset({{{elements}}})"
+    if type(value) in (list, tuple):
+        items: list[str] = list(map(stable_repr, value))
+        if type(value) is list:
+            return f"[{', '.join(items)}]"
+        return f"({', '.join(items)}{',' if len(items) == 1 else ''})"
+    if type(value) is dict:
+        return f"{{{', '.join(f'{stable_repr(key)}: {stable_repr(item)}' for key, item in value.items())}}}"
+    fields: list[str] | None = _get_repr_fields(value)
+    if fields is not None:
+        arguments: str = ", ".join(f"{name}={stable_repr(getattr(value, name))}" for name in fields)
+        return f"{type(value).__qualname__}({arguments})"
+    return repr(value)
+
+
+def _get_repr_fields(value: Any) -> list[str] | None:
+    """Returns the names of the fields in the default repr of a dataclass, NamedTuple or attrs instance, if it is one."""
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return list(value._fields)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return [field.name for field in dataclasses.fields(value) if field.repr]
+    attributes: Any = getattr(type(value), "__attrs_attrs__", None)
+    if attributes is not None:
+        return [attribute.name for attribute in attributes if attribute.repr]
+    return None
+
+
+def make_digest(text: str) -> str:
+    """Returns a short digest of text that is stable across processes and machines."""
+    return hashlib.blake2b(text.encode("utf-8", "backslashreplace"), digest_size=6).hexdigest()
+
+
+def write_id_map(digests: Mapping[str, str], path: Path) -> None:
+    """Merges digests into the JSON mapping of compact ids to full reprs stored at path."""
+    existing: dict[str, str] = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    existing.update(digests)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(existing, indent=2, sort_keys=True, ensure_ascii=False), encoding="utf-8")
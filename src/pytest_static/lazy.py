@@ -0,0 +1,39 @@
+"""Module containing lightweight parameter references that are resolved when their argument is set up."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class LazyValue:
+    """Reference to an instance in a shared sequence, resolved when the test item using it is set up.
+
+    The sequence is usually a compiled Plan, in which case the instance is only constructed when it is resolved.
+    """
+
+    __slots__ = ("index", "instances")
+
+    def __init__(self, instances: Sequence[Any], index: int) -> None:
+        """Stores the shared instances and the index of the referenced instance."""
+        self.instances: Sequence[Any] = instances
+        self.index: int = index
+
+    def __repr__(self) -> str:
+        """Returns a short representation that does not materialize the referenced instance."""
+        return f"{type(self).__name__}(index={self.index})"
+
+    def resolve(self) -> Any:
+        """Returns the referenced instance."""
+        return self.instances[self.index]
+
+
+def resolve_lazy_param(request: Any) -> None:
+    """Replaces a LazyValue parameter of a fixture request with the instance it references."""
+    param: Any = getattr(request, "param", None)
+    if isinstance(param, LazyValue):
+        request.param = param.resolve()
@@ -0,0 +1,57 @@
+"""Module containing the lookup of parametrize_types markers without importing the type handlers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from _pytest.mark import Mark
+
+
+MARKER_NAME: str = "parametrize_types"
+
+
+def iter_marked_argtypes(namespace: Mapping[str, Any]) -> Iterator[Any]:
+    """Yields the argtypes of every eager parametrize_types marker applied in a module namespace or its classes.
+
+    Only classes defined in the module itself are searched, each once. Markers selecting their own profile are left
+    out, since they are expanded with different instance sets.
+    """
+    yield from _iter_namespace_argtypes(namespace, namespace.get("__name__"), set())
+
+
+def _iter_namespace_argtypes(namespace: Mapping[str, Any], module_name: str | None, seen: set[type]) -> Iterator[Any]:
+    for mark in _iter_marks(namespace.get("pytestmark", [])):
+        yield from _get_argtypes(mark)
+    for value in list(namespace.values()):
+        if isinstance(value, type):
+            if value.__module__ == module_name and value not in seen:
+                seen.add(value)
+                yield from _iter_namespace_argtypes(vars(value), module_name, seen)
+        elif callable(value):
+            for mark in _iter_marks(getattr(value, "pytestmark", [])):
+                yield from _get_argtypes(mark)
+
+
+def _iter_marks(marks: Any) -> Iterator[Mark]:
+    for mark in marks if isinstance(marks, list) else [marks]:
+        if (
+            getattr(mark, "name", None) == MARKER_NAME
+            and not mark.kwargs.get("lazy", False)
+            and mark.kwargs.get("profile") is None
+        ):
+            yield mark
+
+
+def _get_argtypes(mark: Mark) -> Iterable[Any]:
+    if "argtypes" in mark.kwargs:
+        return mark.kwargs["argtypes"]  # type: ignore[no-any-return]
+    if len(mark.args) > 1:
+        return mark.args[1]  # type: ignore[no-any-return]
+    return ()
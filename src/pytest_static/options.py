@@ -0,0 +1,229 @@
+"""Module containing the command line and ini options of the pytest-static plugin."""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pytest_static.combinations import parse_shard
+from pytest_static.ids import DEFAULT_ID_MAX_LENGTH
+from pytest_static.ids import ID_STYLES
+from pytest_static.orders import DECLARED
+from pytest_static.orders import ORDERS
+from pytest_static.profiles import PROFILE_NAMES
+from pytest_static.profiles import STANDARD
+from pytest_static.recursion import DEFAULT_MAX_DEPTH
+
+
+FAIL: str = "fail"
+WARN: str = "warn"
+MAX_CASES_ACTIONS: tuple[str, ...] = (FAIL, WARN)
+DEFAULT_ASYNC_CONCURRENCY: int = 16
+
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def add_options(parser: pytest.Parser) -> None:
+    """Adds every pytest-static command line and ini option to the parser."""
+    group: pytest.OptionGroup = parser.getgroup("static", "type based parametrization")
+    group.addoption(
+        "--static-seed",
+        dest="static_seed",
+        type=int,
+        default=None,
+        help="Seed for parametrize_types markers that sample with max_cases, overriding each marker's own seed.",
+    )
+    group.addoption(
+        "--static-ids",
+        dest="static_ids",
+        choices=ID_STYLES,
+        default=None,
+        help="Id style for parametrize_types markers without ids. 'compact' replaces long reprs with a digest. "
+        "Without a style, lazy markers identify containers and classes by index rather than building them for a repr.",
+    )
+    parser.addini("static_ids", help="Default for --static-ids.", default="")
+    group.addoption(
+        "--static-id-max-length",
+        dest="static_id_max_length",
+        type=int,
+        default=None,
+        help=f"Longest repr kept as is by compact ids (default: {DEFAULT_ID_MAX_LENGTH}).",
+    )
+    parser.addini("static_id_max_length", help="Default for --static-id-max-length.", default=DEFAULT_ID_MAX_LENGTH)
+    group.addoption(
+        "--static-id-map",
+        dest="static_id_map",
+        default=None,
+        help="JSON file mapping compact ids to full reprs. Defaults to the pytest cache.",
+    )
+    group.addoption(
+        "--static-max-cases",
+        dest="static_max_cases",
+        type=int,
+        default=None,
+        help="Largest number of cases a single parametrize_types marker may generate, checked before expansion.",
+    )
+    parser.addini("static_max_cases", help="Default for --static-max-cases.", default=None)
+    group.addoption(
+        "--static-max-cases-action",
+        dest="static_max_cases_action",
+        choices=MAX_CASES_ACTIONS,
+        default=None,
+        help="Whether a marker over --static-max-cases fails collection or only warns (default: fail).",
+    )
+    parser.addini("static_max_cases_action", help="Default for --static-max-cases-action.", default=FAIL)
+    group.addoption(
+        "--static-cache",
+        dest="static_cache",
+        action="store_true",
+        default=None,
+        help="Keep expanded parametrize_types tables in the pytest cache directory and reuse them in later sessions.",
+    )
+    parser.addini("static_cache", help="Default for --static-cache.", type="bool", default=False)
+    group.addoption(
+        "--static-cache-clear",
+        dest="static_cache_clear",
+        action="store_true",
+        default=False,
+        help="Remove the parametrize_types tables kept by --static-cache at the start of the session.",
+    )
+    group.addoption(
+        "--static-workers",
+        dest="static_workers",
+        type=_workers,
+        default=None,
+        metavar="N|auto",
+        help="Expand each module's parametrize_types annotations in N forked processes before parametrizing.",
+    )
+    parser.addini("static_workers", help="Default for --static-workers.", default=None)
+    group.addoption(
+        "--static-async-concurrency",
+        dest="static_async_concurrency",
+        type=int,
+        default=None,
+        help="Most async generator handlers run at once while collecting a module "
+        f"(default: {DEFAULT_ASYNC_CONCURRENCY}).",
+    )
+    parser.addini(
+        "static_async_concurrency", help="Default for --static-async-concurrency.", default=DEFAULT_ASYNC_CONCURRENCY
+    )
+    group.addoption(
+        "--static-max-depth",
+        dest="static_max_depth",
+        type=int,
+        default=None,
+        help=f"How many times a recursive type may be nested in itself when expanded (default: {DEFAULT_MAX_DEPTH}).",
+    )
+    parser.addini("static_max_depth", help="Default for --static-max-depth.", default=DEFAULT_MAX_DEPTH)
+    group.addoption(
+        "--static-collection-sizes",
+        dest="static_collection_sizes",
+        type=_collection_sizes,
+        default=None,
+        metavar="0,1,2,N",
+        help="Comma separated sizes of the list, set, frozenset, dict and variadic tuple instances to generate "
+        "(default: 1).",
+    )
+    parser.addini("static_collection_sizes", help="Default for --static-collection-sizes.", default=None)
+    group.addoption(
+        "--static-new-only",
+        dest="static_new_only",
+        action="store_true",
+        default=None,
+        help="Only generate the parametrize_types combinations that did not pass in an earlier --static-new-only "
+        "session with the same test and project source, and record which ones pass. Test functions with several "
+        "parametrize_types markers generate every combination.",
+    )
+    parser.addini("static_new_only", help="Default for --static-new-only.", type="bool", default=False)
+    group.addoption(
+        "--static-order",
+        dest="static_order",
+        choices=ORDERS,
+        default=None,
+        help="Order of the combinations of parametrize_types markers without an order. 'edge-first' generates "
+        "combinations of edge values such as 0, nan and empty strings first.",
+    )
+    parser.addini("static_order", help="Default for --static-order.", default=DECLARED)
+    group.addoption(
+        "--static-profile",
+        dest="static_profile",
+        choices=PROFILE_NAMES,
+        default=None,
+        help="Instance sets used for basic types by parametrize_types markers without a profile. 'smoke' keeps a few "
+        "values per type, 'exhaustive' adds more boundaries and unicode.",
+    )
+    parser.addini("static_profile", help="Default for --static-profile.", default=STANDARD)
+    group.addoption(
+        "--static-fail-fast-family",
+        dest="static_fail_fast_family",
+        type=int,
+        default=None,
+        metavar="K",
+        help="Skip the remaining cases of a parametrize_types test function once K of them have failed.",
+    )
+    parser.addini("static_fail_fast_family", help="Default for --static-fail-fast-family.", default=None)
+    group.addoption(
+        "--static-shard",
+        dest="static_shard",
+        type=_shard,
+        default=None,
+        metavar="i/n",
+        help="Only generate the parametrize_types combinations of shard i out of n (1-based).",
+    )
+
+
+def get_option(config: pytest.Config, name: str) -> Any:
+    """Returns the command line value of an option, falling back to its ini value when it has one."""
+    value: Any = config.getoption(name, default=None)
+    if value is not None:
+        return value
+    try:
+        return config.getini(name)
+    except ValueError:
+        return None
+
+
+def get_workers(config: pytest.Config) -> int:
+    """Returns the number of processes used to expand annotations, where 0 or 1 means no process pool."""
+    value: Any = get_option(config, "static_workers")
+    if value is None or value == "":
+        return 0
+    return _workers(str(value))
+
+
+def get_collection_sizes(config: pytest.Config) -> tuple[int, ...] | None:
+    """Returns the configured sizes of generated collections, or None to keep the registered handlers."""
+    value: Any = get_option(config, "static_collection_sizes")
+    if value is None or value == "":
+        return None
+    return value if isinstance(value, tuple) else _collection_sizes(str(value))
+
+
+def _collection_sizes(value: str) -> tuple[int, ...]:
+    try:
+        sizes: tuple[int, ...] = tuple(int(size) for size in value.split(","))
+    except ValueError:
+        sizes = ()
+    if not sizes or any(size < 0 for size in sizes):
+        raise argparse.ArgumentTypeError(f"Expected comma separated sizes of at least 0. Got {value!r}")
+    return sizes
+
+
+def _workers(value: str) -> int:
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected a number of workers or 'auto'. Got {value!r}") from None
+
+
+def _shard(value: str) -> tuple[int, int]:
+    try:
+        return parse_shard(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
@@ -0,0 +1,241 @@
+"""Module containing the orders in which the combinations of a parametrize_types marker can be generated."""
+
+from __future__ import annotations
+
+import bisect
+import cmath
+import itertools
+import math
+from collections.abc import Sequence
+from collections.abc import Sized
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import overload
+
+from pytest_static.combinations import CombinationView
+from pytest_static.combinations import ProductIndices
+from pytest_static.orders import ORDERS
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from pytest_static.plan import Plan
+
+
+_INT_BOUNDARIES: frozenset[int] = frozenset(
+    boundary for bits in (8, 16, 32, 64) for boundary in (2 ** (bits - 1) - 1, -(2 ** (bits - 1)))
+)
+
+
+def check_order(order: str) -> str:
+    """Returns order when it is a known order and raises a ValueError otherwise."""
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order {order!r}. Expected one of {', '.join(ORDERS)}.")
+    return order
+
+
+def is_edge_value(value: Any) -> bool:
+    """Returns whether value is an edge case that is likely to break code: a boundary, a special float, or empty.
+
+    Edges are None, 0 and the limits of signed 8 to 64 bit integers, zero, infinite and nan floats and complex
+    numbers, and empty strings, bytes and containers.
+    """
+    if value is None:
+        return True
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return value == 0 or value in _INT_BOUNDARIES
+    if isinstance(value, float):
+        return value == 0 or not math.isfinite(value)
+    if isinstance(value, complex):
+        return value == 0 or not cmath.isfinite(value)
+    if isinstance(value, Sized):
+        try:
+            return len(value) == 0
+        except TypeError:
+            return False
+    return False
+
+
+def edge_first_permutation(instances: Iterable[Any]) -> tuple[Sequence[int], int]:
+    """Returns the indices of the instances with edge values first, in declaration order, and the number of edges.
+
+    Plans are not iterated, so that lazy parametrization builds no container or class instance during collection. Only
+    their instances generated up front and the empty containers of collection plans are recognized as edges, and the
+    permutation is an EdgeFirstPermutation.
+    """
+    from pytest_static.plan import Plan
+
+    if isinstance(instances, Plan):
+        plan_edges: list[int] = list(_iter_plan_edges(instances))
+        return EdgeFirstPermutation(plan_edges, instances.size), len(plan_edges)
+    edges: list[int] = []
+    others: list[int] = []
+    for index, instance in enumerate(instances):
+        (edges if is_edge_value(instance) else others).append(index)
+    return edges + others, len(edges)
+
+
+def _iter_plan_edges(plan: Plan) -> Iterator[int]:
+    """Yields the indices of the edges of a plan found without building any instance, in ascending order."""
+    from pytest_static.plan import CollectionPlan
+    from pytest_static.plan import LeafPlan
+    from pytest_static.plan import SumPlan
+
+    if isinstance(plan, LeafPlan):
+        yield from (index for index, instance in enumerate(plan.instances) if is_edge_value(instance))
+    elif isinstance(plan, SumPlan):
+        for offset, summand in zip(plan.offsets, plan.plans):
+            yield from (offset + index for index in _iter_plan_edges(summand))
+    elif isinstance(plan, CollectionPlan) and 0 in plan.sizes:
+        yield plan.offsets[plan.sizes.index(0)]
+
+
+def order_edge_first(combinations: Sequence[tuple[int, ...]], edge_counts: Sequence[int]) -> Sequence[tuple[int, ...]]:
+    """Returns the combinations with those using the fewest non edge values first.
+
+    The first edge_counts[i] values of parameter i are expected to be its edges, see edge_first_permutation. Full
+    products are reordered lazily with EdgeFirstIndices, other combinations are sorted stably.
+    """
+    if type(combinations) is ProductIndices:
+        return EdgeFirstIndices(combinations.sizes, edge_counts)
+    return sorted(combinations, key=lambda combination: _count_non_edges(combination, edge_counts))
+
+
+def _count_non_edges(combination: tuple[int, ...], edge_counts: Sequence[int]) -> int:
+    return sum(index >= edge_count for index, edge_count in zip(combination, edge_counts))
+
+
+class EdgeFirstIndices(ProductIndices):
+    """Random access view over the cartesian product of ranges, with the combinations of edge values first.
+
+    The first edge_counts[i] values of parameter i are its edges. Combinations are grouped into blocks by which
+    parameters take a non edge value, blocks with fewer of them coming first, and each block follows
+    itertools.product ordering. All combinations of edge values therefore come before any other.
+
+    Blocks are never materialized: the blocks with the same number of non edge parameters form a group, whose size is
+    an elementary symmetric sum of the block factors, and a block is unranked within its group on access.
+    """
+
+    def __init__(self, sizes: Sequence[int], edge_counts: Sequence[int]) -> None:
+        """Stores the number of values of each parameter and counts the combinations of each group of blocks."""
+        super().__init__(sizes)
+        self.parts: list[list[range]] = [
+            [part for part in (range(min(edges, size)), range(min(edges, size), size)) if part]
+            for size, edges in zip(self.sizes, edge_counts)
+        ]
+        self.split: list[int] = [column for column, column_parts in enumerate(self.parts) if len(column_parts) == 2]
+        self.fixed_size: int = (
+            math.prod(len(column_parts[0]) for column_parts in self.parts if len(column_parts) == 1) if self.size else 0
+        )
+
+        # counts[i][m] is the number of ways to pick m non edge parameters from split[i:], weighted by their values.
+        self.counts: list[list[int]] = [[1]]
+        for column in reversed(self.split):
+            edge_part, non_edge_part = self.parts[column]
+            suffix: list[int] = self.counts[-1]
+            self.counts.append(
+                [
+                    len(edge_part) * edge_ways + len(non_edge_part) * non_edge_ways
+                    for edge_ways, non_edge_ways in zip([*suffix, 0], [0, *suffix])
+                ]
+            )
+        self.counts.reverse()
+        self.offsets: list[int] = list(
+            itertools.accumulate((self.fixed_size * ways for ways in self.counts[0]), initial=0)
+        )
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        """Iterates over every combination, block by block."""
+        if not self.size:
+            return iter(())
+        blocks: Iterator[tuple[range, ...]] = (
+            self._get_block(non_edges)
+            for count in range(len(self.split) + 1)
+            for non_edges in itertools.combinations(self.split, count)
+        )
+        return itertools.chain.from_iterable(itertools.product(*block) for block in blocks)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[int, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[tuple[int, ...]]: ...
+
+    def __getitem__(self, index: int | slice) -> tuple[int, ...] | Sequence[tuple[int, ...]]:
+        """Returns the combination at the given index, or a lazy view of the combinations in a slice."""
+        if isinstance(index, slice):
+            return CombinationView(self, range(self.size)[index])
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Combination index {index} out of range for {self.size} combinations.")
+
+        remaining: int = bisect.bisect_right(self.offsets, index) - 1
+        index -= self.offsets[remaining]
+        non_edges: list[int] = []
+        weight: int = self.fixed_size
+        for position, column in enumerate(self.split):
+            if not remaining:
+                break
+            edge_part, non_edge_part = self.parts[column]
+            chosen: int = weight * len(non_edge_part) * self.counts[position + 1][remaining - 1]
+            if index < chosen:
+                non_edges.append(column)
+                remaining -= 1
+                weight *= len(non_edge_part)
+            else:
+                index -= chosen
+                weight *= len(edge_part)
+
+        digits: list[int] = []
+        for part in reversed(self._get_block(non_edges)):
+            index, digit = divmod(index, len(part))
+            digits.append(part[digit])
+        return tuple(reversed(digits))
+
+    def _get_block(self, non_edges: Sequence[int]) -> tuple[range, ...]:
+        return tuple(column_parts[column in non_edges] for column, column_parts in enumerate(self.parts))
+
+
+class EdgeFirstPermutation(Sequence[int]):
+    """Random access view over the indices of a sequence with the given edges first, followed by the other indices.
+
+    The edges are expected in ascending order. The other indices are found by skipping over the edges on access, so
+    the view takes no more memory than its edges.
+    """
+
+    def __init__(self, edges: Sequence[int], size: int) -> None:
+        """Stores the indices of the edges and the number of indices."""
+        self.edges: tuple[int, ...] = tuple(edges)
+        self.size: int = size
+
+    def __len__(self) -> int:
+        """Returns the number of indices."""
+        return self.size
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | Sequence[int]:
+        """Returns the index at the given position, or a list of the indices in a slice."""
+        if isinstance(index, slice):
+            return [self[position] for position in range(self.size)[index]]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Permutation index {index} out of range for {self.size} indices.")
+        if index < len(self.edges):
+            return self.edges[index]
+        index -= len(self.edges)
+        for edge in self.edges:
+            if edge > index:
+                break
+            index += 1
+        return index
@@ -0,0 +1,8 @@
+"""Module containing the names of the orders in which ordering can generate the combinations of a marker."""
+
+from __future__ import annotations
+
+
+DECLARED: str = "declared"
+EDGE_FIRST: str = "edge-first"
+ORDERS: tuple[str, ...] = (DECLARED, EDGE_FIRST)
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import collections.abc
 import itertools
+import math
+import operator
+import zlib
 from enum import Enum
+from enum import EnumMeta
+from enum import Flag
+from functools import lru_cache
 from functools import partial
+from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
@@ -14,39 +22,88 @@ from typing import Union
 from typing import get_args
 from typing import get_type_hints
 
+import pytest
 from typing_extensions import Literal
 from typing_extensions import is_protocol
-
+from typing_extensions import is_typeddict
+
+from pytest_static import __version__
+from pytest_static.combinations import PRODUCT
+from pytest_static.combinations import count_combinations
+from pytest_static.combinations import covering_array
+from pytest_static.combinations import get_combination_indices
+from pytest_static.combinations import min_combinations
+from pytest_static.combinations import parse_strategy
+from pytest_static.combinations import sample_combinations
+from pytest_static.combinations import shard_combinations
+from pytest_static.custom_typing import MISSING
+from pytest_static.exceptions import MaxCasesWarning
+from pytest_static.ids import DEFAULT_ID_MAX_LENGTH
+from pytest_static.ids import ID_DIGESTS_KEY
+from pytest_static.ids import REPR
+from pytest_static.ids import IdMaker
+from pytest_static.lazy import LazyValue
+from pytest_static.marks import MARKER_NAME
+from pytest_static.options import WARN
+from pytest_static.options import get_option
+from pytest_static.ordering import check_order
+from pytest_static.ordering import edge_first_permutation
+from pytest_static.ordering import order_edge_first
+from pytest_static.orders import DECLARED
+from pytest_static.orders import EDGE_FIRST
+from pytest_static.plan import CollectionPlan
+from pytest_static.plan import LeafPlan
+from pytest_static.plan import Plan
+from pytest_static.plan import ProductPlan
+from pytest_static.plan import SumPlan
+from pytest_static.plan import count_collections
+from pytest_static.results import COMBINATION_MARKER_NAME
+from pytest_static.results import RESULTS_KEY
+from pytest_static.results import make_combination_digest
+from pytest_static.structured import StructuredField
+from pytest_static.structured import construct_structured
+from pytest_static.structured import get_structured_fields
 from pytest_static.type_handler import TypeHandlerRegistry
-from pytest_static.type_sets import BOOL_PARAMS
-from pytest_static.type_sets import BYTES_PARAMS
-from pytest_static.type_sets import COMPLEX_PARAMS
 from pytest_static.type_sets import DEFAULT_INSTANCE_SETS
-from pytest_static.type_sets import FLOAT_PARAMS
-from pytest_static.type_sets import INT_PARAMS
-from pytest_static.type_sets import STR_PARAMS
+from pytest_static.type_sets import get_instance_sets_digest
+from pytest_static.util import UniqueInstances
+from pytest_static.util import copy_mutable_instances
+from pytest_static.util import describe_callable
 from pytest_static.util import get_base_type
+from pytest_static.util import iter_handler_results
+from pytest_static.util import iter_unique_instances
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+    from collections.abc import Container
     from collections.abc import Generator
     from collections.abc import Iterable
     from collections.abc import Sequence
 
     from _pytest.mark import Mark
+    from _pytest.mark import MarkDecorator
     from _pytest.python import Metafunc
 
-    from pytest_static.custom_typing import KT
-    from pytest_static.custom_typing import VT
+    from pytest_static.custom_typing import AnyTypeHandler
+    from pytest_static.custom_typing import InstanceCounter
     from pytest_static.custom_typing import T
     from pytest_static.custom_typing import T_co
     from pytest_static.custom_typing import TypeConstructor
-    from pytest_static.custom_typing import TypeHandler
     from pytest_static.custom_typing import _ScopeName
+    from pytest_static.recursion import RecursionGuard
+    from pytest_static.results import CombinationResults
+    from pytest_static.store import ParameterStore
 
 
 type_handlers: TypeHandlerRegistry = TypeHandlerRegistry()
 
+DEFAULT_COLLECTION_SIZES: tuple[int, ...] = (1,)
+
+_UNDESCRIBED_MODULES: frozenset[str] = frozenset(
+    ("builtins", "typing", "typing_extensions", "collections", "collections.abc", "enum", "abc")
+)
+
 
 def parametrize_types(
     metafunc: Metafunc,
@@ -56,27 +113,248 @@ def parametrize_types(
     ids: Iterable[object | None] | Callable[[Any], object | None] | None = None,
     scope: _ScopeName | None = None,
     *,
+    strategy: str = PRODUCT,
+    max_cases: int | None = None,
+    seed: int | None = None,
+    lazy: bool = False,
+    order: str | None = None,
+    profile: str | None = None,
     _param_mark: Mark | None = None,
 ) -> None:
-    """Pytest marker emulating pytest parametrize but using types to specify sets."""
+    """Pytest marker emulating pytest parametrize but using types to specify sets.
+
+    Args:
+        metafunc: The Metafunc of the test function being parametrized.
+        argnames: The names of the parametrized arguments.
+        argtypes: The type of each argument, whose instances are combined.
+        indirect: Passed on to metafunc.parametrize.
+        ids: Passed on to metafunc.parametrize. Defaults to the reprs of the instances.
+        scope: Passed on to metafunc.parametrize.
+        strategy: Which combinations to generate: "product", "pairwise", "t-wise(n)" or "each-choice".
+        max_cases: Generates a reproducible sample of at most max_cases combinations.
+        seed: Seed of the sample, overridden by --static-seed. Defaults to one derived from the test's node id.
+        lazy: Constructs each instance only when its argument is set up.
+        order: "declared" or "edge-first", taking precedence over --static-order.
+        profile: Instance set profile of the basic types, taking precedence over --static-profile.
+        _param_mark: Passed on to metafunc.parametrize.
+
+    Raises:
+        ValueError: If argnames and argtypes differ in length, or lazy is combined with indirect.
+    """
     argnames = _ensure_sequence(argnames)
     if len(argnames) != len(argtypes):
         raise ValueError("Parameter names and types count must match.")
-
-    parameter_sets: list[list[T]] = [list(get_all_possible_type_instances(t)) for t in argtypes]
-    parameter_combinations: list[tuple[T, ...]] = list(itertools.product(*parameter_sets))
-
-    if ids is None:
-        ids = [", ".join(map(repr, pairs)) for pairs in parameter_combinations]
-
-    metafunc.parametrize(
-        argnames=argnames,
-        argvalues=parameter_combinations,
-        indirect=indirect,
-        ids=ids,
-        scope=scope,
-        _param_mark=_param_mark,
+    if lazy and indirect:
+        raise ValueError("Lazy parametrization cannot be combined with indirect parametrization.")
+
+    with type_handlers.using_profile(profile):
+        parameter_sets: list[Sequence[Any]]
+        sizes: list[int]
+        if lazy:
+            plans: list[Plan] = [compile_type(t) for t in argtypes]
+            parameter_sets, sizes = list(plans), [plan.size for plan in plans]
+        else:
+            parameter_sets = [copy_mutable_instances(get_all_possible_type_instances(t)) for t in argtypes]
+            sizes = [len(s) for s in parameter_sets]
+        combinations: Sequence[tuple[int, ...]] = _get_combination_indices(sizes, strategy)
+        permutations: list[Sequence[int]] | None = None
+        if check_order(order or get_option(metafunc.config, "static_order") or DECLARED) == EDGE_FIRST:
+            orderings: list[tuple[Sequence[int], int]] = [edge_first_permutation(s) for s in parameter_sets]
+            permutations = [permutation for permutation, _ in orderings]
+            combinations = order_edge_first(combinations, [edge_count for _, edge_count in orderings])
+        if max_cases is not None:
+            combinations = sample_combinations(combinations, max_cases, seed=_get_seed(metafunc, seed))
+        shard: tuple[int, int] | None = get_option(metafunc.config, "static_shard")
+        if shard is not None:
+            combinations = shard_combinations(combinations, *shard)
+
+        if lazy and callable(ids):
+            ids = _resolve_before(ids)
+        id_maker: IdMaker | None = _get_id_maker(metafunc, parameter_sets, argnames) if ids is None else None
+        family: str | None = None
+        passed: set[str] = set()
+        results: CombinationResults | None = metafunc.config.stash.get(RESULTS_KEY, None)
+        if results is not None and len(list(metafunc.definition.iter_markers(MARKER_NAME))) == 1:
+            family = metafunc.definition.nodeid
+            source_hash: str = results.get_source_hash(
+                metafunc.function,
+                metafunc.module,
+                repr(argtypes),
+                type_handlers.fingerprint(),
+                str(type_handlers.recursion.max_depth),
+                get_instance_sets_digest(type_handlers.instance_sets),
+                __version__,
+            )
+            passed = results.start(family, source_hash)
+
+        metafunc.parametrize(
+            argnames=argnames,
+            argvalues=list(
+                _iter_parameter_sets(
+                    parameter_sets,
+                    combinations,
+                    id_maker,
+                    lazy=lazy,
+                    permutations=permutations,
+                    family=family,
+                    passed=passed,
+                )
+            ),
+            indirect=indirect,
+            ids=ids,
+            scope=scope,
+            _param_mark=_param_mark,
+        )
+
+
+def check_max_cases(
+    metafunc: Metafunc,
+    argnames: str | Sequence[str],
+    argtypes: list[type[T]],
+    *_: Any,
+    strategy: str = PRODUCT,
+    max_cases: int | None = None,
+    profile: str | None = None,
+    **__: Any,
+) -> None:
+    """Fails or warns when a marker would generate more cases than the static_max_cases option allows.
+
+    The number of instances is computed with count_instances, so no instances are built before the check. Markers
+    whose lower bound from min_combinations already exceeds the limit fail without building their covering array,
+    others are checked against the exact number of rows, and the array is cached for parametrize_types.
+    """
+    limit: int | str | None = get_option(metafunc.config, "static_max_cases")
+    if limit is None or limit == "":
+        return
+
+    with type_handlers.using_profile(profile):
+        sizes: list[int] = [count_instances(t) for t in argtypes]
+    shard: tuple[int, int] | None = get_option(metafunc.config, "static_shard")
+    cases: int = _count_cases(min_combinations(sizes, strategy), max_cases, shard)
+    bound: str = ""
+    if 1 < (parse_strategy(strategy) or 1) < len(sizes):
+        if cases > int(limit):
+            bound = "at least "
+        else:
+            cases = _count_cases(count_combinations(_get_combination_indices(sizes, strategy)), max_cases, shard)
+    if cases <= int(limit):
+        return
+
+    argument_sizes: str = ", ".join(f"{name}={size}" for name, size in zip(_ensure_sequence(argnames), sizes))
+    message: str = (
+        f"{metafunc.definition.nodeid} would generate {bound}{cases} parametrize_types cases, more than the"
+        f" --static-max-cases limit of {limit}. Instances per argument: {argument_sizes}"
     )
+    if get_option(metafunc.config, "static_max_cases_action") == WARN:
+        metafunc.definition.warn(MaxCasesWarning(message))
+    else:
+        pytest.fail(message, pytrace=False)
+
+
+def _count_cases(combinations: int, max_cases: int | None, shard: tuple[int, int] | None) -> int:
+    """Returns how many of a number of combinations are left after sampling max_cases and sharding."""
+    if max_cases is not None:
+        combinations = min(combinations, max_cases)
+    if shard is not None:
+        combinations = len(range(shard[0], combinations, shard[1]))
+    return combinations
+
+
+def _get_combination_indices(sizes: list[int], strategy: str) -> Sequence[tuple[int, ...]]:
+    """Returns the strategy's combinations, loading covering arrays from the registry's ParameterStore if any.
+
+    Covering arrays are also kept for the session, so the one built by check_max_cases is reused.
+    """
+    store: ParameterStore | None = type_handlers.store
+    strength: int | None = parse_strategy(strategy)
+    if strength is None:
+        return get_combination_indices(sizes, strategy)
+    if store is None:
+        return _build_covering_array(tuple(sizes), strength)
+
+    store_key: tuple[Any, ...] = ("combinations", tuple(sizes), strength)
+    combinations: Sequence[tuple[int, ...]] | None = store.get(store_key)
+    if combinations is None:
+        combinations = _build_covering_array(tuple(sizes), strength)
+        store.set(store_key, combinations)
+    return combinations
+
+
+@lru_cache(maxsize=64)
+def _build_covering_array(sizes: tuple[int, ...], strength: int) -> Sequence[tuple[int, ...]]:
+    return covering_array(sizes, strength)
+
+
+def _iter_parameter_sets(
+    parameter_sets: Sequence[Sequence[Any]],
+    combinations: Iterable[tuple[int, ...]],
+    id_maker: IdMaker | None,
+    lazy: bool = False,
+    permutations: Sequence[Sequence[int]] | None = None,
+    family: str | None = None,
+    passed: Container[str] = (),
+) -> Generator[Any]:
+    """Yields the argvalues for each combination of indices, with an id when an IdMaker is provided.
+
+    When permutations are provided, the i-th index of a combination is a position in permutations[i]. When a family
+    is provided, combinations whose digest is in passed are left out before their values are built, and the others
+    are marked with their digest so that CombinationResults can record whether they pass.
+    """
+    for combination in combinations:
+        if permutations is not None:
+            combination = tuple(permutation[index] for permutation, index in zip(permutations, combination))
+        marks: tuple[MarkDecorator, ...] = ()
+        if family is not None:
+            digest: str = make_combination_digest(combination)
+            if digest in passed:
+                continue
+            marks = (getattr(pytest.mark, COMBINATION_MARKER_NAME)(family, digest),)
+        values: tuple[Any, ...] = tuple(
+            LazyValue(parameter_sets[i], index) if lazy else parameter_sets[i][index]
+            for i, index in enumerate(combination)
+        )
+        if id_maker is None and not marks:
+            yield values
+        else:
+            yield pytest.param(*values, id=id_maker.get_id(combination) if id_maker else None, marks=marks)
+
+
+def _get_id_maker(metafunc: Metafunc, parameter_sets: Sequence[Sequence[Any]], argnames: Sequence[str]) -> IdMaker:
+    """Returns an IdMaker configured by the plugin options that records its digests for the session.
+
+    Without a configured style, the lazy plans whose instances are not generated up front are identified by their
+    argument name and index instead, since a repr would build every container and class instance during collection.
+    """
+    style: str | None = get_option(metafunc.config, "static_ids") or None
+    max_length: int = int(get_option(metafunc.config, "static_id_max_length") or DEFAULT_ID_MAX_LENGTH)
+    labels: list[str | None] = []
+    if style is None:
+        labels = [
+            name if isinstance(plan, Plan) and not _is_generated_up_front(plan) else None
+            for name, plan in zip(argnames, parameter_sets)
+        ]
+    id_maker: IdMaker = IdMaker(parameter_sets, style=style or REPR, max_length=max_length, labels=labels)
+    id_maker.digests = metafunc.config.stash.setdefault(ID_DIGESTS_KEY, {})
+    return id_maker
+
+
+def _get_seed(metafunc: Metafunc, seed: int | None) -> int:
+    """Returns the sampling seed, preferring the command line over the marker and a node id based default."""
+    override: int | None = metafunc.config.getoption("static_seed", default=None)
+    if override is not None:
+        return override
+    if seed is not None:
+        return seed
+    return zlib.crc32(metafunc.definition.nodeid.encode())
+
+
+def _resolve_before(ids: Callable[[Any], object | None]) -> Callable[[Any], object | None]:
+    """Wraps an ids callable so that it receives resolved instances instead of LazyValues."""
+
+    def wrapper(value: Any) -> object | None:
+        return ids(value.resolve() if isinstance(value, LazyValue) else value)
+
+    return wrapper
 
 
 def _ensure_sequence(value: str | Sequence[str]) -> Sequence[str]:
@@ -85,9 +363,96 @@ def _ensure_sequence(value: str | Sequence[str]) -> Sequence[str]:
     return value
 
 
-def get_all_possible_type_instances(type_argument: Any) -> tuple[Any, ...]:
-    """Gets all possible instances for the given type."""
-    return tuple(iter_instances(type_argument))
+def get_all_possible_type_instances(
+    type_argument: Any, handler_registry: TypeHandlerRegistry = type_handlers
+) -> tuple[Any, ...]:
+    """Gets all possible instances for the given type, reusing previously resolved results.
+
+    When the registry has a ParameterStore, results are also loaded from and saved to it across sessions. Recursive
+    types are expanded to the registry's maximum depth, see RecursionGuard, and are only cached for the session.
+    The returned instances are shared with later calls, so parametrize_types hands out copies of the mutable ones.
+    """
+    recursion: RecursionGuard = handler_registry.recursion
+    type_argument = recursion.resolve(type_argument)
+    key: Any = recursion.normalize(type_argument)
+    if recursion.is_cacheable(key):
+        cached: Any = handler_registry.instance_cache.get(key, MISSING)
+        if cached is not MISSING:
+            return cached  # type: ignore[no-any-return]
+
+    store: ParameterStore | None = handler_registry.store if key not in recursion.recursive_keys else None
+    store_key: tuple[Any, ...] = ()
+    if store is not None:
+        definitions: tuple[str, ...] = _describe_definitions(type_argument, handler_registry)
+        store_key = ("instances", key, handler_registry.fingerprint(), definitions)
+    instances: tuple[Any, ...] | None = store.get(store_key) if store is not None else None
+    if instances is None:
+        instances = recursion.expand(
+            "instances", key, lambda: tuple(iter_instances(type_argument, handler_registry)), ()
+        )
+        if store is not None and key not in recursion.recursive_keys:
+            store.set(store_key, instances)
+    if recursion.is_cacheable(key):
+        handler_registry.instance_cache.set(key, instances)
+    return instances
+
+
+def _describe_definitions(annotation: Any, handler_registry: TypeHandlerRegistry) -> tuple[str, ...]:
+    """Returns descriptions of the user classes and TypeVars an annotation refers to, directly or through fields.
+
+    Classes are described by the name and source of each class in their MRO and by their constructor fields, and
+    TypeVars by their module, constraints and bound. Persisted instances are keyed by these descriptions, since the
+    repr of an annotation does not change when the classes it refers to are redefined.
+    """
+    descriptions: list[str] = []
+    seen: set[int] = set()
+    pending: list[Any] = [annotation]
+    while pending:
+        current: Any = handler_registry.recursion.resolve(pending.pop())
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, list):
+            pending.extend(current)
+            continue
+        base_type: Any = get_base_type(current)
+        if base_type is not Literal:
+            pending.extend(arg for arg in get_args(current) if arg is not Ellipsis)
+        if isinstance(base_type, TypeVar):
+            descriptions.append(_describe_type_var(base_type))
+            pending.extend(_get_type_var_options(base_type))
+        elif isinstance(base_type, type) and base_type.__module__ not in _UNDESCRIBED_MODULES:
+            descriptions.extend(_describe_class(base_type))
+            pending.extend(_get_constructor_argument_types(base_type, handler_registry))
+    return tuple(descriptions)
+
+
+def _describe_type_var(type_var: Any) -> str:
+    module: str | None = getattr(type_var, "__module__", None)
+    return f"{module}.{type_var!r}: {type_var.__constraints__!r}, {type_var.__bound__!r}"
+
+
+@lru_cache(maxsize=None)
+def _describe_class(cls: Any) -> tuple[str, ...]:
+    """Returns a description of the source of each user class in the MRO of cls and of its fields."""
+    descriptions: list[str] = [
+        describe_callable(base) for base in cls.__mro__ if base.__module__ not in _UNDESCRIBED_MODULES
+    ]
+    descriptions.append(repr(get_structured_fields(cls)))
+    return tuple(descriptions)
+
+
+def _get_constructor_argument_types(cls: Any, handler_registry: TypeHandlerRegistry) -> tuple[Any, ...]:
+    """Returns the types of the fields or arguments the fallback methods build a class from, if they are used."""
+    fields: tuple[StructuredField, ...] | None = get_structured_fields(cls)
+    if fields is not None:
+        return tuple(field.type for field in fields)
+    if handler_registry.get(cls, None) is not None:
+        return ()
+    try:
+        return _get_callable_argument_types(cls)
+    except Exception:  # noqa: BLE001
+        return ()
 
 
 def iter_instances(key: Any, handler_registry: TypeHandlerRegistry = type_handlers) -> Generator[Any]:
@@ -95,17 +460,210 @@ def iter_instances(key: Any, handler_registry: TypeHandlerRegistry = type_handle
     base_type: Any = get_base_type(key)
     type_args: tuple[Any, ...] = get_args(key)
 
-    fallback_handlers: Iterable[TypeHandler] = [_iter_instances_using_fallback]
-    handlers: Iterable[TypeHandler] = handler_registry.get(base_type, fallback_handlers)
+    fallback_handlers: Iterable[AnyTypeHandler] = [_iter_instances_using_fallback]
+    handlers: Iterable[AnyTypeHandler] = handler_registry.get(base_type, fallback_handlers)
 
     for handler in handlers:
-        yield from handler(base_type, type_args)
+        yield from iter_handler_results(handler(base_type, type_args))
+
+
+def count_instances(key: Any, handler_registry: TypeHandlerRegistry = type_handlers) -> int:
+    """Returns how many instances iter_instances would yield for key, computed from the type's structure.
+
+    Sums are used for Union, Optional, and TypeVar constraints, products for tuple and callable constructors, size
+    classes for collections, and set sizes for leaf types. A type whose handler was registered without a counter is
+    fully expanded, and cached, to count its instances unless they are cached already.
+    """
+    recursion: RecursionGuard = handler_registry.recursion
+    key = recursion.resolve(key)
+    normalized: Any = recursion.normalize(key)
+    if recursion.is_cacheable(normalized):
+        cached: Any = handler_registry.instance_cache.get(normalized, MISSING)
+        if cached is not MISSING:
+            return len(cached)
+    handlers: list[AnyTypeHandler] | None = handler_registry.get(get_base_type(key), None)
+    if handlers is None:
+        return recursion.expand("count", normalized, partial(_count_instances_using_fallback, get_base_type(key)), 0)
+    counters: list[InstanceCounter] = [
+        counter for counter in map(handler_registry.get_counter, handlers) if counter is not None
+    ]
+    if len(counters) < len(handlers):
+        # Expanded outside of a count frame, which would otherwise mark key as recursive and keep it from the cache.
+        return len(get_all_possible_type_instances(key, handler_registry))
+    return recursion.expand("count", normalized, partial(_count_instances, key, counters), 0)
+
+
+def _count_instances(key: Any, counters: list[InstanceCounter]) -> int:
+    return sum(counter(get_base_type(key), get_args(key)) for counter in counters)
+
+
+def _count_instances_using_fallback(base_type: Any) -> int:
+    """Returns the number of instances the fallback methods would yield for the given base_type."""
+    if isinstance(base_type, TypeVar):
+        return _count_sum_instances(base_type, _get_type_var_options(base_type))
+    if get_structured_fields(base_type) is not None:
+        return count_structured_instances(base_type, ())
+    if is_protocol(base_type):
+        raise NotImplementedError
+    if callable(base_type):
+        return _count_product_instances(base_type, _get_callable_argument_types(base_type))
+    raise TypeError(f"Failed to find a fallback method for counting {base_type=}.")
+
+
+def _count_sum_instances(_: Any, type_args: tuple[Any, ...]) -> int:
+    positions: frozenset[int] = _get_deduplicated_positions(type_args, type_handlers)
+    unique: UniqueInstances = UniqueInstances()
+    return sum(
+        sum(map(unique.add, compile_type(arg))) if position in positions else count_instances(arg)
+        for position, arg in enumerate(type_args)
+    )
+
+
+def _count_product_instances(_: Any, type_args: tuple[Any, ...]) -> int:
+    return math.prod(count_instances(arg) for arg in type_args if arg is not Ellipsis)
+
+
+def _count_fixed_instances(instances: Collection[Any]) -> InstanceCounter:
+    return lambda *_: len(instances)
+
+
+def _count_profile_instances(typ: Any) -> InstanceCounter:
+    return lambda *_: len(type_handlers.instance_sets[typ])
+
+
+def compile_type(key: Any, handler_registry: TypeHandlerRegistry = type_handlers) -> Plan:
+    """Compiles the instances of a type into a reusable Plan supporting len, iteration, nth, slicing and sample.
+
+    Sum and product handlers become plans over the plans of their type arguments, so an instance can be built from
+    its index alone. Any other handler is run once and its instances are stored. Plans are cached on the registry.
+    """
+    recursion: RecursionGuard = handler_registry.recursion
+    key = recursion.resolve(key)
+    normalized: Any = recursion.normalize(key)
+    if recursion.is_cacheable(normalized):
+        cached: Plan | None = handler_registry.plan_cache.get(normalized)
+        if cached is not None:
+            return cached
+
+    empty: Plan = LeafPlan(())
+    plan: Plan = recursion.expand("plan", normalized, partial(_compile_type, key, handler_registry), empty)
+    if recursion.is_cacheable(normalized):
+        handler_registry.plan_cache.set(normalized, plan)
+    return plan
+
+
+def _compile_type(key: Any, handler_registry: TypeHandlerRegistry) -> Plan:
+    base_type: Any = get_base_type(key)
+    type_args: tuple[Any, ...] = get_args(key)
+    handlers: Iterable[AnyTypeHandler] | None = handler_registry.get(base_type, None)
+    if handlers is None:
+        return _compile_using_fallback(base_type, handler_registry)
+    if not any(map(_has_structural_plan, handlers)) and not all(h in _LEAF_HANDLER_TYPES for h in handlers):
+        # Custom handlers may be slow or async, so they share their results with get_all_possible_type_instances.
+        return LeafPlan(_get_leaf_instances(key, handler_registry))
+    plans: list[Plan] = [_compile_handler(h, base_type, type_args, handler_registry) for h in handlers]
+    return plans[0] if len(plans) == 1 else SumPlan(plans)
+
+
+def _has_structural_plan(handler: AnyTypeHandler) -> bool:
+    """Returns whether _compile_handler builds the handler's plan from the plans of its type arguments."""
+    if handler in (_iter_sum_instances, _iter_any_instances):
+        return True
+    return isinstance(handler, partial) and handler.func in (
+        _iter_product_instances_with_constructor,
+        iter_collection_instances,
+        _iter_tuple_instances,
+    )
+
+
+def _get_leaf_instances(key: Any, handler_registry: TypeHandlerRegistry) -> tuple[Any, ...]:
+    """Returns the instances of a type whose handlers are all run up front, sharing them with the instance cache.
+
+    Handlers are therefore run once whether the type is compiled or expanded first, including by prefetching.
+    """
+    normalized: Any = handler_registry.recursion.normalize(key)
+    if handler_registry.recursion.is_cacheable(normalized):
+        cached: Any = handler_registry.instance_cache.get(normalized, MISSING)
+        if cached is not MISSING:
+            return cached  # type: ignore[no-any-return]
+    instances: tuple[Any, ...] = tuple(iter_instances(key, handler_registry))
+    if handler_registry.recursion.is_cacheable(normalized):
+        handler_registry.instance_cache.set(normalized, instances)
+    return instances
+
+
+def _compile_handler(
+    handler: AnyTypeHandler, base_type: Any, type_args: tuple[Any, ...], handler_registry: TypeHandlerRegistry
+) -> Plan:
+    """Returns the plan equivalent to running the handler with base_type and type_args."""
+    if handler is _iter_sum_instances:
+        return _compile_sum(type_args, handler_registry)
+    if handler is _iter_any_instances:
+        return _compile_sum(tuple(DEFAULT_INSTANCE_SETS), handler_registry)
+    if isinstance(handler, partial) and handler.func is _iter_product_instances_with_constructor:
+        return _compile_product(type_args, handler.keywords["type_constructor"], handler_registry)
+    if isinstance(handler, partial) and handler.func is iter_collection_instances:
+        return _compile_collection(base_type, type_args, handler_registry, **handler.keywords)
+    if isinstance(handler, partial) and handler.func is _iter_tuple_instances:
+        if _is_variadic(type_args):
+            return _compile_collection(
+                base_type,
+                type_args[:1],
+                handler_registry,
+                type_constructor=_variadic_tuple_constructor,
+                **handler.keywords,
+            )
+        return _compile_product(type_args, _tuple_constructor, handler_registry)
+    return LeafPlan(tuple(iter_handler_results(handler(base_type, type_args))))
+
+
+def _compile_using_fallback(base_type: Any, handler_registry: TypeHandlerRegistry) -> Plan:
+    """Returns the plan equivalent to the fallback methods for the given base_type."""
+    if isinstance(base_type, TypeVar):
+        return _compile_sum(_get_type_var_options(base_type), handler_registry)
+    fields: tuple[StructuredField, ...] | None = get_structured_fields(base_type)
+    if fields is not None:
+        constructor: partial[Any] = partial(construct_structured, base_type, tuple(field.name for field in fields))
+        return _compile_product(tuple(field.type for field in fields), constructor, handler_registry)
+    if is_protocol(base_type):
+        raise NotImplementedError
+    if callable(base_type):
+        return _compile_product(_get_callable_argument_types(base_type), base_type, handler_registry)
+    raise TypeError(f"Failed to find a fallback method for compiling {base_type=}.")
+
+
+def _compile_sum(type_args: tuple[Any, ...], handler_registry: TypeHandlerRegistry) -> SumPlan:
+    plans: list[Plan] = [compile_type(arg, handler_registry) for arg in type_args]
+    positions: frozenset[int] = _get_deduplicated_positions(type_args, handler_registry)
+    unique: UniqueInstances = UniqueInstances()
+    return SumPlan(
+        [
+            LeafPlan(list(filter(unique.add, plan))) if position in positions else plan
+            for position, plan in enumerate(plans)
+        ]
+    )
+
+
+def _compile_product(
+    type_args: tuple[Any, ...], type_constructor: TypeConstructor[Any], handler_registry: TypeHandlerRegistry
+) -> ProductPlan:
+    plans: list[Plan] = [compile_type(arg, handler_registry) for arg in type_args if arg is not Ellipsis]
+    return ProductPlan(plans, type_constructor)
+
+
+def _compile_collection(
+    base_type: Any, type_args: tuple[Any, ...], handler_registry: TypeHandlerRegistry, **kwargs: Any
+) -> CollectionPlan:
+    plans: list[Plan] = [compile_type(arg, handler_registry) for arg in _get_element_types(base_type, type_args)]
+    return _make_collection_plan(plans, **kwargs)
 
 
 def _iter_instances_using_fallback(base_type: Any, type_args: tuple[Any, ...]) -> Generator[Any]:
     """Returns a Generator that yields from default fallback methods for the given base_type and type_args."""
     if isinstance(base_type, TypeVar):
         yield from _iter_type_var_instances(base_type, type_args)
+    elif get_structured_fields(base_type) is not None:
+        yield from iter_structured_instances(base_type, type_args)
     elif is_protocol(base_type):
         yield from _iter_protocol_instances(base_type, type_args)
     elif callable(base_type):
@@ -115,75 +673,325 @@ def _iter_instances_using_fallback(base_type: Any, type_args: tuple[Any, ...]) -
 
 
 def _iter_type_var_instances(base_type: Any, _: tuple[Any, ...], **__: Any) -> Generator[Any]:
-    if base_type.__constraints__:
-        for constraint in base_type.__constraints__:
-            yield from get_all_possible_type_instances(constraint)
-    elif base_type.__bound__:
-        yield from get_all_possible_type_instances(base_type.__bound__)
-    else:
-        yield from get_all_possible_type_instances(Any)
+    yield from _iter_sum_instances(base_type, _get_type_var_options(base_type))
+
+
+def _get_type_var_options(type_var: Any) -> tuple[Any, ...]:
+    """Returns the types a TypeVar can take: its constraints, its bound, or Any."""
+    if type_var.__constraints__:
+        return tuple(type_var.__constraints__)
+    if type_var.__bound__:
+        return (type_var.__bound__,)
+    return (Any,)
 
 
 def _iter_callable_instances(base_type: Any, _: tuple[Any, ...], **__: Any) -> Generator[Any]:
-    type_hints: dict[str, Any] = get_type_hints(base_type)
-    type_annotations: tuple[Any, ...] = tuple(v for k, v in type_hints.items() if k != "return")
+    type_annotations: tuple[Any, ...] = _get_callable_argument_types(base_type)
     yield from _iter_product_instances_with_constructor(base_type, type_annotations, type_constructor=base_type)
 
 
+def _get_callable_argument_types(base_type: Any) -> tuple[Any, ...]:
+    type_hints: dict[str, Any] = get_type_hints(base_type)
+    return tuple(v for k, v in type_hints.items() if k != "return")
+
+
+def iter_structured_instances(
+    base_type: Any, _: tuple[Any, ...], *, skip_defaults: bool = False, strategy: str = PRODUCT
+) -> Generator[Any]:
+    """Yields dataclass, NamedTuple, TypedDict or attrs instances built from combinations of their fields' instances.
+
+    Each field's instances come from get_all_possible_type_instances, so fields sharing a type reuse one set. The
+    strategy picks the combinations the same way as for parametrize_types, and fields with a default are left out
+    when skip_defaults is True.
+    """
+    fields: tuple[StructuredField, ...] = _get_constructor_fields(base_type, skip_defaults)
+    names: tuple[str, ...] = tuple(field.name for field in fields)
+    parameter_sets: list[tuple[Any, ...]] = [get_all_possible_type_instances(field.type) for field in fields]
+    for combination in get_combination_indices([len(s) for s in parameter_sets], strategy):
+        values: tuple[Any, ...] = tuple(parameter_sets[i][index] for i, index in enumerate(combination))
+        yield construct_structured(base_type, names, *values)
+
+
+def count_structured_instances(
+    base_type: Any, _: tuple[Any, ...], *, skip_defaults: bool = False, strategy: str = PRODUCT
+) -> int:
+    """Returns how many instances iter_structured_instances yields with the same arguments."""
+    sizes: list[int] = [count_instances(field.type) for field in _get_constructor_fields(base_type, skip_defaults)]
+    if parse_strategy(strategy) is None:
+        return math.prod(sizes)
+    return count_combinations(get_combination_indices(sizes, strategy))
+
+
+def register_structured_types(
+    *structured_types: Any,
+    skip_defaults: bool = False,
+    strategy: str = PRODUCT,
+    handler_registry: TypeHandlerRegistry = type_handlers,
+) -> None:
+    """Registers structured types to be generated with the given strategy and, optionally, without defaulted fields.
+
+    Usage:
+        register_structured_types(User, Order, skip_defaults=True, strategy="pairwise")
+    """
+    handler: partial[Generator[Any]] = partial(
+        iter_structured_instances, skip_defaults=skip_defaults, strategy=strategy
+    )
+    counter: InstanceCounter = partial(count_structured_instances, skip_defaults=skip_defaults, strategy=strategy)
+    for structured_type in structured_types:
+        if get_structured_fields(structured_type) is None:
+            raise TypeError(f"Expected a dataclass, NamedTuple, TypedDict or attrs class. Got {structured_type}")
+        handler_registry.clear(structured_type)
+    handler_registry.register(*structured_types, counter=counter)(handler)
+
+
+def _get_constructor_fields(base_type: Any, skip_defaults: bool) -> tuple[StructuredField, ...]:
+    fields: tuple[StructuredField, ...] | None = get_structured_fields(base_type)
+    if fields is None:
+        raise TypeError(f"Expected a dataclass, NamedTuple, TypedDict or attrs class. Got {base_type}")
+    if skip_defaults:
+        return tuple(field for field in fields if not field.has_default)
+    return fields
+
+
 def _iter_protocol_instances(*_: Any, **__: Any) -> Generator[Any]:
     raise NotImplementedError
 
 
-@type_handlers.register(type(None))  # pragma: no cover
+@type_handlers.register(type(None), counter=_count_fixed_instances((None,)))  # pragma: no cover
 def _iter_none_instances(*_: Any, **__: Any) -> Generator[Any]:
     yield None
 
 
-@type_handlers.register(bool)  # pragma: no cover
+@type_handlers.register(bool, counter=_count_profile_instances(bool))  # pragma: no cover
 def _iter_bool_instances(*_: Any, **__: Any) -> Generator[Any]:
-    yield from BOOL_PARAMS
+    yield from type_handlers.instance_sets[bool]
 
 
-@type_handlers.register(int)  # pragma: no cover
+@type_handlers.register(int, counter=_count_profile_instances(int))  # pragma: no cover
 def _iter_int_instances(*_: Any, **__: Any) -> Generator[Any]:
-    yield from INT_PARAMS
+    yield from type_handlers.instance_sets[int]
 
 
-@type_handlers.register(float)  # pragma: no cover
+@type_handlers.register(float, counter=_count_profile_instances(float))  # pragma: no cover
 def _iter_float_instances(*_: Any, **__: Any) -> Generator[Any]:
-    yield from FLOAT_PARAMS
+    yield from type_handlers.instance_sets[float]
 
 
-@type_handlers.register(complex)  # pragma: no cover
+@type_handlers.register(complex, counter=_count_profile_instances(complex))  # pragma: no cover
 def _iter_complex_instances(*_: Any, **__: Any) -> Generator[Any]:
-    yield from COMPLEX_PARAMS
+    yield from type_handlers.instance_sets[complex]
 
 
-@type_handlers.register(str)  # pragma: no cover
+@type_handlers.register(str, counter=_count_profile_instances(str))  # pragma: no cover
 def _iter_str_instances(*_: Any, **__: Any) -> Generator[Any]:
-    yield from STR_PARAMS
+    yield from type_handlers.instance_sets[str]
 
 
-@type_handlers.register(bytes)  # pragma: no cover
+@type_handlers.register(bytes, counter=_count_profile_instances(bytes))  # pragma: no cover
 def _iter_bytes_instances(*_: Any, **__: Any) -> Generator[Any]:
-    yield from BYTES_PARAMS
+    yield from type_handlers.instance_sets[bytes]
 
 
-@type_handlers.register(Literal)  # pragma: no cover
+@type_handlers.register(
+    Literal, counter=lambda _, type_args: len(tuple(iter_unique_instances(type_args)))
+)  # pragma: no cover
 def _iter_literal_instances(_: Any, type_args: tuple[Any, ...], **__: Any) -> Generator[Any]:
-    yield from type_args
+    yield from iter_unique_instances(type_args)
 
 
-@type_handlers.register(Any)  # pragma: no cover
+@type_handlers.register(
+    Any, counter=lambda *_: _count_sum_instances(Any, tuple(DEFAULT_INSTANCE_SETS))
+)  # pragma: no cover
 def _iter_any_instances(*_: Any) -> Generator[Any]:
-    for typ in DEFAULT_INSTANCE_SETS:
-        yield from get_all_possible_type_instances(typ)
+    yield from _iter_sum_instances(Any, tuple(DEFAULT_INSTANCE_SETS))
 
 
-@type_handlers.register(Union, Optional, Enum)  # pragma: no cover
+@type_handlers.register(Union, Optional, counter=_count_sum_instances)  # pragma: no cover
 def _iter_sum_instances(_: Any, type_args: tuple[Any, ...]) -> Generator[Any]:
+    """Yields the instances of each type argument in turn, without duplicates between arguments that may overlap.
+
+    Duplicates are removed with UniqueInstances, so 1 from Literal[1, 2] is dropped from Union[int, Literal[1, 2]]
+    while True and 1 from Union[bool, int] are both kept. See _get_deduplicated_positions for which arguments are.
+    """
+    positions: frozenset[int] = _get_deduplicated_positions(type_args, type_handlers)
+    unique: UniqueInstances = UniqueInstances()
+    for position, arg in enumerate(type_args):
+        instances: tuple[Any, ...] = get_all_possible_type_instances(arg)
+        yield from filter(unique.add, instances) if position in positions else instances
+
+
+def _get_deduplicated_positions(type_args: tuple[Any, ...], handler_registry: TypeHandlerRegistry) -> frozenset[int]:
+    """Returns the positions of the arguments of a sum whose instances are deduplicated, see _get_value_shapes.
+
+    Arguments that may generate equal instances are deduplicated when all of them compile to LeafPlans, since their
+    instances are generated up front anyway. Sums with overlapping containers or classes keep their duplicates, so
+    that they are still counted from their structure and compiled lazily.
+    """
+    shapes: list[frozenset[Any] | None] = [_get_value_shapes(arg, handler_registry, frozenset()) for arg in type_args]
+    positions: frozenset[int] = frozenset(
+        position
+        for pair in itertools.combinations(range(len(shapes)), 2)
+        if _shape_sets_overlap(shapes[pair[0]], shapes[pair[1]])
+        for position in pair
+    )
+    if all(_is_generated_up_front(compile_type(type_args[position], handler_registry)) for position in positions):
+        return positions
+    return frozenset()
+
+
+def _is_generated_up_front(plan: Plan) -> bool:
+    if isinstance(plan, SumPlan):
+        return all(map(_is_generated_up_front, plan.plans))
+    return isinstance(plan, LeafPlan)
+
+
+def _get_value_shapes(
+    annotation: Any, handler_registry: TypeHandlerRegistry, active: frozenset[int]
+) -> frozenset[Any] | None:
+    """Returns the shapes of the instances generated for an annotation, or None when they are not known.
+
+    A shape is ("leaf", type, value) for instances of a type, with value MISSING unless a Literal fixes it,
+    ("tuple", element shapes) for fixed length tuples and ("collection", type, sizes, element shapes) for containers.
+    """
+    annotation = handler_registry.recursion.resolve(annotation)
+    if id(annotation) in active:
+        return None
+    active |= {id(annotation)}
+    base_type: Any = get_base_type(annotation)
+    type_args: tuple[Any, ...] = get_args(annotation)
+    if base_type is Literal:
+        return frozenset(("leaf", type(arg), arg) for arg in type_args)
+    if base_type is Union:
+        return _get_sum_value_shapes(type_args, handler_registry, active)
+    if isinstance(base_type, TypeVar):
+        return _get_sum_value_shapes(_get_type_var_options(base_type), handler_registry, active)
+    if base_type is Any:
+        return frozenset(("leaf", typ, MISSING) for typ in DEFAULT_INSTANCE_SETS)
+
+    handlers: Iterable[AnyTypeHandler] | None = handler_registry.get(base_type, None)
+    if handlers is None:
+        return _get_structured_value_shapes(base_type)
+    shapes: set[Any] = set()
+    for handler in handlers:
+        handler_shapes: frozenset[Any] | None = _get_handler_value_shapes(
+            handler, base_type, type_args, handler_registry, active
+        )
+        if handler_shapes is None:
+            return None
+        shapes.update(handler_shapes)
+    return frozenset(shapes)
+
+
+def _get_handler_value_shapes(
+    handler: AnyTypeHandler,
+    base_type: Any,
+    type_args: tuple[Any, ...],
+    handler_registry: TypeHandlerRegistry,
+    active: frozenset[int],
+) -> frozenset[Any] | None:
+    if handler in _LEAF_HANDLER_TYPES:
+        return frozenset((("leaf", _LEAF_HANDLER_TYPES[handler] or base_type, MISSING),))
+    if not isinstance(handler, partial):
+        return None
+    if handler.func is iter_structured_instances:
+        return _get_structured_value_shapes(base_type)
+    if handler.func is iter_collection_instances:
+        constructor: Any = handler.keywords["type_constructor"]
+    elif handler.func is _iter_tuple_instances and _is_variadic(type_args):
+        constructor, type_args = _variadic_tuple_constructor, type_args[:1]
+    elif handler.func is _iter_tuple_instances:
+        return frozenset((("tuple", tuple(_get_value_shapes(arg, handler_registry, active) for arg in type_args)),))
+    else:
+        return None
+    elements: tuple[Any, ...] = tuple(_get_value_shapes(arg, handler_registry, active) for arg in type_args)
+    return frozenset((("collection", _CONSTRUCTOR_TYPES[constructor], handler.keywords["sizes"], elements),))
+
+
+def _get_sum_value_shapes(
+    type_args: tuple[Any, ...], handler_registry: TypeHandlerRegistry, active: frozenset[int]
+) -> frozenset[Any] | None:
+    shapes: set[Any] = set()
     for arg in type_args:
-        yield from get_all_possible_type_instances(arg)
+        arg_shapes: frozenset[Any] | None = _get_value_shapes(arg, handler_registry, active)
+        if arg_shapes is None:
+            return None
+        shapes.update(arg_shapes)
+    return frozenset(shapes)
+
+
+def _get_structured_value_shapes(base_type: Any) -> frozenset[Any] | None:
+    fields: tuple[StructuredField, ...] | None = get_structured_fields(base_type)
+    if fields is None:
+        return None
+    if is_typeddict(base_type):
+        keys: frozenset[Any] = frozenset(("leaf", str, field.name) for field in fields)
+        return frozenset((("collection", dict, tuple(range(len(fields) + 1)), (keys, None)),))
+    return frozenset((("leaf", base_type, MISSING),))
+
+
+def _shape_sets_overlap(first: frozenset[Any] | None, second: frozenset[Any] | None) -> bool:
+    """Returns whether instances of the two sets of shapes may be equal, which is assumed when either is unknown."""
+    if first is None or second is None:
+        return True
+    return any(_shapes_overlap(a, b) for a in first for b in second)
+
+
+def _shapes_overlap(first: tuple[Any, ...], second: tuple[Any, ...]) -> bool:
+    if first[0] != second[0]:
+        return False
+    if first[0] == "leaf":
+        return first[1] is second[1] and (first[2] is MISSING or second[2] is MISSING or first[2] == second[2])
+    if first[0] == "tuple":
+        return len(first[1]) == len(second[1]) and all(map(_shape_sets_overlap, first[1], second[1]))
+    if first[1] is not second[1]:
+        return False
+    common_sizes: set[int] = set(first[2]).intersection(second[2])
+    return 0 in common_sizes or (bool(common_sizes) and all(map(_shape_sets_overlap, first[3], second[3])))
+
+
+@lru_cache(maxsize=None)
+def get_enum_members(enum_type: type[Enum]) -> tuple[Enum, ...]:
+    """Returns the members of an enum class without aliases, computed once per class."""
+    return tuple(enum_type)
+
+
+@type_handlers.register(EnumMeta, counter=lambda base_type, _: len(get_enum_members(base_type)))  # pragma: no cover
+def _iter_enum_instances(base_type: Any, *_: Any) -> Generator[Any]:
+    yield from get_enum_members(base_type)
+
+
+def iter_flag_combinations(base_type: type[Flag], *_: Any) -> Generator[Flag]:
+    """Yields every combination of a Flag's single-bit members, starting from the empty flag."""
+    bits: tuple[Flag, ...] = _get_flag_bits(base_type)
+    for mask in range(1 << len(bits)):
+        yield reduce(operator.or_, itertools.compress(bits, _iter_bits(mask)), base_type(0))
+
+
+def count_flag_combinations(base_type: type[Flag], *_: Any) -> int:
+    """Returns how many combinations iter_flag_combinations yields for a Flag."""
+    return 1 << len(_get_flag_bits(base_type))
+
+
+def register_flag_combinations(*flag_types: type[Flag], handler_registry: TypeHandlerRegistry = type_handlers) -> None:
+    """Opts the given Flag classes into yielding every combination of their members instead of just the members.
+
+    Usage:
+        register_flag_combinations(Permission)
+    """
+    for flag_type in flag_types:
+        handler_registry.clear(flag_type)
+    handler_registry.register(*flag_types, counter=count_flag_combinations)(iter_flag_combinations)
+
+
+def _get_flag_bits(flag_type: type[Flag]) -> tuple[Flag, ...]:
+    members: tuple[Any, ...] = get_enum_members(flag_type)
+    return tuple(member for member in members if member.value and not member.value & (member.value - 1))
+
+
+def _iter_bits(mask: int) -> Generator[bool]:
+    while mask:
+        yield bool(mask & 1)
+        mask >>= 1
 
 
 def _iter_combinations(type_args: tuple[Any, ...]) -> Generator[tuple[Any, ...]]:
@@ -201,58 +1009,184 @@ def _iter_product_instances_with_constructor(
     yield from itertools.starmap(type_constructor, _iter_combinations(type_args))
 
 
-def _validate_combination_length(combination: tuple[Any, ...], expected_length: int, typ: type[Any]) -> None:
-    if len(combination) != expected_length:
-        raise TypeError(f"Expected combination of length {expected_length} for type {typ}. Got {len(combination)}")
+def iter_collection_instances(
+    base_type: Any,
+    type_args: tuple[Any, ...],
+    *,
+    type_constructor: Callable[[Iterable[tuple[Any, ...]]], Any],
+    unique_keys: bool = False,
+    sizes: Sequence[int] = DEFAULT_COLLECTION_SIZES,
+) -> Generator[Any]:
+    """Yields containers of each of the sizes built from rows of instances of the type arguments, see CollectionPlan.
+
+    The instances of each type argument are generated once and shared by every size. With unique_keys, duplicate and
+    unhashable instances of the first type argument, the elements of a set or the keys of a dict, are left out and
+    sizes above the number of remaining instances are skipped. A size equal to it gives one set holding every element.
+    """
+    element_types: tuple[Any, ...] = _get_element_types(base_type, type_args)
+    plans: list[Plan] = [LeafPlan(get_all_possible_type_instances(arg)) for arg in element_types]
+    yield from _make_collection_plan(plans, type_constructor=type_constructor, unique_keys=unique_keys, sizes=sizes)
+
+
+def count_collection_instances(
+    base_type: Any,
+    type_args: tuple[Any, ...],
+    *,
+    unique_keys: bool = False,
+    sizes: Sequence[int] = DEFAULT_COLLECTION_SIZES,
+) -> int:
+    """Returns how many containers iter_collection_instances yields with the same arguments."""
+    element_types: tuple[Any, ...] = _get_element_types(base_type, type_args)
+    element_counts: list[int] = [count_instances(arg) for arg in element_types]
+    max_size: int | None = None
+    if unique_keys:
+        element_counts[0] = max_size = len(_unique_hashable(compile_type(element_types[0])))
+    combinations: int = math.prod(element_counts)
+    width: int = max(element_counts) if combinations else 0
+    return sum(
+        count_collections(size, combinations, width, max_size) for size in sizes if max_size is None or size <= max_size
+    )
 
 
-def _dict_constructor(k: KT, v: VT) -> dict[KT, VT]:
-    return {k: v}
+def register_collection_sizes(
+    *collection_types: Any, sizes: Iterable[int], handler_registry: TypeHandlerRegistry = type_handlers
+) -> None:
+    """Registers list, set, frozenset, dict and variadic tuple handlers generating containers of each of the sizes.
+
+    Every built-in collection type is registered when no collection_types are given. Sizes above 1 only add one
+    container per instance of the element type rather than every combination, which keeps large sizes cheap.
+
+    Usage:
+        register_collection_sizes(sizes=(0, 1, 2, 100))
+        register_collection_sizes(list, tuple, sizes=(0, 5))
+    """
+    unique_sizes: tuple[int, ...] = tuple(sorted(set(sizes)))
+    if any(size < 0 for size in unique_sizes):
+        raise ValueError(f"Expected collection sizes of at least 0. Got {unique_sizes}")
+    for collection_type in collection_types or (*_COLLECTION_CONSTRUCTORS, tuple):
+        if collection_type is not tuple and collection_type not in _COLLECTION_CONSTRUCTORS:
+            raise TypeError(f"Expected a list, set, frozenset, dict or tuple type. Got {collection_type}")
+        handler_registry.clear(collection_type)
+        if collection_type is tuple:
+            handler_registry.register(
+                tuple, counter=partial(_count_tuple_instances, sizes=unique_sizes), inherited=False
+            )(partial(_iter_tuple_instances, sizes=unique_sizes))
+            continue
+        constructor, unique_keys = _COLLECTION_CONSTRUCTORS[collection_type]
+        counter: InstanceCounter = partial(count_collection_instances, unique_keys=unique_keys, sizes=unique_sizes)
+        handler_registry.register(collection_type, counter=counter, inherited=False)(
+            partial(
+                iter_collection_instances, type_constructor=constructor, unique_keys=unique_keys, sizes=unique_sizes
+            )
+        )
+
+
+def _get_element_types(base_type: Any, type_args: tuple[Any, ...]) -> tuple[Any, ...]:
+    if not type_args:
+        raise TypeError(f"Expected the element types of {base_type}.")
+    return type_args
+
+
+def _make_collection_plan(
+    plans: list[Plan],
+    *,
+    type_constructor: Callable[[Iterable[tuple[Any, ...]]], Any],
+    unique_keys: bool = False,
+    sizes: Sequence[int] = DEFAULT_COLLECTION_SIZES,
+) -> CollectionPlan:
+    max_size: int | None = None
+    if unique_keys:
+        plans[0] = LeafPlan(_unique_hashable(plans[0]))
+        max_size = plans[0].size
+    return CollectionPlan(plans, sizes, type_constructor, max_size=max_size)
+
+
+def _unique_hashable(instances: Iterable[Any]) -> list[Any]:
+    """Returns the instances that can be set elements or dict keys, without those equal to an earlier one."""
+    seen: set[Any] = set()
+    unique: list[Any] = []
+    for instance in instances:
+        try:
+            if instance in seen:
+                continue
+        except TypeError:
+            continue
+        seen.add(instance)
+        unique.append(instance)
+    return unique
+
+
+def _iter_tuple_instances(base_type: Any, type_args: tuple[Any, ...], *, sizes: Sequence[int]) -> Generator[Any]:
+    if _is_variadic(type_args):
+        yield from iter_collection_instances(
+            base_type, type_args[:1], type_constructor=_variadic_tuple_constructor, sizes=sizes
+        )
+    else:
+        yield from _iter_product_instances_with_constructor(base_type, type_args, type_constructor=_tuple_constructor)
 
 
-def _list_constructor(value: T) -> list[T]:
-    return [value]
+def _count_tuple_instances(base_type: Any, type_args: tuple[Any, ...], *, sizes: Sequence[int]) -> int:
+    if _is_variadic(type_args):
+        return count_collection_instances(base_type, type_args[:1], sizes=sizes)
+    return _count_product_instances(base_type, type_args)
 
 
-def _set_constructor(value: T) -> set[T]:
-    _validate_combination_length(combination=(value,), expected_length=1, typ=set)
-    return {value}
+def _is_variadic(type_args: tuple[Any, ...]) -> bool:
+    return len(type_args) == 2 and type_args[1] is Ellipsis
 
 
-def _frozenset_constructor(*args: Any) -> frozenset[Any]:
-    _validate_combination_length(combination=args, expected_length=1, typ=frozenset)
-    return frozenset(args)
+def _dict_constructor(rows: Iterable[tuple[Any, ...]]) -> dict[Any, Any]:
+    return dict(rows)
 
 
-def _tuple_constructor(*args: Any) -> tuple[Any, ...]:
-    return tuple(args)
+def _list_constructor(rows: Iterable[tuple[Any, ...]]) -> list[Any]:
+    return [value for (value,) in rows]
 
 
-_iter_dict_instances: partial[Generator[Any]] = partial(
-    _iter_product_instances_with_constructor, type_constructor=_dict_constructor
-)
-type_handlers.register(dict)(_iter_dict_instances)  # pragma: no cover
+def _set_constructor(rows: Iterable[tuple[Any, ...]]) -> set[Any]:
+    return {value for (value,) in rows}
 
 
-_iter_list_instances: partial[Generator[Any]] = partial(
-    _iter_product_instances_with_constructor, type_constructor=_list_constructor
-)
-type_handlers.register(list)(_iter_list_instances)  # pragma: no cover
+def _frozenset_constructor(rows: Iterable[tuple[Any, ...]]) -> frozenset[Any]:
+    return frozenset(value for (value,) in rows)
 
 
-_iter_set_instances: partial[Generator[Any]] = partial(
-    _iter_product_instances_with_constructor, type_constructor=_set_constructor
-)
-type_handlers.register(set)(_iter_set_instances)  # pragma: no cover
+def _variadic_tuple_constructor(rows: Iterable[tuple[Any, ...]]) -> tuple[Any, ...]:
+    return tuple(value for (value,) in rows)
 
 
-_iter_frozenset_instances: partial[Generator[Any]] = partial(
-    _iter_product_instances_with_constructor, type_constructor=_frozenset_constructor
-)
-type_handlers.register(frozenset)(_iter_frozenset_instances)  # pragma: no cover
+def _tuple_constructor(*args: Any) -> tuple[Any, ...]:
+    return tuple(args)
 
 
-_iter_tuple_instances: partial[Generator[Any]] = partial(
-    _iter_product_instances_with_constructor, type_constructor=_tuple_constructor
-)
-type_handlers.register(tuple)(_iter_tuple_instances)  # pragma: no cover
+_COLLECTION_CONSTRUCTORS: dict[Any, tuple[Callable[[Iterable[tuple[Any, ...]]], Any], bool]] = {
+    list: (_list_constructor, False),
+    collections.abc.Sequence: (_list_constructor, False),
+    collections.abc.MutableSequence: (_list_constructor, False),
+    set: (_set_constructor, True),
+    collections.abc.Set: (_set_constructor, True),
+    collections.abc.MutableSet: (_set_constructor, True),
+    frozenset: (_frozenset_constructor, True),
+    dict: (_dict_constructor, True),
+    collections.abc.Mapping: (_dict_constructor, True),
+    collections.abc.MutableMapping: (_dict_constructor, True),
+}
+_CONSTRUCTOR_TYPES: dict[Callable[[Iterable[tuple[Any, ...]]], Any], type[Any]] = {
+    _list_constructor: list,
+    _set_constructor: set,
+    _frozenset_constructor: frozenset,
+    _dict_constructor: dict,
+    _variadic_tuple_constructor: tuple,
+}
+_LEAF_HANDLER_TYPES: dict[Any, type[Any] | None] = {
+    _iter_none_instances: type(None),
+    _iter_bool_instances: bool,
+    _iter_int_instances: int,
+    _iter_float_instances: float,
+    _iter_complex_instances: complex,
+    _iter_str_instances: str,
+    _iter_bytes_instances: bytes,
+    _iter_enum_instances: None,
+    iter_flag_combinations: None,
+}
+register_collection_sizes(sizes=DEFAULT_COLLECTION_SIZES)
@@ -0,0 +1,222 @@
+"""Module containing compiled generation plans that give random access to the instances of a type."""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import overload
+
+from pytest_static.combinations import ProductIndices
+from pytest_static.combinations import sample_positions
+from pytest_static.util import copy_mutable
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from pytest_static.custom_typing import TypeConstructor
+
+
+class Plan(Sequence[Any], ABC):
+    """Compiled description of every instance of a type, addressable by index without generating the others.
+
+    Use size rather than len() for plans with more than sys.maxsize instances.
+    """
+
+    size: int
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over every instance in order."""
+
+    @abstractmethod
+    def _get(self, index: int) -> Any:
+        """Returns the instance at a non-negative index known to be in range."""
+
+    def __len__(self) -> int:
+        """Returns the number of instances."""
+        return self.size
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Plan: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Returns the instance at the given index, or a lazy plan of the instances in a slice."""
+        if isinstance(index, slice):
+            return SlicePlan(self, range(self.size)[index])
+        return self.nth(index)
+
+    def nth(self, index: int) -> Any:
+        """Returns the instance at the given index, building only that instance."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Plan index {index} out of range for {self.size} instances.")
+        return self._get(index)
+
+    def sample(self, k: int, seed: int | None = None) -> list[Any]:
+        """Returns a reproducible uniform sample of at most k instances, kept in their original order."""
+        return [self._get(position) for position in sample_positions(self.size, k, seed)]
+
+
+class LeafPlan(Plan):
+    """Plan over instances that were generated up front by a handler.
+
+    Instances requested by index are copied when they are mutable, so that test items resolving the same index do not
+    share them. Iterating yields the stored instances.
+    """
+
+    def __init__(self, instances: Sequence[Any]) -> None:
+        """Stores the instances."""
+        self.instances: tuple[Any, ...] = tuple(instances)
+        self.size: int = len(self.instances)
+
+    def __repr__(self) -> str:
+        """Returns the number of instances rather than the instances themselves."""
+        return f"{type(self).__name__}(size={self.size})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the instances."""
+        return iter(self.instances)
+
+    def _get(self, index: int) -> Any:
+        return copy_mutable(self.instances[index])
+
+
+class SumPlan(Plan):
+    """Plan yielding every instance of each of its plans in turn, like a Union."""
+
+    def __init__(self, plans: Sequence[Plan]) -> None:
+        """Stores the plans and where each of them starts."""
+        self.plans: tuple[Plan, ...] = tuple(plans)
+        self.offsets: list[int] = list(itertools.accumulate((plan.size for plan in self.plans), initial=0))
+        self.size: int = self.offsets[-1]
+
+    def __repr__(self) -> str:
+        """Returns the plans being summed."""
+        return f"{type(self).__name__}({list(self.plans)!r})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the instances of each plan in order."""
+        return itertools.chain.from_iterable(self.plans)
+
+    def _get(self, index: int) -> Any:
+        position: int = bisect.bisect_right(self.offsets, index) - 1
+        return self.plans[position].nth(index - self.offsets[position])
+
+
+class ProductPlan(Plan):
+    """Plan passing every combination of the instances of its plans to a constructor, like a tuple."""
+
+    def __init__(self, plans: Sequence[Plan], type_constructor: TypeConstructor[Any]) -> None:
+        """Stores the plans and the constructor their combined instances are passed to."""
+        self.plans: tuple[Plan, ...] = tuple(plans)
+        self.type_constructor: TypeConstructor[Any] = type_constructor
+        self.indices: ProductIndices = ProductIndices([plan.size for plan in self.plans])
+        self.size: int = self.indices.size
+
+    def __repr__(self) -> str:
+        """Returns the plans being combined."""
+        return f"{type(self).__name__}({list(self.plans)!r})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over every combination in itertools.product order."""
+        return itertools.starmap(self.type_constructor, itertools.product(*self.plans))
+
+    def _get(self, index: int) -> Any:
+        digits: tuple[int, ...] = self.indices[index]
+        return self.type_constructor(*(plan.nth(digit) for plan, digit in zip(self.plans, digits)))
+
+
+class CollectionPlan(Plan):
+    """Plan building containers of each of the given sizes from rows of instances of its plans, like a list or dict.
+
+    Size 0 gives one empty container and size 1 a container per combination of instances, like a ProductPlan. Any
+    larger size gives one container per position of the longest plan, whose rows hold the instances at that position
+    and the ones following it, wrapping around shorter plans. Sizes above max_size are left out, and containers of
+    max_size start every max_size positions instead, since the instances of a plan holding exactly max_size unique
+    keys would otherwise give the same set in every container. Each container is only built when it is requested, so
+    large sizes do not cost anything until used.
+    """
+
+    def __init__(
+        self,
+        plans: Sequence[Plan],
+        sizes: Sequence[int],
+        type_constructor: Callable[[Iterable[tuple[Any, ...]]], Any],
+        max_size: int | None = None,
+    ) -> None:
+        """Stores the plans, the sizes kept and where the containers of each size start."""
+        self.plans: tuple[Plan, ...] = tuple(plans)
+        self.type_constructor: Callable[[Iterable[tuple[Any, ...]]], Any] = type_constructor
+        self.rows: ProductPlan = ProductPlan(self.plans, type_constructor=lambda *row: row)
+        self.width: int = max((plan.size for plan in self.plans), default=0) if self.rows.size else 0
+        self.max_size: int | None = max_size
+        self.sizes: tuple[int, ...] = tuple(size for size in sizes if max_size is None or size <= max_size)
+        counts: list[int] = [count_collections(size, self.rows.size, self.width, max_size) for size in self.sizes]
+        self.offsets: list[int] = list(itertools.accumulate(counts, initial=0))
+        self.size: int = self.offsets[-1]
+
+    def __repr__(self) -> str:
+        """Returns the plans and sizes of the containers."""
+        return f"{type(self).__name__}({list(self.plans)!r}, sizes={self.sizes!r})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the containers of each size in turn."""
+        return map(self._get, range(self.size))
+
+    def _get(self, index: int) -> Any:
+        position: int = bisect.bisect_right(self.offsets, index) - 1
+        size: int = self.sizes[position]
+        index -= self.offsets[position]
+        if size == 1:
+            return self.type_constructor([self.rows.nth(index)])
+        start: int = index * size if size == self.max_size else index
+        return self.type_constructor(
+            tuple(plan.nth((start + offset) % plan.size) for plan in self.plans) for offset in range(size)
+        )
+
+
+def count_collections(size: int, combinations: int, width: int, max_size: int | None = None) -> int:
+    """Returns how many containers of a size a CollectionPlan builds from rows with the given number of combinations.
+
+    Width is the number of instances of the longest plan, and containers of max_size start every max_size positions.
+    """
+    if size == 0:
+        return 1
+    if size == 1:
+        return combinations
+    if size == max_size:
+        return -(-width // size)
+    return width
+
+
+class SlicePlan(Plan):
+    """Lazy view of the instances found at a range of positions in another plan."""
+
+    def __init__(self, plan: Plan, positions: range) -> None:
+        """Stores the viewed plan and the positions included in the view."""
+        self.plan: Plan = plan
+        self.positions: range = positions
+        self.size: int = max(0, -(-(positions.stop - positions.start) // positions.step))
+
+    def __repr__(self) -> str:
+        """Returns the viewed plan and positions."""
+        return f"{type(self).__name__}({self.plan!r}, {self.positions!r})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the viewed instances in order."""
+        return (self.plan.nth(position) for position in self.positions)
+
+    def _get(self, index: int) -> Any:
+        return self.plan.nth(self.positions[index])
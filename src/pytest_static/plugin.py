@@ -1,21 +1,216 @@
 """The pytest-static pytest plugin."""
 
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+from typing import Any
+
 import pytest
-from _pytest.python import Metafunc
 
-from pytest_static.parametric import parametrize_types
+from pytest_static.ids import ID_CACHE_KEY
+from pytest_static.ids import ID_DIGESTS_KEY
+from pytest_static.ids import write_id_map
+from pytest_static.lazy import resolve_lazy_param
+from pytest_static.marks import MARKER_NAME
+from pytest_static.marks import iter_marked_argtypes
+from pytest_static.options import DEFAULT_ASYNC_CONCURRENCY
+from pytest_static.options import add_options
+from pytest_static.options import get_collection_sizes
+from pytest_static.options import get_option
+from pytest_static.options import get_workers
+from pytest_static.profiles import STANDARD
+from pytest_static.recursion import DEFAULT_MAX_DEPTH
+
+
+if TYPE_CHECKING:
+    from _pytest.mark import Mark
+    from _pytest.python import Metafunc
+    from pluggy import PluginManager
+
+    from pytest_static.prefetch import PrefetchPool
+    from pytest_static.store import ParameterStore
+    from pytest_static.type_handler import RegistrySnapshot
+    from pytest_static.type_handler import TypeHandlerRegistry
+
+
+PREFETCHED_KEY: pytest.StashKey[bool] = pytest.StashKey[bool]()
+HANDLERS_LOADED_KEY: pytest.StashKey[bool] = pytest.StashKey[bool]()
+COLLECTION_SIZES_KEY: pytest.StashKey[bool] = pytest.StashKey[bool]()
+STORE_KEY: pytest.StashKey[ParameterStore] = pytest.StashKey["ParameterStore"]()
+PREFETCH_POOL_KEY: pytest.StashKey[PrefetchPool] = pytest.StashKey["PrefetchPool"]()
+REGISTRATIONS_KEY: pytest.StashKey[RegistrySnapshot] = pytest.StashKey["RegistrySnapshot"]()
+
+
+def pytest_addhooks(pluginmanager: PluginManager) -> None:
+    """Adds the pytest-static hook specifications."""
+    from pytest_static import hookspecs
+
+    pluginmanager.add_hookspecs(hookspecs)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Adds pytest-static options to the pytest CLI."""
+    add_options(parser)
 
 
 def pytest_generate_tests(metafunc: Metafunc) -> None:
     """Generate parametrized tests for the given argnames and types."""
-    for marker in metafunc.definition.iter_markers(name="parametrize_types"):
-        parametrize_types(metafunc, *marker.args, **marker.kwargs)
+    markers: list[Mark] = list(metafunc.definition.iter_markers(name=MARKER_NAME))
+    if not markers:
+        return
+
+    type_handlers: TypeHandlerRegistry = load_type_handlers(metafunc.config)
+    from pytest_static.parametric import check_max_cases
+    from pytest_static.parametric import parametrize_types
+
+    with type_handlers.recursion.using_namespace(vars(metafunc.module)):
+        for marker in markers:
+            check_max_cases(metafunc, *marker.args, **marker.kwargs)
+            parametrize_types(metafunc, *marker.args, **marker.kwargs)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pycollect_makeitem(collector: pytest.Module | pytest.Class) -> None:
+    """Expands a module's parametrize_types annotations concurrently before its first item is generated.
+
+    Annotations with async generator handlers are expanded together on one event loop, and with --static-workers the
+    remaining ones are expanded in a process pool shared by the session. Modules are not searched for markers when neither can apply.
+    """
+    if not isinstance(collector, pytest.Module) or collector.stash.get(PREFETCHED_KEY, False):
+        return
+    collector.stash[PREFETCHED_KEY] = True
+    workers: int = get_workers(collector.config)
+    if workers <= 1 and not _may_have_async_handlers(collector.config):
+        return
+    argtypes: list[Any] = list(iter_marked_argtypes(vars(collector.obj)))
+    if not argtypes:
+        return
+
+    type_handlers: TypeHandlerRegistry = load_type_handlers(collector.config)
+    from pytest_static.prefetch import PrefetchPool
+    from pytest_static.prefetch import prefetch_async_instances
+
+    concurrency: int = int(get_option(collector.config, "static_async_concurrency") or DEFAULT_ASYNC_CONCURRENCY)
+    with type_handlers.recursion.using_namespace(vars(collector.obj)):
+        prefetch_async_instances(argtypes, concurrency)
+        if workers > 1:
+            limit: Any = get_option(collector.config, "static_max_cases")
+            max_instances: int | None = int(limit) if limit not in (None, "") else None
+            if PREFETCH_POOL_KEY not in collector.config.stash:
+                collector.config.stash[PREFETCH_POOL_KEY] = PrefetchPool(workers)
+            collector.config.stash[PREFETCH_POOL_KEY].prefetch(argtypes, max_instances=max_instances)
+
+
+def _may_have_async_handlers(config: pytest.Config) -> bool:
+    """Returns whether async handlers are registered, or may be once the type handlers are loaded through the hook."""
+    if not config.stash.get(HANDLERS_LOADED_KEY, False) and config.hook.pytest_static_register_handlers.get_hookimpls():
+        return True
+    parametric: Any = sys.modules.get("pytest_static.parametric")
+    return parametric is not None and bool(parametric.type_handlers.has_async_handlers())
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_fixture_setup(request: pytest.FixtureRequest) -> None:
+    """Resolves a lazily parametrized value as its argument is set up, so fixtures requesting it get the instance."""
+    resolve_lazy_param(request)
 
 
 def pytest_configure(config: pytest.Config) -> None:
-    """Adds pytest-static plugin markers to the pytest CLI."""
+    """Adds pytest-static plugin markers to the pytest CLI and sets up the optional plugins and parameter store."""
     config.addinivalue_line(
         "markers",
         "parametrize_types(argnames, argtypes, ids, *type_args, **kwargs):"
         " Generate parametrized tests for the given argnames and types in argtypes.",
     )
+
+    max_failures: Any = get_option(config, "static_fail_fast_family")
+    if max_failures not in (None, "") and int(max_failures) > 0:
+        from pytest_static.fail_fast import FAIL_FAST_PLUGIN_NAME
+        from pytest_static.fail_fast import FamilyFailFast
+
+        config.pluginmanager.register(FamilyFailFast(int(max_failures)), FAIL_FAST_PLUGIN_NAME)
+
+    cache: pytest.Cache | None = getattr(config, "cache", None)
+    if cache is not None and get_option(config, "static_new_only"):
+        from pytest_static.results import COMBINATION_MARKER_NAME
+        from pytest_static.results import RESULTS_KEY
+        from pytest_static.results import RESULTS_PLUGIN_NAME
+        from pytest_static.results import CombinationResults
+
+        config.addinivalue_line(
+            "markers", f"{COMBINATION_MARKER_NAME}(family, digest): Combination recorded by --static-new-only."
+        )
+        config.stash[RESULTS_KEY] = CombinationResults(cache, config.rootpath)
+        config.pluginmanager.register(config.stash[RESULTS_KEY], RESULTS_PLUGIN_NAME)
+
+    clear: bool = config.getoption("static_cache_clear", default=False)
+    enabled: bool = bool(get_option(config, "static_cache"))
+    if cache is None or not (clear or enabled):
+        return
+
+    from pytest_static.store import STORE_DIR
+    from pytest_static.store import ParameterStore
+
+    store: ParameterStore = ParameterStore(cache.mkdir(STORE_DIR))
+    if clear:
+        store.clear()
+    if enabled:
+        config.stash[STORE_KEY] = store
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Stops the prefetch workers, detaches the parameter store and restores the default handlers and options."""
+    if PREFETCH_POOL_KEY in config.stash:
+        config.stash[PREFETCH_POOL_KEY].shutdown()
+    if config.stash.get(HANDLERS_LOADED_KEY, False):
+        from pytest_static.parametric import DEFAULT_COLLECTION_SIZES
+        from pytest_static.parametric import register_collection_sizes
+        from pytest_static.parametric import type_handlers
+
+        type_handlers.store = None
+        if REGISTRATIONS_KEY in config.stash:
+            type_handlers.restore(config.stash[REGISTRATIONS_KEY])
+        type_handlers.set_max_depth(DEFAULT_MAX_DEPTH)
+        type_handlers.set_profile(STANDARD)
+        if config.stash.get(COLLECTION_SIZES_KEY, False):
+            register_collection_sizes(sizes=DEFAULT_COLLECTION_SIZES)
+
+
+def load_type_handlers(config: pytest.Config) -> TypeHandlerRegistry:
+    """Imports the type handlers on first use and lets plugins register their own through the hook.
+
+    The built-in handlers are registered when pytest_static.parametric is imported, which is deferred until the first
+    parametrize_types marker is found so that sessions without the marker do not pay for it.
+    """
+    from pytest_static.parametric import register_collection_sizes
+    from pytest_static.parametric import type_handlers
+
+    if not config.stash.get(HANDLERS_LOADED_KEY, False):
+        config.stash[HANDLERS_LOADED_KEY] = True
+        type_handlers.store = config.stash.get(STORE_KEY, None)
+        max_depth: Any = get_option(config, "static_max_depth")
+        type_handlers.set_max_depth(int(max_depth) if max_depth not in (None, "") else DEFAULT_MAX_DEPTH)
+        type_handlers.set_profile(get_option(config, "static_profile") or STANDARD)
+        sizes: tuple[int, ...] | None = get_collection_sizes(config)
+        if sizes is not None:
+            config.stash[COLLECTION_SIZES_KEY] = True
+            register_collection_sizes(sizes=sizes)
+        config.stash[REGISTRATIONS_KEY] = type_handlers.snapshot()
+        config.hook.pytest_static_register_handlers(registry=type_handlers)
+    return type_handlers
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Stores the full reprs behind any compact ids generated during the session."""
+    config: pytest.Config = session.config
+    digests: dict[str, str] = config.stash.get(ID_DIGESTS_KEY, {})
+    if not digests:
+        return
+
+    id_map: str | None = get_option(config, "static_id_map")
+    cache: pytest.Cache | None = getattr(config, "cache", None)
+    if id_map is not None:
+        write_id_map(digests, config.invocation_params.dir / id_map)
+    elif cache is not None:
+        cache.set(ID_CACHE_KEY, {**cache.get(ID_CACHE_KEY, {}), **digests})
@@ -0,0 +1,179 @@
+"""Module containing the parallel expansion of the parametrize_types annotations found in a test module."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import sys
+from collections.abc import AsyncIterator
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ForwardRef
+from typing import get_args
+
+from pytest_static.custom_typing import MISSING
+from pytest_static.parametric import count_instances
+from pytest_static.parametric import get_all_possible_type_instances
+from pytest_static.parametric import type_handlers
+from pytest_static.util import collect_async
+from pytest_static.util import get_base_type
+from pytest_static.util import is_async_handler
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from pytest_static.custom_typing import AnyTypeHandler
+
+
+MIN_FORK_ANNOTATIONS: int = 4
+
+
+class PrefetchPool:
+    """A pool of forked processes expanding the parametrize_types annotations of every module in a session.
+
+    Forked workers only see the handlers and modules present when they were forked, so the pool is forked again when
+    the registered handlers change or an annotation refers to a module imported since. Annotations are pickled to the
+    workers, and forward references are resolved in the namespace of the module they were collected from.
+    """
+
+    def __init__(self, workers: int) -> None:
+        """Sets up the pool, which is only forked once a module has enough annotations to expand."""
+        self.workers: int = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._fingerprint: str | None = None
+        self._modules: frozenset[str] = frozenset()
+
+    def prefetch(self, argtypes: Iterable[Any], max_instances: int | None = None) -> int:
+        """Expands the annotations not cached yet in the workers and caches the results.
+
+        Workers count each annotation before expanding it and skip those with more than max_instances instances, so
+        that --static-max-cases can still reject them without the parent process counting anything. Annotations whose
+        expansion fails or cannot be pickled are left for parametrize_types to expand serially. The pool is not forked
+        for fewer than MIN_FORK_ANNOTATIONS annotations. Returns the number of annotations that were cached.
+        """
+        pending: dict[Any, Any] = {}
+        for argtype in argtypes:
+            key: Any = type_handlers.recursion.normalize(argtype)
+            if key not in pending and type_handlers.instance_cache.get(key, MISSING) is MISSING:
+                pending[key] = argtype
+        if self.workers < 2 or len(pending) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+            return 0
+
+        module: str | None = type_handlers.recursion.namespace.get("__name__")
+        required: set[str] = set().union(*(_get_required_modules(argtype, module) for argtype in pending.values()))
+        executor: ProcessPoolExecutor | None = self._executor
+        if executor is None or self._fingerprint != type_handlers.fingerprint() or required - self._modules:
+            if len(pending) < MIN_FORK_ANNOTATIONS:
+                return 0
+            executor = self._fork()
+
+        futures: dict[Any, Future[tuple[Any, ...] | None]] = {
+            key: executor.submit(_expand, argtype, module, max_instances) for key, argtype in pending.items()
+        }
+        cached: int = 0
+        for key, future in futures.items():
+            exception: BaseException | None = future.exception()
+            if isinstance(exception, BrokenProcessPool):
+                self.shutdown()
+            elif exception is None and future.result() is not None:
+                type_handlers.instance_cache.set(key, future.result())
+                cached += 1
+        return cached
+
+    def shutdown(self) -> None:
+        """Stops the workers, which are forked again by the next prefetch."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _fork(self) -> ProcessPoolExecutor:
+        self.shutdown()
+        self._fingerprint = type_handlers.fingerprint()
+        self._modules = frozenset(sys.modules)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("fork"))
+        return self._executor
+
+
+def prefetch_async_instances(argtypes: Iterable[Any], concurrency: int) -> int:
+    """Expands the annotations handled by async generator handlers concurrently on one event loop.
+
+    Nested annotations are included, so list[Corpus] benefits from an async Corpus handler. At most concurrency
+    annotations are expanded at once. Annotations whose expansion fails are left for parametrize_types to expand.
+    Returns the number of annotations that were cached.
+    """
+    pending: dict[Any, Any] = {}
+    for annotation in _iter_nested_annotations(argtypes):
+        key: Any = type_handlers.recursion.normalize(annotation)
+        if key in pending or type_handlers.instance_cache.get(key, MISSING) is not MISSING:
+            continue
+        handlers: list[AnyTypeHandler] | None = type_handlers.get(get_base_type(annotation), None)
+        if handlers and any(map(is_async_handler, handlers)):
+            pending[key] = annotation
+    if not pending:
+        return 0
+
+    results: list[tuple[Any, ...] | BaseException] = asyncio.run(
+        _expand_concurrently(list(pending.values()), max(concurrency, 1))
+    )
+    cached: int = 0
+    for key, result in zip(pending, results):
+        if not isinstance(result, BaseException):
+            type_handlers.instance_cache.set(key, result)
+            cached += 1
+    return cached
+
+
+async def _expand_concurrently(annotations: list[Any], concurrency: int) -> list[tuple[Any, ...] | BaseException]:
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+    async def expand(annotation: Any) -> tuple[Any, ...]:
+        async with semaphore:
+            instances: list[Any] = []
+            for handler in type_handlers[get_base_type(annotation)]:
+                results: Any = handler(get_base_type(annotation), get_args(annotation))
+                instances.extend(await collect_async(results) if isinstance(results, AsyncIterator) else results)
+            return tuple(instances)
+
+    return await asyncio.gather(*map(expand, annotations), return_exceptions=True)
+
+
+def _iter_nested_annotations(annotations: Iterable[Any]) -> Iterator[Any]:
+    for annotation in annotations:
+        if isinstance(annotation, list):
+            yield from _iter_nested_annotations(annotation)
+            continue
+        yield from _iter_nested_annotations(get_args(annotation))
+        yield annotation
+
+
+def _count_instances(argtype: Any) -> float:
+    try:
+        return count_instances(argtype)
+    except Exception:  # noqa: BLE001
+        return math.inf
+
+
+def _get_required_modules(annotation: Any, module: str | None) -> set[str]:
+    """Returns the modules a worker needs to unpickle the annotation and resolve its forward references."""
+    required: set[str] = set()
+    for nested in _iter_nested_annotations([annotation]):
+        if isinstance(nested, (str, ForwardRef)) and module is not None:
+            required.add(module)
+        name: Any = getattr(nested, "__module__", None)
+        if isinstance(name, str):
+            required.add(name)
+    return required
+
+
+def _expand(annotation: Any, module: str | None, max_instances: int | None) -> tuple[Any, ...] | None:
+    namespace: dict[str, Any] = vars(sys.modules[module]) if module in sys.modules else {}
+    with type_handlers.recursion.using_namespace(namespace):
+        if max_instances is not None and _count_instances(annotation) > max_instances:
+            return None
+        return get_all_possible_type_instances(annotation)
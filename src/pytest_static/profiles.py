@@ -0,0 +1,9 @@
+"""Module containing the names of the instance set profiles, which type_sets.PROFILES maps to their sets."""
+
+from __future__ import annotations
+
+
+SMOKE: str = "smoke"
+STANDARD: str = "standard"
+EXHAUSTIVE: str = "exhaustive"
+PROFILE_NAMES: tuple[str, ...] = (SMOKE, STANDARD, EXHAUSTIVE)
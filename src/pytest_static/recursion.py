@@ -0,0 +1,129 @@
+"""Module containing the cycle detection used to expand recursive and forward referenced types to a bounded depth."""
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import ForwardRef
+from typing import TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+
+R = TypeVar("R")
+
+DEFAULT_MAX_DEPTH: int = 1
+
+
+class RecursionGuard:
+    """Tracks the annotations being expanded so that recursive types are cut off at a maximum depth.
+
+    Expanding an annotation inside its own expansion starts a new level, and levels deeper than max_depth expand to
+    nothing. Recursive types therefore need a non recursive alternative, such as None or a leaf type in a Union, to
+    have any instances. An annotation starting a level only depends on that level, so its result is memoized by
+    annotation and level and every subtree of a recursive schema is expanded once per level.
+
+    Annotations whose expansion reached an annotation already being expanded are remembered as recursive, since their
+    results depend on where they are nested, and are only cached on the registry when expanded outside of any other.
+    """
+
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH) -> None:
+        """Sets up an empty expansion stack."""
+        self.max_depth: int = max_depth
+        self.namespace: Mapping[str, Any] = {}
+        self.recursive_keys: set[Any] = set()
+        self._stack: list[tuple[Any, int]] = []
+        self._memo: dict[tuple[str, Any, int], Any] = {}
+
+    def clear(self) -> None:
+        """Forgets the recursive annotations and the memoized results."""
+        self.recursive_keys.clear()
+        self._memo.clear()
+
+    def is_cacheable(self, key: Any) -> bool:
+        """Returns whether results for key can be cached, which is when they do not depend on where key is nested."""
+        return not self._stack or key not in self.recursive_keys
+
+    def expand(self, kind: str, key: Any, compute: Callable[[], R], empty: R) -> R:
+        """Returns the result of compute() called with key on the expansion stack, or empty past the maximum depth.
+
+        Kind separates the memoized results of different computations, such as instances and counts, of one key.
+        """
+        level: int = self._stack[-1][1] if self._stack else 0
+        reentry: bool = key in self._iter_level_keys(level)
+        memo_key: tuple[str, Any, int] = (kind, key, level + 1)
+        if reentry:
+            self.recursive_keys.update(frame_key for frame_key, _ in self._stack)
+            if level + 1 > self.max_depth:
+                return empty
+            if memo_key in self._memo:
+                return self._memo[memo_key]  # type: ignore[no-any-return]
+            level += 1
+
+        self._stack.append((key, level))
+        try:
+            result: R = compute()
+        finally:
+            self._stack.pop()
+        if reentry:
+            self._memo[memo_key] = result
+        return result
+
+    def _iter_level_keys(self, level: int) -> Iterator[Any]:
+        for frame_key, frame_level in reversed(self._stack):
+            if frame_level != level:
+                return
+            yield frame_key
+
+    @contextmanager
+    def using_namespace(self, namespace: Mapping[str, Any]) -> Iterator[None]:
+        """Resolves forward references by name in namespace while the context is active."""
+        previous: Mapping[str, Any] = self.namespace
+        self.namespace = namespace
+        try:
+            yield
+        finally:
+            self.namespace = previous
+
+    def resolve(self, annotation: Any) -> Any:
+        """Returns the type a forward reference or string annotation refers to, or the annotation itself otherwise.
+
+        References are evaluated as expressions in the module they were declared in when known, then in the active
+        namespace, so that strings such as "list[Node]" resolve as well as plain and dotted names.
+        """
+        if isinstance(annotation, ForwardRef):
+            module: Any = sys.modules.get(getattr(annotation, "__forward_module__", None) or "")
+            namespace: Mapping[str, Any] = {**self.namespace, **vars(module)} if module else self.namespace
+            return _evaluate(annotation.__forward_arg__, namespace)
+        if isinstance(annotation, str):
+            return _evaluate(annotation, self.namespace)
+        return annotation
+
+    def normalize(self, annotation: Any) -> Any:
+        """Returns the cache key of an annotation, with the forward references in its type arguments resolved.
+
+        Annotations such as List["Item"] therefore get a different key in each module defining its own Item. References
+        that cannot be resolved in the active namespace are kept as they are.
+        """
+        from pytest_static.util import normalize_type
+
+        return normalize_type(annotation, self._resolve_or_keep)
+
+    def _resolve_or_keep(self, annotation: Any) -> Any:
+        try:
+            return self.resolve(annotation)
+        except TypeError:
+            return annotation
+
+
+def _evaluate(expression: str, namespace: Mapping[str, Any]) -> Any:
+    try:
+        return eval(expression, {}, namespace)  # noqa: S307
+    except (NameError, AttributeError, SyntaxError) as error:
+        raise TypeError(f"Failed to resolve the forward reference {expression!r}.") from error
@@ -0,0 +1,148 @@
+"""Module containing the cache of parametrize_types combinations that passed, used by --static-new-only."""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from pytest_static.ids import make_digest
+
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+RESULTS_CACHE_KEY: str = "pytest_static/results"
+COMBINATION_MARKER_NAME: str = "static_combination"
+RESULTS_PLUGIN_NAME: str = "pytest-static-results"
+RESULTS_KEY: pytest.StashKey[CombinationResults] = pytest.StashKey["CombinationResults"]()
+
+
+class CombinationResults:
+    """Plugin keeping the digests of the combinations of each parametrize_types test function that passed.
+
+    Passing combinations are remembered together with a source hash of the test function, its test module, the
+    conftest.py files between the root directory and the test module, the project modules the test module imports
+    from, directly or through other project modules, and the argument types and handlers generating its values. A
+    test function whose source hash changed starts over. A combination only counts as passed when every item
+    carrying it passed, so one failing among the items a stacked parametrize or a parametrized fixture adds to it
+    keeps the combination generated again.
+    """
+
+    def __init__(self, cache: pytest.Cache, root: Path) -> None:
+        """Loads the results of previous sessions from the pytest cache."""
+        self.cache: pytest.Cache = cache
+        self.root: Path = root
+        self.families: dict[str, dict[str, Any]] = cache.get(RESULTS_CACHE_KEY, {})
+        self.passed: dict[str, set[str]] = {}
+        self.failed: dict[str, set[str]] = {}
+        self.combinations: dict[str, tuple[str, str]] = {}
+        self._file_hashes: dict[str, str] = {}
+        self._imported_modules: dict[str, dict[str, ModuleType]] = {}
+
+    def start(self, family: str, source_hash: str) -> set[str]:
+        """Returns the digests of the combinations of family that passed with the same source hash."""
+        entry: dict[str, Any] = self.families.get(family, {})
+        passed: set[str] = set(entry.get("passed", ())) if entry.get("source") == source_hash else set()
+        self.families[family] = {"source": source_hash, "passed": []}
+        self.passed[family] = passed
+        self.failed[family] = set()
+        return passed
+
+    def get_source_hash(self, function: Any, module: ModuleType, *parts: str) -> str:
+        """Returns a digest of the source of function, the files of module and its conftests and imports, and parts."""
+        try:
+            source: str = inspect.getsource(function)
+        except (OSError, TypeError):
+            source = getattr(function, "__qualname__", repr(function))
+        digest: hashlib.blake2b = hashlib.blake2b(source.encode(), digest_size=8)
+        for path in sorted(self._iter_imported_files(module) | self._get_module_files(module)):
+            digest.update(f"{path}:{self._hash_file(path)}".encode())
+        digest.update("\n".join(parts).encode())
+        return digest.hexdigest()
+
+    def _iter_imported_files(self, module: ModuleType) -> set[str]:
+        files: set[str] = set()
+        seen: set[str] = {module.__name__}
+        pending: list[ModuleType] = [module]
+        while pending:
+            for path, imported in self._get_imported_modules(pending.pop()).items():
+                if imported.__name__ not in seen:
+                    seen.add(imported.__name__)
+                    files.add(path)
+                    pending.append(imported)
+        return files
+
+    def _get_module_files(self, module: ModuleType) -> set[str]:
+        """Returns the file of module and the conftest.py files found in its directory and the ones above it."""
+        path: str | None = getattr(module, "__file__", None)
+        if path is None:
+            return set()
+        files: set[str] = {path}
+        for directory in Path(path).parents:
+            if not directory.is_relative_to(self.root):
+                break
+            conftest: Path = directory / "conftest.py"
+            if conftest.is_file():
+                files.add(str(conftest))
+        return files
+
+    def _get_imported_modules(self, module: ModuleType) -> dict[str, ModuleType]:
+        """Returns the project modules that module imports or imports names from by file, found once per module."""
+        if module.__name__ not in self._imported_modules:
+            modules: dict[str, ModuleType] = {}
+            for value in vars(module).values():
+                source_module: Any = (
+                    value if inspect.ismodule(value) else sys.modules.get(getattr(value, "__module__", ""))
+                )
+                path: str | None = getattr(source_module, "__file__", None)
+                if path is not None and self._is_project_file(Path(path)):
+                    modules[path] = source_module
+            self._imported_modules[module.__name__] = modules
+        return self._imported_modules[module.__name__]
+
+    def _is_project_file(self, path: Path) -> bool:
+        return path.is_relative_to(self.root) and "site-packages" not in path.parts
+
+    def _hash_file(self, path: str) -> str:
+        if path not in self._file_hashes:
+            try:
+                self._file_hashes[path] = hashlib.blake2b(Path(path).read_bytes(), digest_size=8).hexdigest()
+            except OSError:
+                self._file_hashes[path] = ""
+        return self._file_hashes[path]
+
+    def pytest_runtest_setup(self, item: pytest.Item) -> None:
+        """Remembers which combination of which family item runs."""
+        marker: pytest.Mark | None = item.get_closest_marker(COMBINATION_MARKER_NAME)
+        if marker is not None:
+            self.combinations[item.nodeid] = marker.args
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Records passing calls and forgets combinations failing in any phase."""
+        combination: tuple[str, str] | None = self.combinations.get(report.nodeid)
+        if combination is None:
+            return
+        family, digest = combination
+        if report.failed:
+            self.failed[family].add(digest)
+            self.passed[family].discard(digest)
+        elif report.passed and report.when == "call" and digest not in self.failed[family]:
+            self.passed[family].add(digest)
+
+    def pytest_sessionfinish(self) -> None:
+        """Saves the combinations that passed to the pytest cache."""
+        for family, passed in self.passed.items():
+            self.families[family]["passed"] = sorted(passed)
+        self.cache.set(RESULTS_CACHE_KEY, self.families)
+
+
+def make_combination_digest(combination: tuple[int, ...]) -> str:
+    """Returns a digest identifying a combination of value indices within its test function."""
+    return make_digest(",".join(map(str, combination)))
@@ -0,0 +1,68 @@
+"""Module containing the on-disk store that keeps expanded parameter tables between pytest sessions."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pytest_static.type_sets import PROFILES
+from pytest_static.type_sets import get_instance_sets_digest
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+STORE_DIR: str = "pytest_static"
+STORE_VERSION: int = 1
+TYPE_SETS_DIGEST: str = hashlib.blake2b(
+    repr([(name, get_instance_sets_digest(instance_sets)) for name, instance_sets in PROFILES.items()]).encode(),
+    digest_size=8,
+).hexdigest()
+
+
+class ParameterStore:
+    """Pickle files of expanded parameter tables, keyed by a digest of the key and the type sets of every profile.
+
+    Values that cannot be pickled are skipped and unreadable entries are treated as missing, so the store never
+    changes what is generated, only how fast.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Stores the directory the entries are kept in."""
+        self.path: Path = path
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value stored for key, or default when there is none."""
+        try:
+            with self._get_path(key).open("rb") as file:
+                return pickle.load(file)  # noqa: S301
+        except Exception:  # noqa: BLE001
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores the value for key, replacing any previous entry atomically."""
+        try:
+            data: bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # noqa: BLE001
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        Path(temporary).replace(self._get_path(key))
+
+    def clear(self) -> None:
+        """Removes every stored entry."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _get_path(self, key: Hashable) -> Path:
+        digest: str = hashlib.blake2b(repr((STORE_VERSION, TYPE_SETS_DIGEST, key)).encode(), digest_size=16).hexdigest()
+        return self.path / f"{digest}.pickle"
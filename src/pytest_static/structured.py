@@ -0,0 +1,78 @@
+"""Module containing the field introspection used to generate dataclass, NamedTuple, TypedDict and attrs instances."""
+
+from __future__ import annotations
+
+import dataclasses
+from functools import lru_cache
+from typing import Any
+from typing import NamedTuple
+from typing import get_type_hints
+
+from typing_extensions import is_typeddict
+
+
+class StructuredField(NamedTuple):
+    """A field passed to a structured type's constructor by keyword."""
+
+    name: str
+    type: Any
+    has_default: bool
+
+
+@lru_cache(maxsize=None)
+def get_structured_fields(cls: Any) -> tuple[StructuredField, ...] | None:
+    """Returns the constructor fields of a dataclass, NamedTuple, TypedDict or attrs class, resolved once per class.
+
+    Returns None for any other type.
+    """
+    if not isinstance(cls, type):
+        return None
+    if dataclasses.is_dataclass(cls):
+        hints: dict[str, Any] = _get_type_hints(cls)
+        return tuple(
+            StructuredField(field.name, hints.get(field.name, field.type), _has_dataclass_default(field))
+            for field in dataclasses.fields(cls)
+            if field.init
+        )
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        hints = _get_type_hints(cls)
+        defaults: dict[str, Any] = getattr(cls, "_field_defaults", {})
+        return tuple(StructuredField(name, hints.get(name, Any), name in defaults) for name in cls._fields)
+    if is_typeddict(cls):
+        hints = _get_type_hints(cls)
+        optional: frozenset[str] = getattr(cls, "__optional_keys__", frozenset())
+        return tuple(StructuredField(name, hint, name in optional) for name, hint in hints.items())
+    attributes: Any = getattr(cls, "__attrs_attrs__", None)
+    if attributes is not None:
+        hints = _get_type_hints(cls)
+        return tuple(
+            StructuredField(
+                attribute.alias if getattr(attribute, "alias", None) else attribute.name.lstrip("_"),
+                hints.get(attribute.name, attribute.type if attribute.type is not None else Any),
+                attribute.default is not _get_attrs_nothing(),
+            )
+            for attribute in attributes
+            if attribute.init
+        )
+    return None
+
+
+def construct_structured(cls: Any, names: tuple[str, ...], *values: Any) -> Any:
+    """Returns cls called with each value passed as the keyword of the same position in names."""
+    return cls(**dict(zip(names, values)))
+
+
+def _get_type_hints(cls: type[Any]) -> dict[str, Any]:
+    """Returns the class's type hints, resolving references to the class itself even when it is not module level."""
+    return get_type_hints(cls, localns={cls.__name__: cls})
+
+
+def _has_dataclass_default(field: dataclasses.Field[Any]) -> bool:
+    return field.default is not dataclasses.MISSING or field.default_factory is not dataclasses.MISSING
+
+
+def _get_attrs_nothing() -> Any:
+    """Returns the attrs sentinel for attributes without a default, which only exists when attrs is installed."""
+    import attr
+
+    return attr.NOTHING
@@ -2,27 +2,72 @@
 
 from __future__ import annotations
 
+import abc
+import hashlib
+import inspect
 import types
+from contextlib import contextmanager
 from dataclasses import MISSING
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
+from typing import NamedTuple
+from typing import TypeVar
 from typing import get_args
 
+from pytest_static.cache import DEFAULT_CACHE_SIZE
+from pytest_static.cache import LRUCache
+from pytest_static.profiles import STANDARD
+from pytest_static.recursion import RecursionGuard
+from pytest_static.structured import get_structured_fields
+from pytest_static.type_sets import PROFILES
+from pytest_static.util import describe_callable
 from pytest_static.util import get_base_type
+from pytest_static.util import has_own_annotations
+from pytest_static.util import is_async_handler
 
 
 if TYPE_CHECKING:
-    from pytest_static.custom_typing import TypeHandler
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from pytest_static.custom_typing import AnyTypeHandler
+    from pytest_static.custom_typing import InstanceCounter
+    from pytest_static.custom_typing import InstanceSet
+    from pytest_static.plan import Plan
+    from pytest_static.store import ParameterStore
+
+
+H = TypeVar("H", bound="AnyTypeHandler")
+
+
+class RegistrySnapshot(NamedTuple):
+    """The registrations of a TypeHandlerRegistry at one point in time."""
+
+    mapping: dict[Any, list[AnyTypeHandler]]
+    counters: dict[AnyTypeHandler, InstanceCounter]
+    uninherited: set[AnyTypeHandler]
 
 
 class TypeHandlerRegistry:
     """Registry for various TypeHandler callbacks."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
         """Sets up the Registry."""
-        self._mapping: dict[Any, list[TypeHandler]] = {}
-        self._proxy: types.MappingProxyType[Any, list[TypeHandler]] = types.MappingProxyType(self._mapping)
+        self._mapping: dict[Any, list[AnyTypeHandler]] = {}
+        self._proxy: types.MappingProxyType[Any, list[AnyTypeHandler]] = types.MappingProxyType(self._mapping)
+        self._counters: dict[AnyTypeHandler, InstanceCounter] = {}
+        self._uninherited: set[AnyTypeHandler] = set()
+        self.cache_size: int = cache_size
+        self.instance_cache: LRUCache[Any, tuple[Any, ...]] = LRUCache(maxsize=cache_size)
+        self.plan_cache: LRUCache[Any, Plan] = LRUCache(maxsize=cache_size)
+        self.profile: str = STANDARD
+        self.instance_sets: Mapping[Any, InstanceSet[Any]] = PROFILES[STANDARD]
+        self._profile_caches: dict[str, tuple[LRUCache[Any, tuple[Any, ...]], LRUCache[Any, Plan]]] = {}
+        self.store: ParameterStore | None = None
+        self._fingerprint: str | None = None
+        self._resolved: dict[Any, list[AnyTypeHandler] | None] = {}
+        self.recursion: RecursionGuard = RecursionGuard()
 
     @classmethod
     def _validate_has_no_generic(cls, typ: Any) -> None:
@@ -31,16 +76,34 @@ class TypeHandlerRegistry:
             raise TypeError(f"Cannot register a type handler type containing generics: {typ}")
 
     def __getitem__(self, key: Any) -> Any:
-        """Returns from proxy."""
-        return self._proxy.__getitem__(key)
+        """Returns the handlers for key, resolved the same way as get."""
+        handlers: Any = self.get(key, MISSING)
+        if handlers is MISSING:
+            raise KeyError(key)
+        return handlers
 
     def get(self, key: Any, default: Any = None, /) -> Any:
-        """Returns from proxy."""
-        return self._proxy.get(key, default)
+        """Returns the handlers registered for key or, for an unregistered class, for its nearest registered base.
+
+        Registered metaclasses are looked up first, then bases along the MRO and then among registered ABCs, which
+        also covers virtual subclasses. Resolved lookups are kept in a table that is rebuilt whenever the registrations
+        change.
+        """
+        handlers: Any = self._proxy.get(key, MISSING)
+        if handlers is MISSING:
+            handlers = self._resolved.get(key, MISSING)
+        if handlers is MISSING:
+            handlers = self._resolved[key] = self._resolve(key)
+        return default if handlers is None else handlers
 
-    def register(self, *args: Any) -> Callable[[TypeHandler], TypeHandler]:
+    def register(self, *args: Any, counter: InstanceCounter | None = None, inherited: bool = True) -> Callable[[H], H]:
         """Returns a decorator that registers a Callback to each of the provided keys.
 
+        The optional counter receives the same arguments as the handler and returns how many instances the handler
+        would yield, which lets count_instances size the type without running the handler. Handlers may also be async
+        generators, which the plugin runs concurrently during collection. Unregistered subclasses of the keys reuse the
+        handler unless inherited is False, as for handlers constructing the key type itself rather than its subclass.
+
         Usage:
             @type_handlers.register(int)
             def my_function_name(base_type, type_args):
@@ -53,21 +116,151 @@ class TypeHandlerRegistry:
 
             type_handlers.get_instances(int) => (100, 1000, 1, 2, 3, 4, 5)
             type_handlers.get_instances(float) => (1.0, 2.0, 3.0, 4.0, 5.0)
+
+            @type_handlers.register(int, counter=lambda base_type, type_args: 2)
+            def my_function_name(base_type, type_args):
+                yield from [100, 1000]
+
+            @type_handlers.register(Corpus)
+            async def my_function_name(base_type, type_args):
+                async for sample in load_samples():
+                    yield sample
         """
         for arg in args:
             self._validate_has_no_generic(arg)
 
-        def decorator(fn: TypeHandler) -> TypeHandler:
+        def decorator(fn: H) -> H:
             for key in args:
                 base_type: Any = get_base_type(key)
                 if self._proxy.get(base_type, MISSING) == MISSING:
                     self._mapping[base_type] = []
                 self._mapping[base_type].append(fn)
+            if counter is not None:
+                self._counters[fn] = counter
+            if not inherited:
+                self._uninherited.add(fn)
+            self._invalidate()
             return fn
 
         return decorator
 
+    def has_async_handlers(self) -> bool:
+        """Returns whether any registered handler is an async generator function."""
+        return any(is_async_handler(handler) for handlers in self._mapping.values() for handler in handlers)
+
+    def get_counter(self, handler: AnyTypeHandler) -> InstanceCounter | None:
+        """Returns the counter registered alongside the handler, if any."""
+        return self._counters.get(handler)
+
+    def _resolve(self, key: Any) -> list[AnyTypeHandler] | None:
+        """Returns the inherited handlers of the nearest registered base of an unregistered class, if any.
+
+        A registered metaclass, such as EnumMeta, takes priority over the bases so that mixins like int in IntEnum
+        do not shadow it. Structured classes and classes declaring their own annotated fields are described by their
+        fields rather than by their bases, so they are left to the fallback methods. Handlers registered with
+        inherited=False, like the collection and tuple handlers, are skipped since they would yield the base type.
+        """
+        if not isinstance(key, type):
+            return None
+        for metaclass in inspect.getmro(type(key)):
+            if metaclass is type:
+                break
+            if metaclass in self._mapping:
+                return self._mapping[metaclass]
+        if has_own_annotations(key) or get_structured_fields(key) is not None:
+            return None
+        abcs: list[Any] = [
+            registered
+            for registered in self._mapping
+            if issubclass(type(registered), abc.ABCMeta) and issubclass(key, registered)
+        ]
+        for base in (*key.__mro__[1:], *abcs):
+            handlers: list[AnyTypeHandler] | None = self._get_inherited(base)
+            if handlers is not None:
+                return handlers
+        return None
+
+    def _get_inherited(self, key: Any) -> list[AnyTypeHandler] | None:
+        """Returns the handlers registered for key that subclasses may reuse, or None if there are none."""
+        handlers: list[AnyTypeHandler] = [
+            handler for handler in self._mapping.get(key, ()) if handler not in self._uninherited
+        ]
+        return handlers or None
+
+    def fingerprint(self) -> str:
+        """Returns a digest of the registered handlers' names and source code, used to key persisted results."""
+        if self._fingerprint is None:
+            descriptions: list[str] = [
+                f"{key!r}: {[describe_callable(handler) for handler in handlers]}"
+                for key, handlers in self._mapping.items()
+            ]
+            descriptions.append(f"profile: {self.profile}")
+            self._fingerprint = hashlib.blake2b("\n".join(descriptions).encode(), digest_size=8).hexdigest()
+        return self._fingerprint
+
     def clear(self, typ: Any) -> None:
         """Clears all handlers from the provided typ."""
         if self._mapping.get(typ, None) is not None:
             self._mapping[typ] = []
+        self._invalidate()
+
+    def snapshot(self) -> RegistrySnapshot:
+        """Returns a copy of the current registrations that restore can later return the registry to."""
+        return RegistrySnapshot(
+            mapping={key: list(handlers) for key, handlers in self._mapping.items()},
+            counters=dict(self._counters),
+            uninherited=set(self._uninherited),
+        )
+
+    def restore(self, snapshot: RegistrySnapshot) -> None:
+        """Replaces the current registrations with the ones recorded by snapshot."""
+        self._mapping.clear()
+        self._mapping.update({key: list(handlers) for key, handlers in snapshot.mapping.items()})
+        self._counters = dict(snapshot.counters)
+        self._uninherited = set(snapshot.uninherited)
+        self._invalidate()
+
+    def set_max_depth(self, max_depth: int) -> None:
+        """Sets how many times a recursive type may be nested in itself, dropping results expanded to another depth."""
+        if max_depth != self.recursion.max_depth:
+            self.recursion.max_depth = max_depth
+            self._invalidate()
+
+    def set_profile(self, profile: str) -> None:
+        """Selects the named instance sets used by the built-in handlers of basic types, see type_sets.PROFILES.
+
+        The results cached for the previous profile are kept aside, so switching back to it does not expand every
+        type again.
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile {profile!r}. Expected one of {', '.join(PROFILES)}.")
+        if profile == self.profile:
+            return
+        self._profile_caches[self.profile] = (self.instance_cache, self.plan_cache)
+        self.instance_cache, self.plan_cache = self._profile_caches.pop(
+            profile, (LRUCache(maxsize=self.cache_size), LRUCache(maxsize=self.cache_size))
+        )
+        self.profile = profile
+        self.instance_sets = PROFILES[profile]
+        self.recursion.clear()
+        self._fingerprint = None
+
+    @contextmanager
+    def using_profile(self, profile: str | None) -> Iterator[None]:
+        """Selects a profile while the context is active, or keeps the current one when profile is None."""
+        previous: str = self.profile
+        if profile is not None:
+            self.set_profile(profile)
+        try:
+            yield
+        finally:
+            self.set_profile(previous)
+
+    def _invalidate(self) -> None:
+        """Drops every cached result derived from the registered handlers."""
+        self.instance_cache.clear()
+        self.plan_cache.clear()
+        self._profile_caches.clear()
+        self._fingerprint = None
+        self._resolved.clear()
+        self.recursion.clear()
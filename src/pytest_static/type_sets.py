@@ -1,19 +1,30 @@
-"""Default type sets for pytest_static to use in parametrization."""
+"""Default type sets for pytest_static to use in parametrization.
 
+Every set is an InstanceSet so that instances keep their declaration order in every process. The sets are grouped in
+profiles of increasing size, smoke, standard and exhaustive, with standard being the default one.
+"""
+
+import hashlib
 import string
+import sys
 from collections.abc import Mapping
 from types import MappingProxyType
 from typing import Any
 from typing import TypeVar
 
+from pytest_static.custom_typing import InstanceSet
+from pytest_static.profiles import EXHAUSTIVE
+from pytest_static.profiles import SMOKE
+from pytest_static.profiles import STANDARD
+
 
 T = TypeVar("T", bound=Any)
 
 
-BOOL_PARAMS: frozenset[bool] = frozenset({True, False})
+BOOL_PARAMS: InstanceSet[bool] = InstanceSet((True, False))
 
-INT_PARAMS: frozenset[int] = frozenset(
-    {
+INT_PARAMS: InstanceSet[int] = InstanceSet(
+    (
         0,
         1,
         -1,
@@ -23,27 +34,27 @@ INT_PARAMS: frozenset[int] = frozenset(
         -2147483648,
         9223372036854775807,
         -9223372036854775808,
-    }
+    )
 )
 
-WHITESPACE: frozenset[str] = frozenset(string.whitespace)
-PUNCTUATION: frozenset[str] = frozenset(string.punctuation)
-DIGITS: frozenset[str] = frozenset(string.digits)
-LOWERCASE_LETTERS: frozenset[str] = frozenset(string.ascii_lowercase)
-UPPERCASE_LETTERS: frozenset[str] = frozenset(string.ascii_uppercase)
-UNICODE_CHARS: frozenset[str] = frozenset(
-    {
+WHITESPACE: InstanceSet[str] = InstanceSet(string.whitespace)
+PUNCTUATION: InstanceSet[str] = InstanceSet(string.punctuation)
+DIGITS: InstanceSet[str] = InstanceSet(string.digits)
+LOWERCASE_LETTERS: InstanceSet[str] = InstanceSet(string.ascii_lowercase)
+UPPERCASE_LETTERS: InstanceSet[str] = InstanceSet(string.ascii_uppercase)
+UNICODE_CHARS: InstanceSet[str] = InstanceSet(
+    (
         "\u00e9",
         "\u00f1",
         "\u2603",
         "\u00a9",
         "\u00ae",
         "\U0001f600",
-    }
+    )
 )
-FOREIGN_CHARS: frozenset[str] = frozenset({"Д", "д", "ב", "ע", "α", "Ω", "い", "ろ", "は", "我", "们"})  # noqa: RUF001
-ESCAPE_SEQUENCES: frozenset[str] = frozenset(
-    {
+FOREIGN_CHARS: InstanceSet[str] = InstanceSet(("Д", "д", "ב", "ע", "α", "Ω", "い", "ろ", "は", "我", "们"))  # noqa: RUF001
+ESCAPE_SEQUENCES: InstanceSet[str] = InstanceSet(
+    (
         "\\\\",
         "\\'",
         '\\"',
@@ -52,12 +63,12 @@ ESCAPE_SEQUENCES: frozenset[str] = frozenset(
         "\\t",
         "\\x00",
         "\\x7F",
-    }
+    )
 )
-TRIPLE_QUOTES: frozenset[str] = frozenset({'"""', "'''"})
+TRIPLE_QUOTES: InstanceSet[str] = InstanceSet(('"""', "'''"))
 
-STR_PARAMS: frozenset[str] = frozenset(
-    {
+STR_PARAMS: InstanceSet[str] = InstanceSet(
+    (
         "",
         *WHITESPACE,
         *PUNCTUATION,
@@ -68,11 +79,11 @@ STR_PARAMS: frozenset[str] = frozenset(
         *FOREIGN_CHARS,
         *ESCAPE_SEQUENCES,
         *TRIPLE_QUOTES,
-    }
+    )
 )
 
-FLOAT_PARAMS: frozenset[float] = frozenset(
-    {
+FLOAT_PARAMS: InstanceSet[float] = InstanceSet(
+    (
         0.0,
         -0.0,
         1.0,
@@ -84,11 +95,11 @@ FLOAT_PARAMS: frozenset[float] = frozenset(
         float("inf"),
         -float("inf"),
         float("nan"),
-    }
+    )
 )
 
-COMPLEX_PARAMS: frozenset[complex] = frozenset(
-    {
+COMPLEX_PARAMS: InstanceSet[complex] = InstanceSet(
+    (
         0j,
         1j,
         -1j,
@@ -102,11 +113,11 @@ COMPLEX_PARAMS: frozenset[complex] = frozenset(
         (-1e-10 - 1e-10j),
         (1e10 + 1e10j),
         (-1e10 - 1e10j),
-    }
+    )
 )
 
-BYTES_PARAMS: frozenset[bytes] = frozenset(
-    {
+BYTES_PARAMS: InstanceSet[bytes] = InstanceSet(
+    (
         b"",
         b"\x00",
         b"\xff",
@@ -134,18 +145,121 @@ BYTES_PARAMS: frozenset[bytes] = frozenset(
         b"Z",
         b"\x80",
         b"\xfe",
-    }
+    )
 )
 
 
-_default_instance_sets: dict[Any, set[Any]] = {
-    bool: set(BOOL_PARAMS),
-    int: set(INT_PARAMS),
-    float: set(FLOAT_PARAMS),
-    complex: set(COMPLEX_PARAMS),
-    str: set(STR_PARAMS),
-    bytes: set(BYTES_PARAMS),
-    type(None): {None},
+_default_instance_sets: dict[Any, InstanceSet[Any]] = {
+    bool: BOOL_PARAMS,
+    int: INT_PARAMS,
+    float: FLOAT_PARAMS,
+    complex: COMPLEX_PARAMS,
+    str: STR_PARAMS,
+    bytes: BYTES_PARAMS,
+    type(None): InstanceSet((None,)),
 }
 
-DEFAULT_INSTANCE_SETS: Mapping[Any, set[Any]] = MappingProxyType(_default_instance_sets)
+DEFAULT_INSTANCE_SETS: Mapping[Any, InstanceSet[Any]] = MappingProxyType(_default_instance_sets)
+
+
+SMOKE_INSTANCE_SETS: Mapping[Any, InstanceSet[Any]] = MappingProxyType(
+    {
+        bool: BOOL_PARAMS,
+        int: InstanceSet((0, 1, -1, 9223372036854775807)),
+        float: InstanceSet((0.0, 1.0, -1.0, float("inf"), float("nan"))),
+        complex: InstanceSet((0j, 1 + 1j)),
+        str: InstanceSet(("", "a", " ", "\u00e9")),
+        bytes: InstanceSet((b"", b"\x00", b"a")),
+        type(None): InstanceSet((None,)),
+    }
+)
+
+EXHAUSTIVE_INSTANCE_SETS: Mapping[Any, InstanceSet[Any]] = MappingProxyType(
+    {
+        bool: BOOL_PARAMS,
+        int: InstanceSet(
+            (
+                *INT_PARAMS,
+                *(boundary for bits in (8, 16, 32, 64) for boundary in (2 ** (bits - 1), 2**bits - 1, 2**bits)),
+                -129,
+                -32769,
+                -2147483649,
+                -9223372036854775809,
+                sys.maxsize,
+                2**53,
+                2**53 + 1,
+                10**100,
+            )
+        ),
+        float: InstanceSet(
+            (
+                *FLOAT_PARAMS,
+                0.1,
+                1 / 3,
+                0.5,
+                2.0**53,
+                2.0**53 + 2,
+                sys.float_info.max,
+                -sys.float_info.max,
+                sys.float_info.min,
+                sys.float_info.epsilon,
+                5e-324,
+                -5e-324,
+            )
+        ),
+        complex: InstanceSet(
+            (
+                *COMPLEX_PARAMS,
+                complex(float("inf"), 0),
+                complex(0, float("inf")),
+                complex(float("nan"), 0),
+                complex(sys.float_info.max, sys.float_info.max),
+            )
+        ),
+        str: InstanceSet(
+            (
+                *STR_PARAMS,
+                "\x00",
+                "\r\n",
+                "\u200b",
+                "\ufeff",
+                "e\u0301",
+                "\u202e",
+                "\U0001f468\u200d\U0001f469\u200d\U0001f467",
+                " leading",
+                "trailing ",
+                "null",
+                "None",
+                "True",
+                "0",
+                "-1",
+                "1e309",
+                "NaN",
+                "a" * 1024,
+                "\u00e9" * 1024,
+            )
+        ),
+        bytes: InstanceSet(
+            (
+                *BYTES_PARAMS,
+                b"\xef\xbb\xbf",
+                b"\xc3\x28",
+                b"\xed\xa0\x80",
+                b"\x00" * 16,
+                bytes(range(256)),
+                b"a" * 1024,
+            )
+        ),
+        type(None): InstanceSet((None,)),
+    }
+)
+
+PROFILES: Mapping[str, Mapping[Any, InstanceSet[Any]]] = MappingProxyType(
+    {SMOKE: SMOKE_INSTANCE_SETS, STANDARD: DEFAULT_INSTANCE_SETS, EXHAUSTIVE: EXHAUSTIVE_INSTANCE_SETS}
+)
+
+
+def get_instance_sets_digest(instance_sets: Mapping[Any, InstanceSet[Any]]) -> str:
+    """Returns a digest of the types and values of instance sets, used to key persisted results."""
+    values: list[tuple[str, tuple[Any, ...]]] = sorted((repr(k), tuple(v)) for k, v in instance_sets.items())
+    return hashlib.blake2b(repr(values).encode(), digest_size=8).hexdigest()
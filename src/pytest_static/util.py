@@ -1,8 +1,26 @@
 """Module containing various utility functions used throughout the pytest-static package."""
 
+import copy
+import hashlib
+import inspect
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from enum import Enum
+from functools import partial
 from typing import Any
+from typing import Callable
+from typing import ForwardRef
+from typing import Optional
+from typing import Union
+from typing import get_args
 from typing import get_origin
 
+from typing_extensions import Literal
+
+
+_IMMUTABLE_TYPES: tuple[type[Any], ...] = (type(None), bool, int, float, complex, str, bytes, range, type, Enum)
+
 
 def get_base_type(typ: Any) -> Any:
     """Returns get_origin if not None, otherwise returns the given type."""
@@ -10,3 +28,131 @@ def get_base_type(typ: Any) -> Any:
     if origin is not None:
         return origin
     return typ
+
+
+def normalize_type(typ: Any, resolve: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Returns a key that compares equal for equivalent annotations such as List[int] and list[int].
+
+    When resolve is provided, forward references and string annotations are replaced by what resolve returns for
+    them, without resolving the references found in that result, so that the key is finite for recursive aliases.
+    """
+    if resolve is not None and isinstance(typ, (ForwardRef, str)):
+        return normalize_type(resolve(typ))
+    if isinstance(typ, list):
+        return tuple(normalize_type(arg, resolve) for arg in typ)
+
+    base_type: Any = get_base_type(typ)
+    type_args: tuple[Any, ...] = get_args(typ)
+    if not type_args:
+        return base_type
+    if base_type is Literal:
+        # Literal[1] and Literal[True] hash and compare equal unless their value types are kept.
+        return base_type, tuple((type(arg), arg) for arg in type_args)
+    return base_type, tuple(normalize_type(arg, resolve) for arg in type_args)
+
+
+def iter_unique_instances(instances: Iterable[Any]) -> Iterator[Any]:
+    """Yields the instances that are not equal to an earlier instance of the same type, see UniqueInstances."""
+    yield from filter(UniqueInstances().add, instances)
+
+
+class UniqueInstances:
+    """Remembers instances so that those equal to an earlier instance of the same type can be left out.
+
+    Types are compared recursively inside lists, tuples, sets and dicts, so 1 and True or [1] and [True] are both
+    kept while a second 1 is not. Instances that cannot be hashed are compared with the earlier unhashable instances
+    of their type.
+    """
+
+    def __init__(self) -> None:
+        """Sets up empty tables of the instances seen."""
+        self.seen: set[Any] = set()
+        self.unhashable: dict[type[Any], list[Any]] = {}
+
+    def add(self, instance: Any) -> bool:
+        """Remembers the instance and returns whether it is not equal to an earlier one."""
+        try:
+            key: Any = _make_typed_key(instance)
+            if key in self.seen:
+                return False
+            self.seen.add(key)
+        except TypeError:
+            earlier: list[Any] = self.unhashable.setdefault(type(instance), [])
+            if any(instance == other for other in earlier):
+                return False
+            earlier.append(instance)
+        return True
+
+
+def _make_typed_key(instance: Any) -> Any:
+    if isinstance(instance, (list, tuple)):
+        return type(instance), tuple(map(_make_typed_key, instance))
+    if isinstance(instance, (set, frozenset)):
+        return type(instance), frozenset(map(_make_typed_key, instance))
+    if isinstance(instance, dict):
+        return type(instance), frozenset((_make_typed_key(k), _make_typed_key(v)) for k, v in instance.items())
+    return type(instance), instance
+
+
+def is_immutable(value: Any) -> bool:
+    """Returns whether value is known to be immutable: a scalar, type, enum member, or tuple or frozenset of these."""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(map(is_immutable, value))
+    return False
+
+
+def copy_mutable(value: Any) -> Any:
+    """Returns a deep copy of value unless it is immutable, or value itself when it cannot be copied."""
+    if is_immutable(value):
+        return value
+    try:
+        return copy.deepcopy(value)
+    except Exception:  # noqa: BLE001
+        return value
+
+
+def copy_mutable_instances(instances: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Returns the instances with deep copies of the mutable ones, or the same tuple when none of them are mutable."""
+    if all(map(is_immutable, instances)):
+        return instances
+    return tuple(map(copy_mutable, instances))
+
+
+def describe_callable(fn: Any) -> str:
+    """Returns a description of a callable that changes whenever its name or source code changes."""
+    if isinstance(fn, partial):
+        keywords: str = ", ".join(f"{k}={describe_callable(v)}" for k, v in sorted(fn.keywords.items()))
+        return f"partial({describe_callable(fn.func)}, {keywords})"
+    name: str = f"{getattr(fn, '__module__', None)}.{getattr(fn, '__qualname__', repr(fn))}"
+    try:
+        source: bytes = inspect.getsource(fn).encode()
+    except (OSError, TypeError):
+        source = getattr(getattr(fn, "__code__", None), "co_code", b"")
+    return f"{name}:{hashlib.blake2b(source, digest_size=8).hexdigest()}"
+
+
+def has_own_annotations(cls: type[Any]) -> bool:
+    """Returns whether the class body itself declares annotated attributes."""
+    namespace: Any = vars(cls)
+    return bool(namespace.get("__annotations__") or namespace.get("__annotate__"))
+
+
+def is_async_handler(handler: Any) -> bool:
+    """Returns whether a handler, or the function a partial handler wraps, is an async generator function."""
+    return inspect.isasyncgenfunction(handler.func if isinstance(handler, partial) else handler)
+
+
+def iter_handler_results(results: Union[Iterable[Any], AsyncIterator[Any]]) -> Iterable[Any]:
+    """Returns the values yielded by a handler, running an async generator to completion on its own event loop."""
+    if isinstance(results, AsyncIterator):
+        import asyncio
+
+        return asyncio.run(collect_async(results))
+    return results
+
+
+async def collect_async(results: AsyncIterator[Any]) -> list[Any]:
+    """Returns every value yielded by an async iterator."""
+    return [value async for value in results]
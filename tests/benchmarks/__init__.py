@@ -0,0 +1 @@
+"""Benchmark suite for the pytest_static package."""
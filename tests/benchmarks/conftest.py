@@ -0,0 +1,30 @@
+"""Fixtures used in benchmarks.
+
+The benchmarks require pytest-benchmark and are only collected when it is installed, see the "benchmarks" nox session.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.pytester import Pytester
+
+
+collect_ignore_glob: list[str] = [] if importlib.util.find_spec("pytest_benchmark") else ["test_*.py"]
+
+
+@pytest.fixture
+def conftest(pytester: Pytester) -> Path:
+    return pytester.makeconftest(
+        """
+        import pytest
+        pytest_plugins = ["pytest_static.plugin"]
+        """
+    )
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_static.parametric import type_handlers
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.pytester import Pytester
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+# Collecting a case peaks at about 4 KiB in both modes, mostly for the test item itself.
+PEAK_MEMORY_BUDGET_PER_CASE: int = 8 * 1024
+
+MARKED_TEST_TEMPLATE: str = """
+@pytest.mark.parametrize_types("a, b", [Optional[int], bool])
+def test_func_{index}(a, b) -> None:
+    pass
+"""
+
+
+def _make_marked_module(pytester: Pytester, marker_count: int) -> Path:
+    tests: str = "".join(MARKED_TEST_TEMPLATE.format(index=index) for index in range(marker_count))
+    return pytester.makepyfile(f"import pytest\nfrom typing import *\n{tests}")
+
+
+@pytest.mark.parametrize("marker_count", [1, 10, 100])
+def test_collect_marked_module(
+    benchmark: BenchmarkFixture, pytester: Pytester, conftest: Path, marker_count: int
+) -> None:
+    benchmark.group = "collection"
+    test_path: Path = _make_marked_module(pytester, marker_count)
+
+    def setup() -> None:
+        type_handlers.instance_cache.clear()
+        type_handlers.plan_cache.clear()
+
+    result: pytest.RunResult = benchmark.pedantic(
+        pytester.runpytest, args=(test_path, "--collect-only", "-q"), setup=setup, rounds=5
+    )
+    assert result.ret == pytest.ExitCode.OK
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_parametrize_types_peak_memory(
+    benchmark: BenchmarkFixture, pytester: Pytester, conftest: Path, lazy: bool
+) -> None:
+    """Checks the peak memory traced while parametrize_types expands a large product during collection."""
+    benchmark.group = "parametrize-types-memory"
+    test_path: Path = pytester.makepyfile(
+        f"""
+        import pytest
+        from typing import *
+
+        @pytest.mark.parametrize_types("a, b", [List[int], Dict[str, bool]], lazy={lazy})
+        def test_func(a, b) -> None:
+            pass
+        """
+    )
+    type_handlers.instance_cache.clear()
+    type_handlers.plan_cache.clear()
+
+    def collect() -> tuple[int, int]:
+        tracemalloc.start()
+        try:
+            items: list[pytest.Item] = pytester.inline_genitems(test_path)[0]
+            return len(items), tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    cases, peak = benchmark.pedantic(collect, rounds=1)
+    benchmark.extra_info["peak_memory_bytes"] = peak
+    benchmark.extra_info["peak_memory_bytes_per_case"] = peak // cases
+    assert peak < cases * PEAK_MEMORY_BUDGET_PER_CASE
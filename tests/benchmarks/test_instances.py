@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Literal
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+import pytest
+
+from pytest_static.parametric import get_all_possible_type_instances
+from pytest_static.parametric import type_handlers
+
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def _clear_caches() -> None:
+    type_handlers.instance_cache.clear()
+    type_handlers.plan_cache.clear()
+
+
+def _expand(typ: Any) -> tuple[Any, ...]:
+    return get_all_possible_type_instances(typ)
+
+
+LEAF_TYPES: list[Any] = [bool, int, float, complex, str, bytes, type(None), Literal[1, 2, 3]]
+NESTED_CONTAINER_TYPES: list[Any] = [
+    List[int],
+    Dict[str, List[int]],
+    Tuple[bool, Set[str], Optional[int]],
+    List[Dict[str, Tuple[bool, int]]],
+]
+UNION_TYPES: list[Any] = [
+    Optional[int],
+    Union[int, str, bytes],
+    Union[List[int], Dict[str, bool], None],
+]
+
+
+def make_pair(a: bool, b: Optional[int]) -> tuple[bool, Optional[int]]:
+    return a, b
+
+
+def make_point(x: int, y: int, label: Optional[str]) -> tuple[int, int, Optional[str]]:
+    return x, y, label
+
+
+CALLABLE_TYPES: list[Any] = [make_pair, make_point]
+
+
+@pytest.mark.parametrize("typ", LEAF_TYPES, ids=repr)
+def test_leaf_types(benchmark: BenchmarkFixture, typ: Any) -> None:
+    benchmark.group = "leaf"
+    benchmark.pedantic(_expand, args=(typ,), setup=_clear_caches, rounds=100)
+
+
+@pytest.mark.parametrize("typ", NESTED_CONTAINER_TYPES, ids=repr)
+def test_nested_container_types(benchmark: BenchmarkFixture, typ: Any) -> None:
+    benchmark.group = "nested-containers"
+    benchmark.pedantic(_expand, args=(typ,), setup=_clear_caches, rounds=20)
+
+
+@pytest.mark.parametrize("typ", UNION_TYPES, ids=repr)
+def test_union_types(benchmark: BenchmarkFixture, typ: Any) -> None:
+    benchmark.group = "unions"
+    benchmark.pedantic(_expand, args=(typ,), setup=_clear_caches, rounds=20)
+
+
+@pytest.mark.parametrize("typ", CALLABLE_TYPES, ids=repr)
+def test_callable_types(benchmark: BenchmarkFixture, typ: Any) -> None:
+    benchmark.group = "callables"
+    benchmark.pedantic(_expand, args=(typ,), setup=_clear_caches, rounds=20)
+
+
+def test_cached_lookup(benchmark: BenchmarkFixture) -> None:
+    benchmark.group = "leaf"
+    _expand(Dict[str, List[int]])
+    benchmark(_expand, Dict[str, List[int]])
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Iterable
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import pytest
 
+from pytest_static.combinations import covering_array
+from pytest_static.custom_typing import InstanceSet
+from pytest_static.ids import ID_CACHE_KEY
 from pytest_static.plugin import pytest_configure
 from pytest_static.type_sets import BOOL_PARAMS
 from pytest_static.type_sets import BYTES_PARAMS
 from pytest_static.type_sets import COMPLEX_PARAMS
+from pytest_static.type_sets import EXHAUSTIVE_INSTANCE_SETS
 from pytest_static.type_sets import FLOAT_PARAMS
 from pytest_static.type_sets import INT_PARAMS
+from pytest_static.type_sets import SMOKE_INSTANCE_SETS
 from pytest_static.type_sets import STR_PARAMS
 from tests.util import BASIC_TYPE_EXPECTED_EXAMPLES
+from tests.util import BOOL_LEN
 from tests.util import PRODUCT_TYPE_EXPECTED_EXAMPLES
 from tests.util import SPECIAL_TYPE_EXPECTED_EXAMPLES
+from tests.util import STR_LEN
 from tests.util import SUM_TYPE_EXPECTED_EXAMPLES
 from tests.util import type_annotation_to_string
 
@@ -27,6 +35,11 @@ if TYPE_CHECKING:
     from _pytest.pytester import Pytester
 
 
+def collect_node_ids(pytester: Pytester, *args: str | Path) -> list[str]:
+    result: pytest.RunResult = pytester.runpytest(*args, "--collect-only", "-q")
+    return [line for line in result.outlines if "::" in line]
+
+
 @pytest.fixture
 def conftest(pytester: Pytester) -> Path:
     return pytester.makeconftest(
@@ -252,8 +265,989 @@ def test_parametrize_types_with_product_type_expected_examples(
     result.assert_outcomes(passed=expected)
 
 
+def test_parametrize_types_with_lazy(pytester: Pytester, conftest: Path) -> None:
+    test_path: Path = pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(
+            argnames=["a", "b"],
+            argtypes=[bool, int],
+            lazy=True,
+        )
+        def test_func(a, b) -> None:
+            assert isinstance(a, bool)
+            assert isinstance(b, int)
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(test_path, "-v")
+    result.assert_outcomes(passed=len(BOOL_PARAMS) * len(INT_PARAMS))
+    result.stdout.fnmatch_lines(["*test_func?True, 0?*"])
+
+
+def test_parametrize_types_with_lazy_constructs_at_setup(pytester: Pytester, conftest: Path) -> None:
+    test_path: Path = pytester.makepyfile(
+        """
+        import dataclasses
+        import gc
+        import weakref
+
+        import pytest
+
+        BUILT = []
+
+        @dataclasses.dataclass
+        class Box:
+            flag: bool
+
+            def __post_init__(self):
+                BUILT.append(weakref.ref(self))
+
+        @pytest.mark.parametrize_types(argnames=["box"], argtypes=[Box], ids=["first", "second"], lazy=True)
+        def test_lazy(box) -> None:
+            gc.collect()
+            assert [ref() for ref in BUILT if ref() is not None] == [box]
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest_subprocess(test_path)
+    result.assert_outcomes(passed=len(BOOL_PARAMS))
+
+
+@pytest.mark.parametrize(
+    argnames=("args", "expected_id", "built"),
+    argvalues=[((), "True, box0", 0), (("--static-ids=repr",), "True, Box(flag=True)", BOOL_LEN)],
+)
+def test_parametrize_types_with_lazy_ids(
+    pytester: Pytester, conftest: Path, args: tuple[str, ...], expected_id: str, built: int
+) -> None:
+    test_path: Path = pytester.makepyfile(
+        f"""
+        import dataclasses
+
+        import pytest
+
+        BUILT = []
+
+        @dataclasses.dataclass
+        class Box:
+            flag: bool
+
+            def __post_init__(self):
+                BUILT.append(self)
+
+        def test_collection() -> None:
+            assert len(BUILT) == {built}
+
+        @pytest.mark.parametrize_types(argnames=["flag", "box"], argtypes=[bool, Box], lazy=True)
+        def test_lazy(flag, box) -> None:
+            pass
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(test_path, "-v", *args)
+    result.assert_outcomes(passed=1 + BOOL_LEN**2)
+    result.stdout.fnmatch_lines([f"*test_lazy?{expected_id}?*"])
+
+
+def test_parametrize_types_with_lazy_and_dependent_fixture(pytester: Pytester, conftest: Path) -> None:
+    test_path: Path = pytester.makepyfile(
+        """
+        import pytest
+        from typing import Tuple
+
+        @pytest.fixture
+        def size(a):
+            return len(a)
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[Tuple[bool, bool]], lazy=True)
+        def test_func(a, size) -> None:
+            assert size == len(a)
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(test_path)
+    result.assert_outcomes(passed=BOOL_LEN**2)
+
+
+def test_parametrize_types_with_lazy_and_ids_callable(pytester: Pytester, conftest: Path) -> None:
+    test_path: Path = pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[bool], ids=lambda x: f"id-{x}", lazy=True)
+        def test_func(a) -> None:
+            assert isinstance(a, bool)
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(test_path, "-v")
+    result.assert_outcomes(passed=len(BOOL_PARAMS))
+    result.stdout.fnmatch_lines(["*test_func?id-True?*"])
+
+
+def test_parametrize_types_with_lazy_and_indirect(pytester: Pytester, conftest: Path) -> None:
+    test_path: Path = pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.fixture
+        def a(request):
+            return request.param
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[bool], indirect=True, lazy=True)
+        def test_func(a) -> None:
+            pass
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(test_path)
+    result.assert_outcomes(errors=1)
+
+
+@pytest.mark.parametrize(
+    argnames=("strategy", "expected"),
+    argvalues=[
+        ("product", len(BOOL_PARAMS) ** 4),
+        ("pairwise", len(covering_array([len(BOOL_PARAMS)] * 4, 2))),
+        ("each-choice", len(BOOL_PARAMS)),
+    ],
+)
+def test_parametrize_types_with_strategy(pytester: Pytester, conftest: Path, strategy: str, expected: int) -> None:
+    test_path: Path = pytester.makepyfile(
+        f"""
+        import pytest
+
+        @pytest.mark.parametrize_types(
+            argnames=["a", "b", "c", "d"],
+            argtypes=[bool, bool, bool, bool],
+            strategy="{strategy}",
+        )
+        def test_func(a, b, c, d) -> None:
+            assert isinstance(a, bool)
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(test_path)
+    result.assert_outcomes(passed=expected)
+
+
+def test_parametrize_types_with_invalid_strategy(pytester: Pytester, conftest: Path) -> None:
+    test_path: Path = pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[bool], strategy="sometimes")
+        def test_func(a) -> None:
+            pass
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(test_path)
+    result.assert_outcomes(errors=1)
+
+
+@pytest.fixture
+def sampled_test(pytester: Pytester, conftest: Path) -> Path:
+    return pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a", "b", "c"], argtypes=[str, str, str], max_cases=7, seed=42)
+        def test_func(a, b, c) -> None:
+            assert isinstance(a, str)
+        """
+    )
+
+
+def test_parametrize_types_with_max_cases(pytester: Pytester, sampled_test: Path) -> None:
+    result: pytest.RunResult = pytester.runpytest(sampled_test)
+    result.assert_outcomes(passed=7)
+
+
+@pytest.mark.parametrize(argnames="args", argvalues=[(), ("--static-seed=7",)])
+def test_parametrize_types_with_max_cases_is_reproducible(
+    pytester: Pytester, sampled_test: Path, args: tuple[str, ...]
+) -> None:
+    first: list[str] = collect_node_ids(pytester, sampled_test, *args)
+    assert len(first) == 7
+    assert first == collect_node_ids(pytester, sampled_test, *args)
+
+
+def test_parametrize_types_with_static_seed_overrides_marker_seed(pytester: Pytester, sampled_test: Path) -> None:
+    assert collect_node_ids(pytester, sampled_test) != collect_node_ids(pytester, sampled_test, "--static-seed=7")
+
+
+@pytest.mark.parametrize(
+    argnames=("argtypes", "args"),
+    argvalues=[
+        ("[str, bytes]", ()),
+        ("[Set[str], FrozenSet[bytes]]", ("--static-collection-sizes=2",)),
+        ("[Tagged, TaggedTuple]", ("--static-collection-sizes=2",)),
+    ],
+)
+def test_parametrize_types_collection_order_is_independent_of_hash_seed(
+    pytester: Pytester, conftest: Path, monkeypatch: pytest.MonkeyPatch, argtypes: str, args: tuple[str, ...]
+) -> None:
+    test_path: Path = pytester.makepyfile(
+        f"""
+        import dataclasses
+        import pytest
+        from typing import FrozenSet
+        from typing import NamedTuple
+        from typing import Set
+
+        @dataclasses.dataclass
+        class Tagged:
+            tags: Set[str]
+
+        class TaggedTuple(NamedTuple):
+            tags: FrozenSet[bytes]
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes={argtypes})
+        def test_func(a, b) -> None:
+            pass
+        """
+    )
+    collected: list[list[str]] = []
+    for hash_seed in ("1", "2"):
+        monkeypatch.setenv("PYTHONHASHSEED", hash_seed)
+        result: pytest.RunResult = pytester.runpytest_subprocess(test_path, "--collect-only", "-q", *args)
+        collected.append([line for line in result.outlines if "::" in line])
+    assert collected[0]
+    assert collected[0] == collected[1]
+
+
+@pytest.fixture
+def long_repr_test(pytester: Pytester, conftest: Path) -> Path:
+    return pytester.makepyfile(
+        """
+        import pytest
+        from typing import Tuple
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[bool, Tuple[int, int, int]])
+        def test_func(a, b) -> None:
+            pass
+        """
+    )
+
+
+def test_parametrize_types_with_compact_ids(pytester: Pytester, long_repr_test: Path) -> None:
+    result: pytest.RunResult = pytester.runpytest(
+        long_repr_test, "--collect-only", "-q", "--static-ids=compact", "--static-id-max-length=12"
+    )
+    result.stdout.fnmatch_lines(["*test_func?True, (0, 0, 0)?", "*test_func?True, tuple-?????????????"])
+    id_map: dict[str, str] = pytester.parseconfigure().cache.get(ID_CACHE_KEY, {})  # type: ignore[union-attr]
+    assert "(0, 0, 9223372036854775807)" in id_map.values()
+    assert all(len(key) == len("tuple-") + 12 for key in id_map)
+
+
+def test_parametrize_types_with_compact_ids_from_ini(pytester: Pytester, long_repr_test: Path) -> None:
+    pytester.makeini(
+        """
+        [pytest]
+        static_ids = compact
+        static_id_max_length = 12
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(long_repr_test, "--collect-only", "-q")
+    result.stdout.fnmatch_lines(["*test_func?True, tuple-?????????????"])
+
+
+def test_parametrize_types_with_static_id_map(pytester: Pytester, long_repr_test: Path) -> None:
+    pytester.runpytest(
+        long_repr_test,
+        "--collect-only",
+        "--static-ids=compact",
+        "--static-id-max-length=12",
+        "--static-id-map=ids.json",
+    )
+    id_map: dict[str, str] = json.loads((pytester.path / "ids.json").read_text(encoding="utf-8"))
+    assert "(0, 0, 9223372036854775807)" in id_map.values()
+
+
+def test_parametrize_types_with_static_shard(pytester: Pytester, conftest: Path) -> None:
+    test_path: Path = pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[bool, int])
+        def test_func(a, b) -> None:
+            pass
+        """
+    )
+    sharded: list[str] = []
+    for shard in ("1/3", "2/3", "3/3"):
+        sharded.extend(collect_node_ids(pytester, test_path, f"--static-shard={shard}"))
+    assert len(sharded) == len(BOOL_PARAMS) * len(INT_PARAMS)
+    assert sorted(sharded) == sorted(collect_node_ids(pytester, test_path))
+
+
+def test_parametrize_types_with_invalid_static_shard(pytester: Pytester, conftest: Path) -> None:
+    result: pytest.RunResult = pytester.runpytest_subprocess("--static-shard=4/3")
+    result.stderr.fnmatch_lines(["*--static-shard*1 <= i <= n*"])
+
+
+@pytest.fixture
+def max_cases_test(pytester: Pytester, conftest: Path) -> Path:
+    return pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[str, tuple[str, str, str, str, str, str]])
+        def test_func(a, b) -> None:
+            pass
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[bool, bool])
+        def test_small(a, b) -> None:
+            pass
+        """
+    )
+
+
+def test_parametrize_types_with_static_max_cases_fails(pytester: Pytester, max_cases_test: Path) -> None:
+    result: pytest.RunResult = pytester.runpytest(max_cases_test, "--static-max-cases=100", "--collect-only", "-q")
+    assert result.ret == pytest.ExitCode.INTERRUPTED
+    result.stdout.fnmatch_lines(
+        [f"*test_func would generate {STR_LEN**7} parametrize_types cases*limit of 100*a={STR_LEN}, b={STR_LEN**6}"]
+    )
+
+
+def test_parametrize_types_with_static_max_cases_counts_covering_array_rows(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        test_small="""
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=list("abcdefghij"), argtypes=[bool] * 10, strategy="pairwise")
+        def test_func(a, b, c, d, e, f, g, h, i, j) -> None:
+            pass
+        """,
+        test_large="""
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a", "b", "c"], argtypes=[str, str, str], strategy="pairwise")
+        def test_large(a, b, c) -> None:
+            pass
+        """,
+    )
+    rows: int = len(covering_array([BOOL_LEN] * 10, 2))
+    result: pytest.RunResult = pytester.runpytest(f"--static-max-cases={rows - 1}", "--collect-only", "-q")
+    assert result.ret == pytest.ExitCode.INTERRUPTED
+    result.stdout.fnmatch_lines([f"*test_func would generate {rows} parametrize_types cases*"])
+    result.stdout.fnmatch_lines([f"*test_large would generate at least {STR_LEN**2} parametrize_types cases*"])
+
+
+def test_parametrize_types_with_static_max_cases_warns(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[bool, int])
+        def test_func(a, b) -> None:
+            pass
+        """
+    )
+    pytester.makeini("[pytest]\nstatic_max_cases = 3\nstatic_max_cases_action = warn")
+    result: pytest.RunResult = pytester.runpytest()
+    result.assert_outcomes(passed=len(BOOL_PARAMS) * len(INT_PARAMS), warnings=1)
+    result.stdout.fnmatch_lines(["*MaxCasesWarning*limit of 3*"])
+
+
+def test_parametrize_types_with_static_max_cases_counts_marker_max_cases(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[str, str], max_cases=5)
+        def test_func(a, b) -> None:
+            pass
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest("--static-max-cases=5")
+    result.assert_outcomes(passed=5)
+
+
+def test_parametrize_types_with_static_cache(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+        from pytest_static.parametric import type_handlers
+
+        class Custom:
+            pass
+
+        @type_handlers.register(Custom)
+        def _iter_custom_instances(*_):
+            with open("calls.txt", "a") as calls:
+                calls.write("x")
+            yield from (1, 2)
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[Custom, bool], strategy="pairwise")
+        def test_func(a, b) -> None:
+            pass
+        """
+    )
+    calls: Path = pytester.path / "calls.txt"
+    for _ in range(2):
+        pytester.runpytest_subprocess("--static-cache").assert_outcomes(passed=2 * len(BOOL_PARAMS))
+    assert calls.read_text() == "x"
+
+    pytester.runpytest_subprocess("--static-cache", "--static-cache-clear").assert_outcomes(passed=2 * len(BOOL_PARAMS))
+    assert calls.read_text() == "xx"
+
+    pytester.runpytest_subprocess().assert_outcomes(passed=2 * len(BOOL_PARAMS))
+    assert calls.read_text() == "xxx"
+
+
+def test_parametrize_types_with_static_cache_and_redefined_class(pytester: Pytester, conftest: Path) -> None:
+    source: str = """
+        import dataclasses
+
+        import pytest
+
+        @dataclasses.dataclass
+        class D:
+            {fields}
+
+        @pytest.mark.parametrize_types(argnames=["d"], argtypes=[D])
+        def test_func(d) -> None:
+            assert dataclasses.asdict(d)
+        """
+    pytester.makepyfile(source.format(fields="a: bool"))
+    pytester.runpytest_subprocess("--static-cache").assert_outcomes(passed=BOOL_LEN)
+
+    pytester.makepyfile(source.format(fields="a: bool\n            b: bool"))
+    pytester.runpytest_subprocess("--static-cache").assert_outcomes(passed=BOOL_LEN**2)
+
+
+def test_parametrize_types_with_static_workers(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        """
+        import os
+
+        import pytest
+        from pytest_static.parametric import type_handlers
+
+        class First:
+            pass
+
+        class Second:
+            pass
+
+        @type_handlers.register(First, Second)
+        def _iter_pids(*_):
+            yield os.getpid()
+
+        @pytest.mark.parametrize_types(
+            argnames=["a", "b", "c", "d"], argtypes=[First, Second, tuple[First, bool], tuple[Second, bool]]
+        )
+        def test_func(a, b, c, d) -> None:
+            assert os.getpid() not in (a, b, c[0], d[0])
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest_subprocess("--static-workers=2")
+    result.assert_outcomes(passed=BOOL_LEN**2)
+
+
+def test_parametrize_types_with_static_workers_shares_pool_between_modules(pytester: Pytester) -> None:
+    pytester.makeconftest(
+        """
+        import os
+
+        pytest_plugins = ["pytest_static.plugin"]
+
+        FORKS = []
+        os.register_at_fork(before=lambda: FORKS.append(os.getpid()))
+        """
+    )
+    source: str = """
+        import pytest
+        from conftest import FORKS
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[list[{arg}]])
+        def test_list(a) -> None:
+            assert 0 < len(FORKS) <= 2
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[set[{arg}]])
+        def test_set(a) -> None:
+            pass
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[tuple[{arg}, bool]])
+        def test_tuple(a) -> None:
+            pass
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[dict[{arg}, bool]])
+        def test_dict(a) -> None:
+            pass
+        """
+    pytester.makepyfile(test_a=source.format(arg="bool"), test_b=source.format(arg="str"))
+    result: pytest.RunResult = pytester.runpytest_subprocess("--static-workers=2")
+    outcomes: dict[str, int] = result.parseoutcomes()
+    assert outcomes["passed"] > 0
+    assert "failed" not in outcomes
+
+
+def test_parametrize_types_with_invalid_static_workers(pytester: Pytester, conftest: Path) -> None:
+    result: pytest.RunResult = pytester.runpytest_subprocess("--static-workers=many")
+    result.stderr.fnmatch_lines(["*--static-workers*'auto'*"])
+
+
+def test_parametrize_types_with_async_handlers(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        """
+        import asyncio
+        import time
+
+        import pytest
+        from pytest_static.parametric import type_handlers
+
+        class First:
+            pass
+
+        class Second:
+            pass
+
+        @type_handlers.register(First, Second)
+        async def _iter_samples(base_type, type_args):
+            await asyncio.sleep(0.2)
+            yield time.monotonic()
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[First, list[Second]])
+        def test_func(a, b) -> None:
+            assert abs(a - b[0]) < 0.1
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest("--static-async-concurrency=2")
+    result.assert_outcomes(passed=1)
+
+
+@pytest.mark.parametrize(argnames=("max_depth", "expected"), argvalues=[("0", 1), ("1", 2), ("2", 3)])
+def test_parametrize_types_with_recursive_alias(
+    pytester: Pytester, conftest: Path, max_depth: str, expected: int
+) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+        from typing import List, Union
+
+        Nested = Union[bool, List["Nested"]]
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[Nested])
+        def test_func(a) -> None:
+            pass
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(f"--static-max-depth={max_depth}")
+    result.assert_outcomes(passed=expected * BOOL_LEN)
+
+
+@pytest.mark.parametrize(argnames=("option", "expected"), argvalues=[("0,1,2,100", 1 + 3 * BOOL_LEN), ("1", BOOL_LEN)])
+def test_parametrize_types_with_collection_sizes(
+    pytester: Pytester, conftest: Path, option: str, expected: int
+) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+        from typing import List
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[List[bool]])
+        def test_func(a) -> None:
+            assert len(a) in (0, 1, 2, 100)
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(f"--static-collection-sizes={option}")
+    result.assert_outcomes(passed=expected)
+
+
+def test_parametrize_types_with_collection_sizes_from_ini(pytester: Pytester, conftest: Path) -> None:
+    pytester.makeini("[pytest]\nstatic_collection_sizes = 0,2")
+    pytester.makepyfile(
+        """
+        import pytest
+        from typing import Set
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[Set[bool]])
+        def test_func(a) -> None:
+            assert len(a) in (0, 2)
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest()
+    result.assert_outcomes(passed=2)
+
+
+@pytest.mark.parametrize(argnames="option", argvalues=["1,-2", "a", ""])
+def test_parametrize_types_with_invalid_collection_sizes(pytester: Pytester, conftest: Path, option: str) -> None:
+    result: pytest.RunResult = pytester.runpytest(f"--static-collection-sizes={option}")
+    result.stderr.fnmatch_lines(["*Expected comma separated sizes of at least 0*"])
+
+
+@pytest.mark.parametrize(argnames="args", argvalues=[("--static-order=edge-first",), ()])
+def test_parametrize_types_with_edge_first_order(pytester: Pytester, conftest: Path, args: tuple[str, ...]) -> None:
+    order: str = "" if args else ', order="edge-first"'
+    test_path: Path = pytester.makepyfile(
+        f"""
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[int, float]{order})
+        def test_func(a, b) -> None:
+            pass
+        """
+    )
+    node_ids: list[str] = collect_node_ids(pytester, test_path, *args)
+    assert len(node_ids) == len(INT_PARAMS) * len(FLOAT_PARAMS)
+    assert node_ids[:3] == [
+        f"{test_path.name}::test_func[0, 0.0]",
+        f"{test_path.name}::test_func[0, inf]",
+        f"{test_path.name}::test_func[0, -inf]",
+    ]
+    assert node_ids[-1] == f"{test_path.name}::test_func[-2, -10000000000.0]"
+
+
+def test_parametrize_types_with_lazy_edge_first_order_builds_at_setup(pytester: Pytester, conftest: Path) -> None:
+    test_path: Path = pytester.makepyfile(
+        """
+        import dataclasses
+        from typing import List
+
+        import pytest
+
+        BUILT = []
+
+        @dataclasses.dataclass
+        class Box:
+            flag: bool
+
+            def __post_init__(self):
+                BUILT.append(self)
+
+        def test_collection() -> None:
+            assert BUILT == []
+
+        @pytest.mark.parametrize_types(
+            argnames=["boxes", "a"], argtypes=[List[Box], int], order="edge-first", lazy=True
+        )
+        def test_lazy(boxes, a) -> None:
+            pass
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(test_path, "-v", "--static-collection-sizes=1,0")
+    result.assert_outcomes(passed=1 + (BOOL_LEN + 1) * len(INT_PARAMS))
+    result.stdout.fnmatch_lines(["*test_lazy?boxes2, 0?*", "*test_lazy?boxes2, -1?*"])
+
+
+def test_parametrize_types_with_fail_fast_family(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[int])
+        def test_func(a) -> None:
+            assert a > 0
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[bool])
+        def test_other(a) -> None:
+            assert a
+
+        def test_unmarked() -> None:
+            assert False
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest("--static-fail-fast-family=2", "-rs")
+    result.assert_outcomes(passed=2, failed=4, skipped=len(INT_PARAMS) - 3)
+    result.stdout.fnmatch_lines(["*2 cases of *test_func already failed*"])
+
+
+def test_parametrize_types_with_new_only(pytester: Pytester, conftest: Path) -> None:
+    source: str = """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[int])
+        def test_func(a) -> None:
+            assert a != {failing}
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[bool])
+        @pytest.mark.parametrize_types(argnames=["b"], argtypes=[bool])
+        def test_other(a, b) -> None:
+            pass
+        """
+    pytester.makepyfile(source.format(failing=1))
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=len(INT_PARAMS) - 1 + BOOL_LEN**2, failed=1)
+
+    result: pytest.RunResult = pytester.runpytest("--static-new-only")
+    result.assert_outcomes(passed=BOOL_LEN**2, failed=1)
+    result.stdout.fnmatch_lines(["*test_func?1? - assert*"])
+
+    pytester.makepyfile(source.format(failing=2))
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=len(INT_PARAMS) - 1 + BOOL_LEN**2, failed=1)
+    pytester.runpytest().assert_outcomes(passed=len(INT_PARAMS) - 1 + BOOL_LEN**2, failed=1)
+
+
+def test_parametrize_types_with_new_only_and_stacked_parametrize(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.fixture(params=[1, 2])
+        def y(request):
+            return request.param
+
+        @pytest.mark.parametrize("x", [1, 2])
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[bool])
+        def test_func(a, x, y) -> None:
+            assert not (x == 1 and y == 1)
+        """
+    )
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=BOOL_LEN * 3, failed=BOOL_LEN)
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=BOOL_LEN * 3, failed=BOOL_LEN)
+
+
+def test_parametrize_types_with_new_only_after_changing_the_module_or_conftest(
+    pytester: Pytester, conftest: Path
+) -> None:
+    source: str = """
+        import pytest
+
+        def helper() -> bool:
+            return {result}
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[bool])
+        def test_func(a, offset) -> None:
+            assert helper()
+        """
+    fixture: str = conftest.read_text() + "\n@pytest.fixture\ndef offset():\n    return {offset}\n"
+    pytester.makeconftest(fixture.format(offset=0))
+    pytester.makepyfile(source.format(result=True))
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=BOOL_LEN)
+
+    pytester.makeconftest(fixture.format(offset=1))
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=BOOL_LEN)
+
+    pytester.makepyfile(source.format(result=False))
+    pytester.runpytest("--static-new-only").assert_outcomes(failed=BOOL_LEN)
+
+
+def test_parametrize_types_with_new_only_after_changing_the_instance_sets_or_version(
+    pytester: Pytester, conftest: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[bool])
+        def test_func(a) -> None:
+            pass
+        """
+    )
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=BOOL_LEN)
+
+    monkeypatch.setattr("pytest_static.parametric.__version__", "0.0.0")
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=BOOL_LEN)
+
+    from pytest_static.parametric import type_handlers
+
+    monkeypatch.setattr(type_handlers, "instance_sets", {**type_handlers.instance_sets, str: InstanceSet(("",))})
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=BOOL_LEN)
+    pytester.runpytest("--static-new-only").assert_outcomes(skipped=1)
+
+
+def test_parametrize_types_with_new_only_after_every_combination_passed(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[bool], lazy=True)
+        def test_func(a) -> None:
+            assert isinstance(a, bool)
+        """
+    )
+    pytester.runpytest("--static-new-only").assert_outcomes(passed=BOOL_LEN)
+    pytester.runpytest("--static-new-only").assert_outcomes(skipped=1)
+
+
+def test_plugin_defers_type_handler_import_until_a_marker_is_found(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        test_unmarked="""
+        import sys
+
+        def test_func() -> None:
+            assert "pytest_static.parametric" not in sys.modules
+            assert "pytest_static.type_sets" not in sys.modules
+            assert "pytest_static.ordering" not in sys.modules
+            assert "pytest_static.plan" not in sys.modules
+            assert "pytest_static.util" not in sys.modules
+            assert "asyncio" not in sys.modules
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=1)
+
+
+def test_plugin_with_forward_references_to_classes_of_the_same_name(pytester: Pytester, conftest: Path) -> None:
+    source: str = """
+        import dataclasses
+        import pytest
+        from typing import List, Literal
+
+        @dataclasses.dataclass
+        class Item:
+            value: Literal[{value}]
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[List["Item"]])
+        def test_func(a) -> None:
+            assert all(type(item) is Item and item.value == {value} for item in a)
+        """
+    pytester.makepyfile(test_a=source.format(value=1), test_b=source.format(value=2))
+    pytester.runpytest().assert_outcomes(passed=2)
+
+
+@pytest.mark.parametrize(argnames="args", argvalues=[(), ("--static-workers=2",)])
+def test_plugin_with_cyclic_classes(pytester: Pytester, conftest: Path, args: tuple[str, ...]) -> None:
+    pytester.makepyfile(
+        """
+        class A: ...
+        class B: ...
+        A.other = B
+        B.other = A
+
+        def test_func() -> None:
+            pass
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest_subprocess(*args)
+    result.assert_outcomes(passed=1)
+
+
+def test_pytest_static_register_handlers(pytester: Pytester) -> None:
+    pytester.makeconftest(
+        """
+        pytest_plugins = ["pytest_static.plugin"]
+
+        class Money:
+            def __init__(self, cents):
+                self.cents = cents
+
+        def pytest_static_register_handlers(registry):
+            @registry.register(Money)
+            def _iter_money_instances(*_):
+                yield Money(0)
+                yield Money(100)
+        """
+    )
+    pytester.makepyfile(
+        """
+        import pytest
+        from conftest import Money
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[Money])
+        def test_func(a) -> None:
+            assert isinstance(a, Money)
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=2)
+
+
+def test_pytest_static_register_handlers_undone_between_sessions(pytester: Pytester) -> None:
+    pytester.makeconftest(
+        """
+        from fractions import Fraction
+
+        pytest_plugins = ["pytest_static.plugin"]
+
+        def pytest_static_register_handlers(registry):
+            @registry.register(Fraction)
+            def _iter_fraction_instances(*_):
+                yield Fraction(1, 2)
+                yield Fraction(2, 3)
+        """
+    )
+    pytester.makepyfile(
+        """
+        import pytest
+        from fractions import Fraction
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[Fraction])
+        def test_func(a) -> None:
+            pass
+        """
+    )
+    # Imported here so that both in-process sessions share the registry and the Fraction class
+    import fractions  # noqa: F401
+
+    import pytest_static.parametric  # noqa: F401
+
+    for _ in range(2):
+        result: pytest.RunResult = pytester.runpytest_inprocess("-v")
+        result.assert_outcomes(passed=2)
+
+
 def test_pytest_configure(pytester: Pytester) -> None:
     config: pytest.Config = pytester.parseconfig()
     assert len(config.getini("markers")) == 0
     pytest_configure(config)
     assert "parametrize_types" in config.getini("markers")[0]
+
+
+@pytest.fixture
+def profile_test(pytester: Pytester, conftest: Path) -> Path:
+    return pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[int])
+        def test_func(a) -> None:
+            pass
+
+        @pytest.mark.parametrize_types(argnames=["a"], argtypes=[int], profile="exhaustive")
+        def test_exhaustive(a) -> None:
+            pass
+        """
+    )
+
+
+def test_parametrize_types_with_static_profile(pytester: Pytester, profile_test: Path) -> None:
+    result: pytest.RunResult = pytester.runpytest("--static-profile=smoke")
+    result.assert_outcomes(passed=len(SMOKE_INSTANCE_SETS[int]) + len(EXHAUSTIVE_INSTANCE_SETS[int]))
+
+
+def test_parametrize_types_with_static_profile_from_ini(pytester: Pytester, profile_test: Path) -> None:
+    pytester.makeini("[pytest]\nstatic_profile = exhaustive")
+    result: pytest.RunResult = pytester.runpytest()
+    result.assert_outcomes(passed=2 * len(EXHAUSTIVE_INSTANCE_SETS[int]))
+
+
+def test_parametrize_types_with_default_profile(pytester: Pytester, profile_test: Path) -> None:
+    result: pytest.RunResult = pytester.runpytest()
+    result.assert_outcomes(passed=len(INT_PARAMS) + len(EXHAUSTIVE_INSTANCE_SETS[int]))
+
+
+def test_parametrize_types_with_invalid_static_profile(pytester: Pytester, conftest: Path) -> None:
+    result: pytest.RunResult = pytester.runpytest_subprocess("--static-profile=huge")
+    result.stderr.fnmatch_lines(["*--static-profile*invalid choice*"])
+
+
+def test_parametrize_types_with_static_max_cases_counts_marker_profile(pytester: Pytester, conftest: Path) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[str, str], profile="smoke")
+        def test_func(a, b) -> None:
+            pass
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest(f"--static-max-cases={len(SMOKE_INSTANCE_SETS[str]) ** 2}")
+    result.assert_outcomes(passed=len(SMOKE_INSTANCE_SETS[str]) ** 2)
+
+
+@pytest.mark.parametrize(argnames="lazy", argvalues=[False, True])
+def test_parametrize_types_does_not_share_mutable_instances(pytester: Pytester, conftest: Path, lazy: bool) -> None:
+    pytester.makepyfile(
+        f"""
+        import pytest
+        from typing import List
+
+        @pytest.mark.parametrize_types(argnames=["xs"], argtypes=[List[bool]], lazy={lazy})
+        def test_a(xs) -> None:
+            xs.append("junk")
+
+        @pytest.mark.parametrize_types(argnames=["xs"], argtypes=[List[bool]], lazy={lazy})
+        def test_b(xs) -> None:
+            assert "junk" not in xs
+        """
+    )
+    result: pytest.RunResult = pytester.runpytest()
+    result.assert_outcomes(passed=2 * BOOL_LEN)
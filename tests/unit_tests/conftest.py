@@ -7,6 +7,7 @@ import pytest
 from _pytest.fixtures import FixtureRequest
 
 from pytest_static.custom_typing import TypeHandler
+from pytest_static.parametric import type_handlers
 from pytest_static.type_handler import TypeHandlerRegistry
 
 
@@ -34,3 +35,10 @@ def basic_handler(request: FixtureRequest) -> TypeHandler:
         yield from (1, 2, 3)
 
     return getattr(request, "param", _iter_int)
+
+
+@pytest.fixture
+def clean_instance_cache() -> Generator[None, None, None]:
+    type_handlers.instance_cache.clear()
+    yield
+    type_handlers.instance_cache.clear()
@@ -0,0 +1,54 @@
+import pytest
+
+from pytest_static.cache import CacheInfo
+from pytest_static.cache import LRUCache
+
+
+class TestLRUCache:
+    def test_get_with_missing(self) -> None:
+        cache: LRUCache[int, str] = LRUCache()
+        assert cache.get(1, "default") == "default"
+        assert cache.info() == CacheInfo(hits=0, misses=1, maxsize=cache.maxsize, currsize=0)
+
+    def test_get_with_cached(self) -> None:
+        cache: LRUCache[int, str] = LRUCache()
+        cache.set(1, "one")
+        assert cache.get(1) == "one"
+        assert cache.info().hits == 1
+
+    def test_get_with_unhashable(self) -> None:
+        cache: LRUCache[object, str] = LRUCache()
+        assert cache.get([1]) is None
+        assert cache.misses == 1
+
+    def test_set_with_unhashable(self) -> None:
+        cache: LRUCache[object, str] = LRUCache()
+        cache.set([1], "one")
+        assert len(cache) == 0
+        assert [1] not in cache
+
+    def test_set_evicts_least_recently_used(self) -> None:
+        cache: LRUCache[int, str] = LRUCache(maxsize=2)
+        cache.set(1, "one")
+        cache.set(2, "two")
+        cache.get(1)
+        cache.set(3, "three")
+        assert 1 in cache
+        assert 2 not in cache
+        assert 3 in cache
+
+    def test_set_with_zero_maxsize(self) -> None:
+        cache: LRUCache[int, str] = LRUCache(maxsize=0)
+        cache.set(1, "one")
+        assert len(cache) == 0
+
+    def test_init_with_negative_maxsize(self) -> None:
+        with pytest.raises(ValueError, match="non-negative"):
+            LRUCache(maxsize=-1)
+
+    def test_clear_keeps_counters(self) -> None:
+        cache: LRUCache[int, str] = LRUCache()
+        cache.set(1, "one")
+        cache.get(1)
+        cache.clear()
+        assert cache.info() == CacheInfo(hits=1, misses=0, maxsize=cache.maxsize, currsize=0)
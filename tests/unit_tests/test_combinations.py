@@ -0,0 +1,215 @@
+import itertools
+from collections.abc import Sequence
+from typing import Optional
+
+import pytest
+
+from pytest_static.combinations import CombinationView
+from pytest_static.combinations import ProductIndices
+from pytest_static.combinations import count_combinations
+from pytest_static.combinations import covering_array
+from pytest_static.combinations import each_choice
+from pytest_static.combinations import get_combination_indices
+from pytest_static.combinations import min_combinations
+from pytest_static.combinations import parse_shard
+from pytest_static.combinations import parse_strategy
+from pytest_static.combinations import sample_combinations
+from pytest_static.combinations import shard_combinations
+
+
+def assert_covers(rows: Sequence[tuple[int, ...]], sizes: Sequence[int], strength: int) -> None:
+    for columns in itertools.combinations(range(len(sizes)), strength):
+        expected: set[tuple[int, ...]] = set(itertools.product(*(range(sizes[c]) for c in columns)))
+        assert expected <= {tuple(row[c] for c in columns) for row in rows}
+    for row in rows:
+        assert all(0 <= value < size for value, size in zip(row, sizes))
+
+
+@pytest.mark.parametrize(
+    argnames=("strategy", "expected"),
+    argvalues=[
+        ("product", None),
+        ("pairwise", 2),
+        ("each-choice", 1),
+        ("t-wise(3)", 3),
+        (" T-Wise(4) ", 4),
+    ],
+)
+def test_parse_strategy(strategy: str, expected: Optional[int]) -> None:
+    assert parse_strategy(strategy) == expected
+
+
+@pytest.mark.parametrize(argnames="strategy", argvalues=["triplewise", "t-wise(0)", "t-wise()", "t-wise(2"])
+def test_parse_strategy_with_invalid(strategy: str) -> None:
+    with pytest.raises(ValueError, match="Unknown combination strategy"):
+        parse_strategy(strategy)
+
+
+def test_get_combination_indices_with_product() -> None:
+    assert list(get_combination_indices([2, 3])) == list(itertools.product(range(2), range(3)))
+
+
+@pytest.mark.parametrize(argnames="sizes", argvalues=[[3, 3, 3, 3], [5, 2, 7, 3, 4], [2] * 10, [4, 1, 3]])
+def test_get_combination_indices_with_pairwise(sizes: list[int]) -> None:
+    rows: list[tuple[int, ...]] = list(get_combination_indices(sizes, "pairwise"))
+    assert_covers(rows, sizes, 2)
+    assert len(rows) <= len(list(itertools.product(*map(range, sizes))))
+
+
+def test_get_combination_indices_with_each_choice() -> None:
+    rows: list[tuple[int, ...]] = list(get_combination_indices([3, 5, 2], "each-choice"))
+    assert_covers(rows, [3, 5, 2], 1)
+    assert len(rows) == 5
+
+
+@pytest.mark.parametrize(
+    argnames=("sizes", "expected"),
+    argvalues=[([], [()]), ([2, 0], []), ([2, 3], [(0, 0), (1, 1), (0, 2)])],
+)
+def test_each_choice(sizes: list[int], expected: list[tuple[int, ...]]) -> None:
+    assert each_choice(sizes) == expected
+
+
+@pytest.mark.parametrize(argnames=("sizes", "strength"), argvalues=[([3, 3, 3, 3, 3], 3), ([2, 4, 3, 2, 2], 3)])
+def test_covering_array_with_higher_strength(sizes: list[int], strength: int) -> None:
+    assert_covers(covering_array(sizes, strength), sizes, strength)
+
+
+def test_covering_array_with_strength_covering_every_parameter() -> None:
+    assert list(covering_array([2, 2], 2)) == list(itertools.product(range(2), range(2)))
+
+
+def test_get_combination_indices_with_pairwise_on_two_parameters_is_lazy() -> None:
+    rows: Sequence[tuple[int, ...]] = get_combination_indices([3000, 3000], "pairwise")
+    assert isinstance(rows, ProductIndices)
+    assert len(rows) == 3000**2
+
+
+def test_covering_array_with_strength_one() -> None:
+    assert covering_array([3, 2, 1], 1) == each_choice([3, 2, 1])
+
+
+def test_covering_array_with_empty_parameter() -> None:
+    assert covering_array([3, 0, 3], 2) == []
+
+
+def test_covering_array_with_invalid_strength() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        covering_array([2, 2], 0)
+
+
+def test_covering_array_scales_to_many_parameters() -> None:
+    sizes: list[int] = [20] * 20
+    rows: list[tuple[int, ...]] = covering_array(sizes, 2)
+    assert_covers(rows, sizes, 2)
+    assert len(rows) < 20**2 * 3
+
+
+class TestProductIndices:
+    @pytest.mark.parametrize(argnames="sizes", argvalues=[[], [3], [2, 3], [4, 1, 3, 2]])
+    def test_getitem_matches_itertools_product(self, sizes: list[int]) -> None:
+        product: ProductIndices = ProductIndices(sizes)
+        expected: list[tuple[int, ...]] = list(itertools.product(*map(range, sizes)))
+        assert [product[i] for i in range(len(product))] == expected
+        assert list(product) == expected
+
+    def test_getitem_with_negative(self) -> None:
+        assert ProductIndices([2, 3])[-1] == (1, 2)
+
+    @pytest.mark.parametrize(argnames="index", argvalues=[6, -7])
+    def test_getitem_with_out_of_range(self, index: int) -> None:
+        with pytest.raises(IndexError):
+            ProductIndices([2, 3])[index]
+
+    def test_getitem_with_huge_product(self) -> None:
+        product: ProductIndices = ProductIndices([1000] * 10)
+        assert product.size == 1000**10
+        assert product[7_345_112] == (0, 0, 0, 0, 0, 0, 0, 7, 345, 112)
+
+    @pytest.mark.parametrize(argnames="index", argvalues=[slice(1, None, 3), slice(None, None, -2), slice(4, 2)])
+    def test_getitem_with_slice(self, index: slice) -> None:
+        product: ProductIndices = ProductIndices([2, 3, 2])
+        view: Sequence[tuple[int, ...]] = product[index]
+        assert isinstance(view, CombinationView)
+        assert list(view) == list(product)[index]
+        assert len(view) == len(list(product)[index])
+
+    def test_getitem_with_slice_of_huge_product(self) -> None:
+        view: Sequence[tuple[int, ...]] = ProductIndices([1000] * 10)[3::4]
+        assert count_combinations(view) == 1000**10 // 4
+        assert view[1] == (0, 0, 0, 0, 0, 0, 0, 0, 0, 7)
+        assert view[1:][0] == view[1]
+
+
+def test_count_combinations() -> None:
+    assert count_combinations(ProductIndices([1000] * 10)) == 1000**10
+    assert count_combinations([(0,), (1,)]) == 2
+
+
+@pytest.mark.parametrize(
+    argnames=("sizes", "strategy", "expected"),
+    argvalues=[
+        ([3, 4], "product", 12),
+        ([3, 4], "pairwise", 12),
+        ([3, 4, 5], "each-choice", 5),
+        ([3, 0, 5], "pairwise", 0),
+        ([2] * 10, "pairwise", 4),
+        ([3, 10, 5, 7], "t-wise(3)", 350),
+        ([], "pairwise", 1),
+    ],
+)
+def test_min_combinations(sizes: list[int], strategy: str, expected: int) -> None:
+    assert min_combinations(sizes, strategy) == expected
+
+
+@pytest.mark.parametrize(
+    argnames=("sizes", "strategy"),
+    argvalues=[([2] * 10, "pairwise"), ([3] * 8, "pairwise"), ([3] * 6, "t-wise(3)"), ([2, 4, 3, 2, 2], "t-wise(3)")],
+)
+def test_min_combinations_is_a_lower_bound(sizes: list[int], strategy: str) -> None:
+    assert min_combinations(sizes, strategy) <= count_combinations(get_combination_indices(sizes, strategy))
+
+
+@pytest.mark.parametrize(argnames=("shard", "expected"), argvalues=[("1/1", (0, 1)), ("2/4", (1, 4)), ("4/4", (3, 4))])
+def test_parse_shard(shard: str, expected: tuple[int, int]) -> None:
+    assert parse_shard(shard) == expected
+
+
+@pytest.mark.parametrize(argnames="shard", argvalues=["0/4", "5/4", "1", "a/b", "1/0"])
+def test_parse_shard_with_invalid(shard: str) -> None:
+    with pytest.raises(ValueError, match="shard"):
+        parse_shard(shard)
+
+
+@pytest.mark.parametrize(argnames="combinations", argvalues=[ProductIndices([3, 4, 5]), covering_array([3, 4, 5], 2)])
+def test_shard_combinations_partitions_every_combination(combinations: Sequence[tuple[int, ...]]) -> None:
+    shards: list[list[tuple[int, ...]]] = [list(shard_combinations(combinations, i, 3)) for i in range(3)]
+    assert sorted(itertools.chain.from_iterable(shards)) == sorted(combinations)
+    assert max(map(len, shards)) - min(map(len, shards)) <= 1
+
+
+class TestSampleCombinations:
+    def test_is_reproducible(self) -> None:
+        product: ProductIndices = ProductIndices([10, 10, 10])
+        assert sample_combinations(product, 20, seed=1) == sample_combinations(product, 20, seed=1)
+        assert sample_combinations(product, 20, seed=1) != sample_combinations(product, 20, seed=2)
+
+    def test_keeps_original_order(self) -> None:
+        product: ProductIndices = ProductIndices([10, 10, 10])
+        sample: Sequence[tuple[int, ...]] = sample_combinations(product, 50, seed=3)
+        assert len(set(sample)) == 50
+        assert list(sample) == sorted(sample)
+
+    def test_with_huge_product(self) -> None:
+        sizes: list[int] = [100] * 10
+        sample: Sequence[tuple[int, ...]] = sample_combinations(ProductIndices(sizes), 500, seed=0)
+        assert len(set(sample)) == 500
+        assert all(0 <= value < 100 for row in sample for value in row)
+
+    def test_with_max_cases_above_total(self) -> None:
+        rows: list[tuple[int, ...]] = [(0,), (1,)]
+        assert sample_combinations(rows, 5) is rows
+
+    def test_with_negative_max_cases(self) -> None:
+        with pytest.raises(ValueError, match="non-negative"):
+            sample_combinations([(0,)], -1)
@@ -0,0 +1,26 @@
+import pickle
+
+from pytest_static.custom_typing import InstanceSet
+
+
+class TestInstanceSet:
+    def test_keeps_first_occurrence_order(self) -> None:
+        assert tuple(InstanceSet([3, 1, 3, 2, 1])) == (3, 1, 2)
+
+    def test_contains(self) -> None:
+        instance_set: InstanceSet[int] = InstanceSet([3, 1, 2])
+        assert 1 in instance_set
+        assert 4 not in instance_set
+
+    def test_contains_with_unhashable(self) -> None:
+        instance_set: InstanceSet[object] = InstanceSet([1])
+        assert [1] not in instance_set
+
+    def test_repr(self) -> None:
+        assert repr(InstanceSet(["a", "b"])) == "InstanceSet(('a', 'b'))"
+
+    def test_pickle(self) -> None:
+        instance_set: InstanceSet[str] = InstanceSet(["b", "a"])
+        unpickled: InstanceSet[str] = pickle.loads(pickle.dumps(instance_set))  # noqa: S301
+        assert unpickled == instance_set
+        assert "a" in unpickled
@@ -0,0 +1,91 @@
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+from typing import NamedTuple
+
+import pytest
+
+from pytest_static.ids import COMPACT
+from pytest_static.ids import IdMaker
+from pytest_static.ids import make_digest
+from pytest_static.ids import stable_repr
+from pytest_static.ids import write_id_map
+
+
+LONG_VALUE: tuple[int, ...] = tuple(range(50))
+
+
+class TestIdMaker:
+    def test_get_id_with_repr(self) -> None:
+        id_maker: IdMaker = IdMaker([(True, False), ("a", LONG_VALUE)])
+        assert id_maker.get_id((0, 1)) == f"True, {LONG_VALUE!r}"
+        assert id_maker.digests == {}
+
+    def test_get_id_with_compact(self) -> None:
+        id_maker: IdMaker = IdMaker([(True, False), ("a", LONG_VALUE)], style=COMPACT, max_length=10)
+        compact_id: str = f"tuple-{make_digest(repr(LONG_VALUE))}"
+        assert id_maker.get_id((1, 1)) == f"False, {compact_id}"
+        assert id_maker.get_id((0, 0)) == "True, 'a'"
+        assert id_maker.digests == {compact_id: repr(LONG_VALUE)}
+
+    def test_get_id_with_labels(self) -> None:
+        id_maker: IdMaker = IdMaker([(True, False), ("a", LONG_VALUE)], labels=[None, "b"])
+        assert id_maker.get_id((1, 1)) == "False, b1"
+
+    def test_get_value_id_is_cached(self) -> None:
+        calls: list[int] = []
+
+        class CountedRepr:
+            def __repr__(self) -> str:
+                calls.append(1)
+                return "counted"
+
+        id_maker: IdMaker = IdMaker([(CountedRepr(),), (1, 2, 3)])
+        for index in range(3):
+            id_maker.get_id((0, index))
+        assert len(calls) == 1
+
+    def test_init_with_invalid_style(self) -> None:
+        with pytest.raises(ValueError, match="Unknown id style"):
+            IdMaker([], style="short")
+
+
+@dataclasses.dataclass
+class Tagged:
+    tags: set[str]
+
+
+class TaggedTuple(NamedTuple):
+    tags: frozenset[str]
+
+
+@pytest.mark.parametrize(
+    argnames=("value", "expected"),
+    argvalues=[
+        (set(), "set()"),
+        ({"b", "a"}, "{'a', 'b'}"),
+        (frozenset({b"b", b"a"}), "frozenset({b'a', b'b'})"),
+        ([{"b", "a"}, ()], "[{'a', 'b'}, ()]"),
+        (({"b", "a"},), "({'a', 'b'},)"),
+        ({"key": frozenset({2, 1})}, "{'key': frozenset({1, 2})}"),
+        (Tagged({"b", "a"}), "Tagged(tags={'a', 'b'})"),
+        (TaggedTuple(frozenset({"b", "a"})), "TaggedTuple(tags=frozenset({'a', 'b'}))"),
+        (LONG_VALUE, repr(LONG_VALUE)),
+    ],
+)
+def test_stable_repr(value: Any, expected: str) -> None:
+    assert stable_repr(value) == expected
+
+
+@pytest.mark.parametrize(argnames="text", argvalues=["", "abc", "\ud800", repr(LONG_VALUE)])
+def test_make_digest(text: Any) -> None:
+    assert make_digest(text) == make_digest(text)
+    assert len(make_digest(text)) == 12
+
+
+def test_write_id_map(tmp_path: Path) -> None:
+    path: Path = tmp_path / "nested" / "ids.json"
+    write_id_map({"a": "1"}, path)
+    write_id_map({"b": "2"}, path)
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": "1", "b": "2"}
@@ -0,0 +1,20 @@
+from types import SimpleNamespace
+
+from pytest_static.lazy import LazyValue
+from pytest_static.lazy import resolve_lazy_param
+
+
+class TestLazyValue:
+    def test_resolve(self) -> None:
+        assert LazyValue(("a", "b", "c"), 1).resolve() == "b"
+
+    def test_repr_does_not_resolve(self) -> None:
+        assert repr(LazyValue(("a", "b", "c"), 2)) == "LazyValue(index=2)"
+
+
+def test_resolve_lazy_param() -> None:
+    request: SimpleNamespace = SimpleNamespace(param=LazyValue((1, 2), 1))
+    resolve_lazy_param(request)
+    assert request.param == 2
+    resolve_lazy_param(request)
+    assert request.param == 2
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from pytest_static.marks import iter_marked_argtypes
+
+
+@pytest.mark.parametrize_types(argnames=["a", "b"], argtypes=[int, str])
+def marked_function(a: int, b: str) -> None:
+    pass
+
+
+@pytest.mark.parametrize_types(["a"], [bytes], lazy=True)
+def lazy_function(a: bytes) -> None:
+    pass
+
+
+@pytest.mark.parametrize_types(["a"], [bytes], profile="smoke")
+def profile_function(a: bytes) -> None:
+    pass
+
+
+@pytest.mark.parametrize_types(["a"], [float])
+class MarkedClass:
+    @pytest.mark.parametrize_types(["b"], [complex])
+    def marked_method(self, a: float, b: complex) -> None:
+        pass
+
+
+def test_iter_marked_argtypes() -> None:
+    namespace: dict[str, Any] = {
+        "__name__": __name__,
+        "pytestmark": [pytest.mark.parametrize_types(["a"], [bool]).mark],
+        "marked_function": marked_function,
+        "lazy_function": lazy_function,
+        "profile_function": profile_function,
+        "MarkedClass": MarkedClass,
+    }
+    assert list(iter_marked_argtypes(namespace)) == [bool, int, str, float, complex]
+
+
+class First:
+    pass
+
+
+@pytest.mark.parametrize_types(["a"], [bytes])
+class Second:
+    first: type[First] = First
+
+
+First.second = Second  # type: ignore[attr-defined]
+
+
+def test_iter_marked_argtypes_with_cyclic_classes() -> None:
+    assert list(iter_marked_argtypes({"__name__": __name__, "First": First, "Second": Second})) == [bytes]
+
+
+def test_iter_marked_argtypes_skips_imported_classes() -> None:
+    assert list(iter_marked_argtypes({"__name__": "other_module", "MarkedClass": MarkedClass})) == []
@@ -0,0 +1,140 @@
+import itertools
+from typing import Any
+
+import pytest
+
+from pytest_static.combinations import CombinationView
+from pytest_static.combinations import ProductIndices
+from pytest_static.combinations import count_combinations
+from pytest_static.ordering import EdgeFirstIndices
+from pytest_static.ordering import EdgeFirstPermutation
+from pytest_static.ordering import check_order
+from pytest_static.ordering import edge_first_permutation
+from pytest_static.ordering import is_edge_value
+from pytest_static.ordering import order_edge_first
+from pytest_static.plan import CollectionPlan
+from pytest_static.plan import LeafPlan
+from pytest_static.plan import ProductPlan
+from pytest_static.plan import SumPlan
+from pytest_static.type_sets import INT_PARAMS
+
+
+class Unsized:
+    def __len__(self) -> int:
+        """Raises a TypeError like objects whose size is unknown."""
+        raise TypeError
+
+
+@pytest.mark.parametrize(
+    argnames=("value", "expected"),
+    argvalues=[
+        (None, True),
+        (False, False),
+        (0, True),
+        (1, False),
+        (2147483647, True),
+        (-9223372036854775808, True),
+        (127, True),
+        (1.0, False),
+        (-0.0, True),
+        (float("nan"), True),
+        (float("-inf"), True),
+        (1j, False),
+        (complex(float("inf"), 1), True),
+        ("", True),
+        ("a", False),
+        (b"", True),
+        ([], True),
+        ({"a": 1}, False),
+        (Unsized(), False),
+        (object(), False),
+    ],
+)
+def test_is_edge_value(value: Any, expected: bool) -> None:
+    assert is_edge_value(value) is expected
+
+
+def test_edge_first_permutation() -> None:
+    permutation, edge_count = edge_first_permutation(INT_PARAMS)
+    assert [INT_PARAMS[index] for index in permutation[:edge_count]] == [
+        0,
+        2147483647,
+        -2147483648,
+        9223372036854775807,
+        -9223372036854775808,
+    ]
+    assert sorted(permutation) == list(range(len(INT_PARAMS)))
+
+
+def _fail_to_build(*_: Any) -> Any:
+    raise AssertionError("An instance was built.")
+
+
+def test_edge_first_permutation_of_plan_builds_no_instance() -> None:
+    plan: SumPlan = SumPlan(
+        [
+            LeafPlan([1, None]),
+            CollectionPlan([LeafPlan([1, 2])], sizes=(1, 0), type_constructor=_fail_to_build),
+            ProductPlan([LeafPlan([0])], type_constructor=_fail_to_build),
+        ]
+    )
+    permutation, edge_count = edge_first_permutation(plan)
+    assert isinstance(permutation, EdgeFirstPermutation)
+    assert (list(permutation), edge_count) == ([1, 4, 0, 2, 3, 5], 2)
+
+
+def test_edge_first_permutation_access() -> None:
+    permutation: EdgeFirstPermutation = EdgeFirstPermutation([1, 3], 5)
+    assert list(permutation) == [1, 3, 0, 2, 4]
+    assert permutation[2:] == [0, 2, 4]
+    assert permutation[-1] == 4
+    with pytest.raises(IndexError, match="out of range"):
+        permutation[5]
+
+
+@pytest.mark.parametrize(
+    argnames=("sizes", "edge_counts"),
+    argvalues=[((3, 2, 4), (1, 0, 2)), ((3, 3), (3, 1)), ((2, 0, 2), (1, 0, 1)), ((), ())],
+)
+def test_edge_first_indices(sizes: tuple[int, ...], edge_counts: tuple[int, ...]) -> None:
+    indices: EdgeFirstIndices = EdgeFirstIndices(sizes, edge_counts)
+    combinations: list[tuple[int, ...]] = list(indices)
+    assert sorted(combinations) == list(ProductIndices(sizes))
+    assert [indices[i] for i in range(len(indices))] == combinations
+    non_edges: list[int] = [sum(map(int.__ge__, combination, edge_counts)) for combination in combinations]
+    assert non_edges == sorted(non_edges)
+
+
+def test_edge_first_indices_access() -> None:
+    indices: EdgeFirstIndices = EdgeFirstIndices((3, 4), (1, 2))
+    assert list(indices[:3]) == [(0, 0), (0, 1), (1, 0)]
+    assert isinstance(indices[::2], CombinationView)
+    assert indices[-1] == (2, 3)
+    assert count_combinations(indices) == 12
+    with pytest.raises(IndexError, match="out of range"):
+        indices[12]
+
+
+def test_order_edge_first() -> None:
+    assert isinstance(order_edge_first(ProductIndices((2, 2)), (1, 1)), EdgeFirstIndices)
+    assert order_edge_first([(1, 1), (1, 0), (0, 0), (0, 1)], (1, 1)) == [(0, 0), (1, 0), (0, 1), (1, 1)]
+
+
+def test_check_order() -> None:
+    assert check_order("edge-first") == "edge-first"
+    with pytest.raises(ValueError, match="Unknown order 'random'"):
+        check_order("random")
+
+
+def test_edge_first_indices_matches_product_of_edges() -> None:
+    indices: EdgeFirstIndices = EdgeFirstIndices((5, 5, 5), (2, 2, 2))
+    assert list(itertools.islice(indices, 8)) == list(itertools.product(range(2), repeat=3))
+
+
+def test_edge_first_indices_with_many_parameters() -> None:
+    indices: EdgeFirstIndices = EdgeFirstIndices((5,) * 40, (2,) * 40)
+    assert indices.size == 5**40
+    assert indices[2**40 - 1] == (1,) * 40
+    assert indices[2**40] == (2,) + (0,) * 39
+    assert indices[-1] == (4,) * 40
+    assert list(itertools.islice(indices, 2)) == [(0,) * 40, (0,) * 39 + (1,)]
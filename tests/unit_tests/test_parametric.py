@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import collections.abc
+import dataclasses
+import typing
+from enum import Enum
+from enum import Flag
+from enum import IntEnum
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Dict
+from typing import ForwardRef
+from typing import FrozenSet
+from typing import List
 from typing import Literal
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import TypeVar
+from typing import Union
 
 import pytest
 from typing_extensions import ParamSpec
 from typing_extensions import Protocol
+from typing_extensions import TypedDict
 
+from pytest_static.combinations import ProductIndices
+from pytest_static.parametric import DEFAULT_COLLECTION_SIZES
+from pytest_static.parametric import _describe_definitions
+from pytest_static.parametric import _get_value_shapes
 from pytest_static.parametric import _iter_bool_instances
 from pytest_static.parametric import _iter_bytes_instances
 from pytest_static.parametric import _iter_callable_instances
@@ -22,11 +43,27 @@ from pytest_static.parametric import _iter_none_instances
 from pytest_static.parametric import _iter_protocol_instances
 from pytest_static.parametric import _iter_str_instances
 from pytest_static.parametric import _iter_type_var_instances
+from pytest_static.parametric import _shape_sets_overlap
+from pytest_static.parametric import compile_type
+from pytest_static.parametric import count_flag_combinations
+from pytest_static.parametric import count_instances
 from pytest_static.parametric import get_all_possible_type_instances
+from pytest_static.parametric import get_enum_members
+from pytest_static.parametric import iter_flag_combinations
 from pytest_static.parametric import iter_instances
+from pytest_static.parametric import iter_structured_instances
+from pytest_static.parametric import register_collection_sizes
+from pytest_static.parametric import register_flag_combinations
+from pytest_static.parametric import register_structured_types
 from pytest_static.parametric import type_handlers
+from pytest_static.plan import ProductPlan
+from pytest_static.plan import SumPlan
+from pytest_static.recursion import DEFAULT_MAX_DEPTH
 from pytest_static.type_sets import DEFAULT_INSTANCE_SETS
 from pytest_static.type_sets import INT_PARAMS
+from pytest_static.type_sets import PROFILES
+from pytest_static.type_sets import STR_PARAMS
+from pytest_static.util import get_base_type
 from tests.util import ANY_LEN
 from tests.util import BASIC_TYPE_EXPECTED_EXAMPLES
 from tests.util import BOOL_LEN
@@ -46,12 +83,16 @@ from tests.util import dummy_type_handler
 
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
     from collections.abc import Generator
     from collections.abc import Iterable
 
+    from _pytest.fixtures import FixtureRequest
     from _pytest.monkeypatch import MonkeyPatch
 
     from pytest_static.custom_typing import TypeHandler
+    from pytest_static.plan import Plan
+    from pytest_static.type_handler import TypeHandlerRegistry
 
 
 NoneType: type[None] = type(None)
@@ -84,6 +125,7 @@ def test_module_level_registrations() -> None:
     assert len(test_type_handlers._mapping) > len(BASIC_TYPE_EXPECTED_EXAMPLES)
 
 
+@pytest.mark.usefixtures("clean_instance_cache")
 def test_get_all_possible_type_instances(monkeypatch: MonkeyPatch) -> None:
     def example_ints(base_type: Any, type_args: tuple[Any, ...]) -> Generator[Any]:
         yield from [1, 2, 3]
@@ -93,6 +135,45 @@ def test_get_all_possible_type_instances(monkeypatch: MonkeyPatch) -> None:
     assert get_all_possible_type_instances(int) == (1, 2, 3)
 
 
+class Custom:
+    pass
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_get_all_possible_type_instances_runs_custom_handlers_once_in_a_sum(monkeypatch: MonkeyPatch) -> None:
+    calls: list[Any] = []
+
+    def custom_handler(base_type: Any, type_args: tuple[Any, ...]) -> Generator[Any]:
+        calls.append(base_type)
+        yield "custom"
+
+    monkeypatch.setitem(type_handlers._mapping, Custom, [custom_handler])
+
+    assert get_all_possible_type_instances(Optional[Custom]) == ("custom", None)
+    assert tuple(compile_type(Optional[Custom])) == ("custom", None)
+    assert calls == [Custom]
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_get_all_possible_type_instances_reuses_cached_instances() -> None:
+    first: tuple[Any, ...] = get_all_possible_type_instances(List[int])
+    hits: int = type_handlers.instance_cache.hits
+
+    assert get_all_possible_type_instances(list[int]) is first
+    assert type_handlers.instance_cache.hits == hits + 1
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_get_all_possible_type_instances_with_registration_invalidates_cache(
+    type_handler_registry: TypeHandlerRegistry,
+) -> None:
+    type_handler_registry.register(int)(dummy_type_handler)
+    assert get_all_possible_type_instances(int, type_handler_registry) == DUMMY_TYPE_HANDLER_OUTPUT
+
+    type_handler_registry.clear(int)
+    assert get_all_possible_type_instances(int, type_handler_registry) == ()
+
+
 @pytest.mark.parametrize(
     argnames=("typ", "expected_len"),
     argvalues=SPECIAL_TYPE_EXPECTED_EXAMPLES,
@@ -232,3 +313,573 @@ def test__iter_bytes_instances() -> None:
 
 def test__iter_literal_instances() -> None:
     assert_len(_iter_literal_instances(Literal, tuple(INT_PARAMS)), INT_LEN)
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected_len"),
+    argvalues=[
+        *SPECIAL_TYPE_EXPECTED_EXAMPLES,
+        *BASIC_TYPE_EXPECTED_EXAMPLES,
+        *SUM_TYPE_EXPECTED_EXAMPLES,
+        *PRODUCT_TYPE_EXPECTED_EXAMPLES,
+    ],
+    ids=lambda typ: f"{typ}",
+)
+def test_count_instances(typ: Any, expected_len: int) -> None:
+    assert count_instances(typ) == expected_len
+    assert type_handlers.instance_cache.info().currsize == 0
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_count_instances_without_enumerating() -> None:
+    expected: int = STR_LEN**5 * INT_LEN**5
+
+    assert count_instances(tuple[str, str, str, str, str, int, int, int, int, int]) == expected
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected_len"),
+    argvalues=[(T_temp_constrained, INT_LEN + STR_LEN), (T_temp_bound, INT_LEN), (dummy_callable, ANY_LEN)],
+)
+def test_count_instances_with_fallback(typ: Any, expected_len: int) -> None:
+    assert count_instances(typ) == expected_len
+
+
+def test_count_instances_with_invalid_fallback() -> None:
+    with pytest.raises(TypeError, match="counting"):
+        count_instances(1)
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_count_instances_with_counter(type_handler_registry: TypeHandlerRegistry) -> None:
+    def unreachable(base_type: Any, type_args: tuple[Any, ...]) -> Generator[Any]:
+        raise AssertionError
+
+    type_handler_registry.register(int, counter=lambda *_: 7)(unreachable)
+
+    assert count_instances(int, type_handler_registry) == 7
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_count_instances_without_counter(type_handler_registry: TypeHandlerRegistry) -> None:
+    type_handler_registry.register(int)(dummy_type_handler)
+
+    assert count_instances(int, type_handler_registry) == len(DUMMY_TYPE_HANDLER_OUTPUT)
+    assert type_handler_registry.instance_cache.get(int) == DUMMY_TYPE_HANDLER_OUTPUT
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected_len"),
+    argvalues=[
+        *SPECIAL_TYPE_EXPECTED_EXAMPLES,
+        *BASIC_TYPE_EXPECTED_EXAMPLES,
+        *SUM_TYPE_EXPECTED_EXAMPLES,
+        *PRODUCT_TYPE_EXPECTED_EXAMPLES,
+        (T_temp_constrained, INT_LEN + STR_LEN),
+        (dummy_callable, ANY_LEN),
+    ],
+    ids=lambda typ: f"{typ}",
+)
+def test_compile_type(typ: Any, expected_len: int) -> None:
+    plan: Plan = compile_type(typ)
+    expected: list[Any] = list(iter_instances(typ))
+    assert len(plan) == expected_len
+    assert list(plan) == expected
+    assert [plan.nth(i) for i in range(len(plan))] == expected
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_compile_type_reuses_plan() -> None:
+    assert compile_type(List[int]) is compile_type(list[int])
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_compile_type_without_enumerating() -> None:
+    plan: Plan = compile_type(tuple[str, str, str, str, str, int, int, int, int, int])
+    assert plan.size == STR_LEN**5 * INT_LEN**5
+    digits: tuple[int, ...] = ProductIndices([STR_LEN] * 5 + [INT_LEN] * 5)[7_345_112]
+    params: list[tuple[Any, ...]] = [STR_PARAMS] * 5 + [INT_PARAMS] * 5
+    assert plan.nth(7_345_112) == tuple(p[digit] for p, digit in zip(params, digits))
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_compile_type_with_registration_invalidates_plan(type_handler_registry: TypeHandlerRegistry) -> None:
+    type_handler_registry.register(int)(dummy_type_handler)
+    assert list(compile_type(int, type_handler_registry)) == list(DUMMY_TYPE_HANDLER_OUTPUT)
+
+    type_handler_registry.clear(int)
+    assert list(compile_type(int, type_handler_registry)) == []
+
+
+def test_compile_type_with_invalid_fallback() -> None:
+    with pytest.raises(TypeError, match="compiling"):
+        compile_type(1)
+
+
+class UserId(int):
+    pass
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected_len"),
+    argvalues=[
+        (UserId, INT_LEN),
+        (collections.abc.Sequence[int], INT_LEN),
+        (typing.Mapping[str, int], STR_LEN * INT_LEN),
+        (collections.abc.MutableSet[bool], BOOL_LEN),
+    ],
+    ids=lambda typ: f"{typ}",
+)
+def test_get_all_possible_type_instances_with_unregistered_type(typ: Any, expected_len: int) -> None:
+    assert len(get_all_possible_type_instances(typ)) == expected_len
+    assert count_instances(typ) == expected_len
+    assert len(compile_type(typ)) == expected_len
+
+
+Coordinates = collections.namedtuple("Coordinates", "x y")
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected"),
+    argvalues=[
+        (Coordinates, Coordinates(x=True, y=True)),
+        (collections.deque[int], collections.deque()),
+        (collections.OrderedDict[bool, bool], collections.OrderedDict()),
+        (collections.Counter[bool], collections.Counter()),
+    ],
+    ids=lambda typ: f"{typ}",
+)
+def test_get_all_possible_type_instances_with_collection_subclass(typ: Any, expected: Any) -> None:
+    instances: tuple[Any, ...] = get_all_possible_type_instances(typ)
+    assert instances[0] == expected
+    assert all(type(instance) is get_base_type(typ) for instance in instances)
+    assert count_instances(typ) == len(instances)
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+    CRIMSON = 1
+
+
+class Number(IntEnum):
+    ONE = 1
+    TWO = 2
+
+
+class Name(str, Enum):
+    ALICE = "alice"
+    BOB = "bob"
+
+
+class Permission(Flag):
+    READ = 1
+    WRITE = 2
+    EXECUTE = 4
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected"),
+    argvalues=[
+        (Color, (Color.RED, Color.GREEN, Color.BLUE)),
+        (Number, (Number.ONE, Number.TWO)),
+        (Name, (Name.ALICE, Name.BOB)),
+        (Permission, (Permission.READ, Permission.WRITE, Permission.EXECUTE)),
+    ],
+)
+def test_get_all_possible_type_instances_with_enum(typ: Any, expected: tuple[Any, ...]) -> None:
+    assert get_all_possible_type_instances(typ) == expected
+    assert count_instances(typ) == len(expected)
+    assert tuple(compile_type(typ)) == expected
+
+
+def test_get_enum_members_is_cached() -> None:
+    get_enum_members(Color)
+    hits: int = get_enum_members.cache_info().hits
+    assert get_enum_members(Color) is get_enum_members(Color)
+    assert get_enum_members.cache_info().hits == hits + 2
+
+
+def test_iter_flag_combinations() -> None:
+    combinations: list[Flag] = list(iter_flag_combinations(Permission))
+    assert len(combinations) == count_flag_combinations(Permission) == 2**3
+    assert combinations[0] == Permission(0)
+    assert combinations[-1] == Permission.READ | Permission.WRITE | Permission.EXECUTE
+    assert len(set(combinations)) == len(combinations)
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_register_flag_combinations(type_handler_registry: TypeHandlerRegistry) -> None:
+    register_flag_combinations(Permission, handler_registry=type_handler_registry)
+    assert len(get_all_possible_type_instances(Permission, type_handler_registry)) == 2**3
+    assert count_instances(Permission, type_handler_registry) == 2**3
+
+
+@dataclasses.dataclass(frozen=True)
+class Model:
+    flag: bool
+    number: int
+    other: bool
+    label: Optional[str] = None
+
+
+class Pair(NamedTuple):
+    first: bool
+    second: bool
+
+
+class Movie(TypedDict):
+    title: Literal["a", "b"]
+    year: Literal[1, 2, 3]
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected_len"),
+    argvalues=[
+        (Model, BOOL_LEN * INT_LEN * BOOL_LEN * (STR_LEN + NONE_LEN)),
+        (Pair, BOOL_LEN**2),
+        (Movie, 6),
+    ],
+    ids=lambda typ: f"{typ}",
+)
+def test_get_all_possible_type_instances_with_structured_type(typ: Any, expected_len: int) -> None:
+    instances: tuple[Any, ...] = get_all_possible_type_instances(typ)
+    assert len(instances) == expected_len
+    assert all(isinstance(instance, dict if typ is Movie else typ) for instance in instances)
+    assert count_instances(typ) == expected_len
+    assert tuple(compile_type(typ)) == instances
+
+
+def test_iter_structured_instances_with_skip_defaults() -> None:
+    instances: list[Model] = list(iter_structured_instances(Model, (), skip_defaults=True))
+    assert len(instances) == BOOL_LEN * INT_LEN * BOOL_LEN
+    assert {instance.label for instance in instances} == {None}
+
+
+def test_iter_structured_instances_with_strategy() -> None:
+    instances: list[Model] = list(iter_structured_instances(Model, (), skip_defaults=True, strategy="each-choice"))
+    assert len(instances) == INT_LEN
+    assert {instance.number for instance in instances} == set(INT_PARAMS)
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_register_structured_types(type_handler_registry: TypeHandlerRegistry) -> None:
+    type_handler_registry.register(bool)(_iter_bool_instances)
+    type_handler_registry.register(int)(_iter_int_instances)
+    register_structured_types(Model, skip_defaults=True, strategy="pairwise", handler_registry=type_handler_registry)
+
+    instances: tuple[Any, ...] = get_all_possible_type_instances(Model, type_handler_registry)
+    assert len(instances) == count_instances(Model, type_handler_registry) == INT_LEN * BOOL_LEN
+    assert len(instances) < BOOL_LEN * INT_LEN * BOOL_LEN
+
+
+def test_register_structured_types_with_invalid(type_handler_registry: TypeHandlerRegistry) -> None:
+    with pytest.raises(TypeError, match="dataclass"):
+        register_structured_types(int, handler_registry=type_handler_registry)
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_get_all_possible_type_instances_with_async_handler(type_handler_registry: TypeHandlerRegistry) -> None:
+    @type_handler_registry.register(int)
+    async def _iter_async_ints(base_type: Any, type_args: tuple[Any, ...]) -> AsyncGenerator[Any, None]:
+        for value in (1, 2, 3):
+            yield value
+
+    assert get_all_possible_type_instances(int, type_handler_registry) == (1, 2, 3)
+    assert tuple(compile_type(int, type_handler_registry)) == (1, 2, 3)
+
+
+Json = Union[int, str, List["Json"], Dict[str, "Json"]]
+JSON_LEAF_LEN: int = INT_LEN + STR_LEN
+
+
+@dataclasses.dataclass
+class LinkedNode:
+    value: bool
+    next: Optional[LinkedNode] = None
+
+
+@pytest.fixture
+def max_depth(request: FixtureRequest) -> Generator[int, None, None]:
+    depth: int = getattr(request, "param", DEFAULT_MAX_DEPTH)
+    type_handlers.set_max_depth(depth)
+    yield depth
+    type_handlers.set_max_depth(DEFAULT_MAX_DEPTH)
+
+
+@pytest.mark.parametrize(
+    argnames=("max_depth", "expected"),
+    argvalues=[(0, JSON_LEAF_LEN), (1, JSON_LEAF_LEN + (1 + STR_LEN) * JSON_LEAF_LEN)],
+    indirect=["max_depth"],
+)
+def test_get_all_possible_type_instances_with_recursive_alias(max_depth: int, expected: int) -> None:
+    with type_handlers.recursion.using_namespace({"Json": Json}):
+        instances: tuple[Any, ...] = get_all_possible_type_instances(Json)
+        assert len(instances) == count_instances(Json) == len(compile_type(Json)) == expected
+        assert tuple(compile_type(Json)) == instances
+    assert not any(isinstance(value, list) and value and isinstance(value[0], list) for value in instances)
+
+
+@pytest.mark.parametrize(argnames="max_depth", argvalues=[2], indirect=True)
+def test_count_instances_with_recursive_alias_is_linear(max_depth: int) -> None:
+    depth_1: int = JSON_LEAF_LEN + (1 + STR_LEN) * JSON_LEAF_LEN
+    with type_handlers.recursion.using_namespace({"Json": Json}):
+        assert count_instances(Json) == JSON_LEAF_LEN + (1 + STR_LEN) * depth_1
+
+
+@pytest.mark.usefixtures("max_depth")
+def test_get_all_possible_type_instances_with_recursive_alias_nested() -> None:
+    with type_handlers.recursion.using_namespace({"Json": Json}):
+        instances: tuple[Any, ...] = get_all_possible_type_instances(Json)
+        assert len(get_all_possible_type_instances(List[Json])) == len(instances)
+        assert type_handlers.recursion.normalize(Json) in type_handlers.recursion.recursive_keys
+        assert get_all_possible_type_instances(Json) is instances
+
+
+@pytest.mark.parametrize(argnames="annotation", argvalues=["Missing", ForwardRef("Missing")])
+def test_get_all_possible_type_instances_with_unresolved_forward_reference(annotation: Any) -> None:
+    with pytest.raises(TypeError, match="forward reference 'Missing'"):
+        get_all_possible_type_instances(annotation)
+
+
+@pytest.mark.usefixtures("max_depth")
+def test_get_all_possible_type_instances_with_self_referencing_dataclass() -> None:
+    instances: tuple[LinkedNode, ...] = get_all_possible_type_instances(LinkedNode)
+    assert len(instances) == count_instances(LinkedNode) == BOOL_LEN * (NONE_LEN + BOOL_LEN)
+    assert LinkedNode(True, LinkedNode(False)) in instances
+
+
+@pytest.fixture
+def collection_sizes(request: FixtureRequest) -> Generator[tuple[int, ...], None, None]:
+    sizes: tuple[int, ...] = getattr(request, "param", (0, 1, 2, 50))
+    register_collection_sizes(sizes=sizes)
+    yield sizes
+    register_collection_sizes(sizes=DEFAULT_COLLECTION_SIZES)
+
+
+@pytest.mark.usefixtures("clean_instance_cache", "collection_sizes")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected_len"),
+    argvalues=[
+        (List[int], 1 + INT_LEN + INT_LEN + INT_LEN),
+        (Tuple[bool, ...], 1 + BOOL_LEN + BOOL_LEN + BOOL_LEN),
+        (Set[int], 1 + INT_LEN + INT_LEN),
+        (FrozenSet[Union[bool, int]], 1 + INT_LEN + INT_LEN),
+        (Dict[bool, int], 1 + BOOL_LEN * INT_LEN + -(-INT_LEN // BOOL_LEN)),
+        (Tuple[bool, int], BOOL_LEN * INT_LEN),
+    ],
+)
+def test_get_all_possible_type_instances_with_collection_sizes(typ: Any, expected_len: int) -> None:
+    assert count_instances(typ) == expected_len
+    plan: Plan = compile_type(typ)
+    instances: tuple[Any, ...] = get_all_possible_type_instances(typ)
+    assert len(instances) == len(plan) == expected_len
+    assert list(plan) == list(instances)
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(argnames="collection_sizes", argvalues=[(0, 1, 2, 5)], indirect=True)
+@pytest.mark.parametrize(argnames="typ", argvalues=[Set[bool], FrozenSet[str]])
+def test_get_all_possible_type_instances_with_set_sizes_has_no_duplicates(typ: Any, collection_sizes: Any) -> None:
+    instances: tuple[Any, ...] = get_all_possible_type_instances(typ)
+    assert len(set(map(frozenset, instances))) == len(instances) == count_instances(typ)
+
+
+@pytest.mark.usefixtures("clean_instance_cache", "collection_sizes")
+def test_get_all_possible_type_instances_with_collection_sizes_builds_large_collections() -> None:
+    instances: tuple[Any, ...] = get_all_possible_type_instances(List[int])
+    assert instances[0] == []
+    assert {len(value) for value in instances} == {0, 1, 2, 50}
+    assert all(len(value) in (0, 1, 2, BOOL_LEN) for value in get_all_possible_type_instances(Dict[bool, int]))
+    assert all(len(value) in (0, 1, 2, BOOL_LEN) for value in get_all_possible_type_instances(Set[bool]))
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_get_all_possible_type_instances_with_unhashable_set_elements() -> None:
+    assert get_all_possible_type_instances(Set[Union[List[bool], bool]]) == ({True}, {False})
+
+
+def test_register_collection_sizes(type_handler_registry: TypeHandlerRegistry) -> None:
+    register_collection_sizes(list, sizes=(2, 0, 2), handler_registry=type_handler_registry)
+    assert get_all_possible_type_instances(List[bool], type_handler_registry) == ([], [True, False], [False, True])
+    assert count_instances(List[bool], type_handler_registry) == 3
+
+
+@pytest.mark.parametrize(
+    argnames=("collection_types", "sizes", "error"),
+    argvalues=[((list,), (-1,), ValueError), ((int,), (1,), TypeError)],
+)
+def test_register_collection_sizes_with_invalid(
+    type_handler_registry: TypeHandlerRegistry,
+    collection_types: tuple[Any, ...],
+    sizes: tuple[int, ...],
+    error: type[Exception],
+) -> None:
+    with pytest.raises(error, match="Expected"):
+        register_collection_sizes(*collection_types, sizes=sizes, handler_registry=type_handler_registry)
+
+
+def negate(flag: bool) -> bool:
+    return not flag
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected_len"),
+    argvalues=[
+        (Union[bool, int], BOOL_LEN + INT_LEN),
+        (Union[int, Literal[0, 5]], INT_LEN + 1),
+        (Union[Literal[1], Literal[1, 2]], 2),
+        (Optional[Literal[None, 1]], 2),
+        (Union[List[bool], List[int]], BOOL_LEN + INT_LEN),
+        (Union[List[int], typing.Sequence[int]], 2 * INT_LEN),
+        (Union[Movie, Dict[Literal["title"], Literal["a"]]], 2 * 3 + 1),
+        (Union[Model, Pair, Tuple[bool, bool]], count_instances(Model) + BOOL_LEN**2 * 2),
+        (Union[Permission, Literal[Permission.READ]], len(Permission)),
+        (Union[bool, T], ANY_LEN),
+        (Union[bool, negate], 2 * BOOL_LEN),
+    ],
+)
+def test_get_all_possible_type_instances_with_overlapping_sum(typ: Any, expected_len: int) -> None:
+    instances: tuple[Any, ...] = get_all_possible_type_instances(typ)
+    assert len(instances) == count_instances(typ) == len(compile_type(typ)) == expected_len
+    assert list(compile_type(typ)) == list(instances)
+
+
+@pytest.mark.parametrize(argnames="profile", argvalues=list(PROFILES))
+@pytest.mark.parametrize(argnames="typ", argvalues=[int, str, Tuple[bool, float], Optional[bytes], List[complex]])
+def test_get_all_possible_type_instances_with_profile(profile: str, typ: Any) -> None:
+    with type_handlers.using_profile(profile):
+        instances: tuple[Any, ...] = get_all_possible_type_instances(typ)
+        assert len(instances) == count_instances(typ) == compile_type(typ).size
+
+    if typ in PROFILES[profile]:
+        assert instances == tuple(PROFILES[profile][typ])
+
+
+def _may_overlap(first: Any, second: Any) -> bool:
+    with type_handlers.recursion.using_namespace({"Json": Json}):
+        return _shape_sets_overlap(
+            _get_value_shapes(first, type_handlers, frozenset()), _get_value_shapes(second, type_handlers, frozenset())
+        )
+
+
+@pytest.mark.parametrize(
+    argnames=("first", "second", "expected"),
+    argvalues=[
+        (int, Literal[1], True),
+        (bool, int, False),
+        (Literal[1], Literal[2], False),
+        (Tuple[int, str], Tuple[int], False),
+        (Tuple[int, str], Tuple[Literal[0], str], True),
+        (Tuple[str, str, str], Tuple[bytes, bytes], False),
+        (List[int], List[str], False),
+        (List[int], typing.Sequence[int], True),
+        (List[int], Set[int], False),
+        (Tuple[int, ...], Tuple[Literal[0], ...], True),
+        (Tuple[int, ...], List[int], False),
+        (Movie, Dict[str, int], True),
+        (Model, Pair, False),
+        (Permission, Literal[Permission.READ], True),
+        (Any, bytes, True),
+        (T_temp_constrained, Optional[str], True),
+        (Json, bool, False),
+        (Json, List[str], True),
+        (UserId, int, True),
+        (negate, bool, True),
+    ],
+)
+def test_shape_sets_overlap(first: Any, second: Any, expected: bool) -> None:
+    assert _may_overlap(first, second) is expected
+    assert _may_overlap(second, first) is expected
+
+
+@pytest.mark.parametrize(argnames="handler", argvalues=[dummy_type_handler, partial(dummy_type_handler)])
+def test_get_value_shapes_with_custom_handler(type_handler_registry: TypeHandlerRegistry, handler: Any) -> None:
+    type_handler_registry.register(int)(handler)
+    assert _get_value_shapes(int, type_handler_registry, frozenset()) is None
+
+
+@pytest.mark.usefixtures("collection_sizes")
+@pytest.mark.parametrize(argnames="collection_sizes", argvalues=[(0, 2)], indirect=True)
+def test_shape_sets_overlap_with_empty_collections() -> None:
+    assert _may_overlap(List[int], List[str])
+    assert not _may_overlap(Set[int], List[int])
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(
+    argnames=("typ", "expected_len"),
+    argvalues=[
+        (Union[Tuple[str, str, str], Tuple[bytes, bytes]], STR_LEN**3 + BYTES_LEN**2),
+        (Union[Tuple[bool, int], Tuple[bool, Literal[0]]], BOOL_LEN * INT_LEN + BOOL_LEN),
+    ],
+)
+def test_count_instances_with_overlapping_containers_is_structural(typ: Any, expected_len: int) -> None:
+    plan: Plan = compile_type(typ)
+    assert count_instances(typ) == plan.size == expected_len
+    assert isinstance(plan, SumPlan)
+    assert all(isinstance(branch, ProductPlan) for branch in plan.plans)
+
+
+def test_describe_definitions_with_redefined_dataclass() -> None:
+    first: Any = dataclasses.make_dataclass("D", [("a", bool)])
+    second: Any = dataclasses.make_dataclass("D", [("a", bool), ("b", bool)])
+    assert repr(List[first]) == repr(List[second])
+    assert _describe_definitions(List[first], type_handlers) != _describe_definitions(List[second], type_handlers)
+
+
+def test_describe_definitions_with_type_vars_of_same_name() -> None:
+    first: tuple[str, ...] = _describe_definitions(TypeVar("T", int, str), type_handlers)
+    second: tuple[str, ...] = _describe_definitions(TypeVar("T", int, bytes), type_handlers)
+    assert first != second
+
+
+@dataclasses.dataclass
+class Outer:
+    inner: Pair
+    values: Dict[str, Tuple[int, ...]]
+
+
+def test_describe_definitions_with_nested_classes() -> None:
+    descriptions: tuple[str, ...] = _describe_definitions(Optional[Outer], type_handlers)
+    assert any("Outer" in description for description in descriptions)
+    assert any("Pair" in description for description in descriptions)
+    assert _describe_definitions(Tuple[int, str], type_handlers) == ()
+
+
+class Plain:
+    flag: bool
+    outer: Outer
+
+
+class Unresolvable:
+    value: "Missing"  # type: ignore[name-defined]  # noqa: F821
+
+
+@pytest.mark.parametrize(
+    argnames=("annotation", "expected"),
+    argvalues=[
+        (typing.Callable[[Outer], int], ("Outer", "Pair")),
+        (Plain, ("Plain", "Outer", "Pair")),
+        (Unresolvable, ("Unresolvable",)),
+    ],
+)
+def test_describe_definitions_with_constructors(annotation: Any, expected: tuple[str, ...]) -> None:
+    descriptions: str = "\n".join(_describe_definitions(annotation, type_handlers))
+    assert all(name in descriptions for name in expected)
+
+
+def test_describe_definitions_with_registered_class(type_handler_registry: TypeHandlerRegistry) -> None:
+    type_handler_registry.register(Plain)(dummy_type_handler)
+    descriptions: str = "\n".join(_describe_definitions(Plain, type_handler_registry))
+    assert "Plain" in descriptions
+    assert "Outer" not in descriptions
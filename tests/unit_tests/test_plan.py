@@ -0,0 +1,130 @@
+import itertools
+import sys
+from typing import Any
+
+import pytest
+
+from pytest_static.plan import CollectionPlan
+from pytest_static.plan import LeafPlan
+from pytest_static.plan import Plan
+from pytest_static.plan import ProductPlan
+from pytest_static.plan import SlicePlan
+from pytest_static.plan import SumPlan
+
+
+LETTERS: LeafPlan = LeafPlan("abc")
+NUMBERS: LeafPlan = LeafPlan((1, 2))
+
+
+class TestLeafPlan:
+    def test_iter(self) -> None:
+        assert list(LETTERS) == ["a", "b", "c"]
+
+    def test_nth(self) -> None:
+        assert LETTERS.nth(1) == "b"
+        assert LETTERS.nth(-1) == "c"
+
+    @pytest.mark.parametrize(argnames="index", argvalues=[3, -4])
+    def test_nth_out_of_range(self, index: int) -> None:
+        with pytest.raises(IndexError, match="out of range"):
+            LETTERS.nth(index)
+
+    def test_nth_copies_mutable(self) -> None:
+        plan: LeafPlan = LeafPlan(([1], "a"))
+        plan.nth(0).append(2)
+        assert plan.nth(0) == [1]
+        assert plan.nth(1) is plan.instances[1]
+
+    def test_repr(self) -> None:
+        assert repr(LETTERS) == "LeafPlan(size=3)"
+
+
+class TestSumPlan:
+    def test_matches_chain(self) -> None:
+        plan: SumPlan = SumPlan([LETTERS, LeafPlan(()), NUMBERS])
+        expected: list[Any] = ["a", "b", "c", 1, 2]
+        assert len(plan) == len(expected)
+        assert list(plan) == expected
+        assert [plan.nth(i) for i in range(len(plan))] == expected
+
+
+class TestProductPlan:
+    def test_matches_product(self) -> None:
+        plan: ProductPlan = ProductPlan([LETTERS, NUMBERS, LETTERS], type_constructor=lambda *args: args)
+        expected: list[tuple[Any, ...]] = list(itertools.product("abc", (1, 2), "abc"))
+        assert len(plan) == len(expected)
+        assert list(plan) == expected
+        assert [plan.nth(i) for i in range(len(plan))] == expected
+
+    def test_nth_without_iterating(self) -> None:
+        plan: ProductPlan = ProductPlan(
+            [LeafPlan(range(10))] * 30, type_constructor=lambda *args: int("".join(map(str, args)))
+        )
+        assert plan.size == 10**30
+        assert plan.nth(7_345_112) == 7_345_112
+        assert plan.nth(-1) == 10**30 - 1
+
+    def test_empty_product(self) -> None:
+        assert list(ProductPlan([], type_constructor=lambda *args: args)) == [()]
+
+
+class TestCollectionPlan:
+    def test_sizes(self) -> None:
+        plan: CollectionPlan = CollectionPlan([LETTERS, NUMBERS], (0, 1, 2), type_constructor=list)
+        expected: list[list[tuple[Any, ...]]] = [
+            [],
+            *([row] for row in itertools.product("abc", (1, 2))),
+            [("a", 1), ("b", 2)],
+            [("b", 2), ("c", 1)],
+            [("c", 1), ("a", 2)],
+        ]
+        assert len(plan) == len(expected)
+        assert list(plan) == expected
+        assert [plan.nth(i) for i in range(len(plan))] == expected
+
+    def test_large_size_is_one_container_per_element(self) -> None:
+        plan: CollectionPlan = CollectionPlan([LeafPlan(range(10))], (1000,), type_constructor=list)
+        assert plan.size == 10
+        assert plan.nth(3) == [((i + 3) % 10,) for i in range(1000)]
+
+    def test_max_size(self) -> None:
+        plan: CollectionPlan = CollectionPlan([LETTERS], (0, 2, 3, 4), type_constructor=list, max_size=3)
+        assert plan.size == 1 + 3 + 1
+        assert plan.nth(-1) == [("a",), ("b",), ("c",)]
+
+    def test_max_size_with_longer_plan(self) -> None:
+        plan: CollectionPlan = CollectionPlan([LETTERS, LeafPlan(range(4))], (2, 3), type_constructor=dict, max_size=3)
+        assert plan.size == 4 + 2
+        assert list(plan)[4:] == [{"a": 0, "b": 1, "c": 2}, {"a": 3, "b": 0, "c": 1}]
+
+    def test_empty_elements(self) -> None:
+        plan: CollectionPlan = CollectionPlan([LeafPlan(())], (0, 1, 2), type_constructor=list)
+        assert list(plan) == [[]]
+
+
+class TestSlicePlan:
+    def test_slice(self) -> None:
+        plan: ProductPlan = ProductPlan([LETTERS, NUMBERS], type_constructor=lambda *args: args)
+        view: Plan = plan[1::2]
+        assert isinstance(view, SlicePlan)
+        assert list(view) == list(plan)[1::2]
+        assert view[-1] == list(plan)[-1]
+        assert list(view[::-1]) == list(plan)[1::2][::-1]
+
+    def test_slice_larger_than_maxsize(self) -> None:
+        plan: ProductPlan = ProductPlan([LeafPlan(range(10))] * 30, type_constructor=lambda *args: args)
+        view: Plan = plan[sys.maxsize :]
+        assert view.size == 10**30 - sys.maxsize
+        assert view.nth(0) == plan.nth(sys.maxsize)
+
+
+class TestSample:
+    def test_sample_is_reproducible_and_ordered(self) -> None:
+        plan: ProductPlan = ProductPlan([LeafPlan(range(10))] * 3, type_constructor=lambda *args: args)
+        sample: list[Any] = plan.sample(20, seed=1)
+        assert sample == plan.sample(20, seed=1)
+        assert sample == sorted(sample)
+        assert len(set(sample)) == 20
+
+    def test_sample_more_than_size(self) -> None:
+        assert LETTERS.sample(10) == ["a", "b", "c"]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Literal
+
+import pytest
+
+from pytest_static.parametric import type_handlers
+from pytest_static.prefetch import PrefetchPool
+from pytest_static.prefetch import prefetch_async_instances
+from pytest_static.util import normalize_type
+from tests.util import INT_LEN
+from tests.util import STR_LEN
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from collections.abc import Iterator
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+class Corpus:
+    pass
+
+
+@pytest.fixture
+def pool() -> Iterator[PrefetchPool]:
+    prefetch_pool: PrefetchPool = PrefetchPool(workers=2)
+    yield prefetch_pool
+    prefetch_pool.shutdown()
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_prefetch_pool(pool: PrefetchPool) -> None:
+    argtypes: list[Any] = [list[int], tuple[str, bool], list[int], dict[bool, bool], set[bool]]
+    assert pool.prefetch(argtypes) == 4
+    assert len(type_handlers.instance_cache.get(normalize_type(list[int]))) == INT_LEN
+    assert pool.prefetch(argtypes) == 0
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_prefetch_pool_is_reused_by_later_modules(pool: PrefetchPool) -> None:
+    assert pool.prefetch([list[int], tuple[str, bool], dict[bool, bool], set[bool]]) == 4
+    executor: Any = pool._executor
+
+    assert pool.prefetch([list[str], tuple[int, bool]]) == 2
+    assert pool._executor is executor
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_prefetch_pool_with_too_little_work(pool: PrefetchPool) -> None:
+    assert pool.prefetch([list[int], tuple[str, bool]]) == 0
+    assert pool._executor is None
+    assert len(type_handlers.instance_cache) == 0
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_prefetch_pool_forks_again_for_new_handlers(pool: PrefetchPool) -> None:
+    assert pool.prefetch([list[int], tuple[str, bool], dict[bool, bool], set[bool]]) == 4
+    executor: Any = pool._executor
+
+    def corpus_handler(base_type: Any, _: tuple[Any, ...]) -> Iterator[Any]:
+        yield base_type.__name__
+
+    snapshot = type_handlers.snapshot()
+    type_handlers.register(Corpus)(corpus_handler)
+    try:
+        assert pool.prefetch([Corpus, list[Corpus], list[str], tuple[int, bool]]) == 4
+        assert pool._executor is not executor
+        assert type_handlers.instance_cache.get(Corpus) == ("Corpus",)
+    finally:
+        type_handlers.restore(snapshot)
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_prefetch_pool_with_max_instances(pool: PrefetchPool) -> None:
+    argtypes: list[Any] = [list[int], tuple[str, str], Literal[1, 2], set[bool]]
+    assert pool.prefetch(argtypes, max_instances=INT_LEN) == 3
+    assert normalize_type(tuple[str, str]) not in type_handlers.instance_cache
+    assert STR_LEN**2 > INT_LEN
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_prefetch_pool_with_max_instances_and_handler_without_counter(
+    pool: PrefetchPool, monkeypatch: MonkeyPatch
+) -> None:
+    def corpus_handler(base_type: Any, _: tuple[Any, ...]) -> Iterator[Any]:
+        yield os.getpid()
+
+    monkeypatch.setitem(type_handlers._mapping, Corpus, [corpus_handler])
+
+    argtypes: list[Any] = [Corpus, list[int], tuple[str, bool], set[bool]]
+    assert pool.prefetch(argtypes, max_instances=STR_LEN**2) == 4
+    assert type_handlers.instance_cache.get(Corpus) != (os.getpid(),)
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_prefetch_pool_with_single_worker() -> None:
+    assert PrefetchPool(workers=1).prefetch([list[int], tuple[str, bool], dict[bool, bool], set[bool]]) == 0
+    assert len(type_handlers.instance_cache) == 0
+
+
+class OtherCorpus:
+    pass
+
+
+class ThirdCorpus:
+    pass
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+@pytest.mark.parametrize(argnames="concurrency", argvalues=[1, 2])
+def test_prefetch_async_instances(monkeypatch: MonkeyPatch, concurrency: int) -> None:
+    running: list[Any] = []
+    peak: list[int] = [0]
+
+    async def tracking_handler(base_type: Any, type_args: tuple[Any, ...]) -> AsyncGenerator[Any, None]:
+        running.append(base_type)
+        peak[0] = max(peak[0], len(running))
+        await asyncio.sleep(0.01)
+        running.remove(base_type)
+        yield base_type.__name__
+
+    for corpus in (Corpus, OtherCorpus, ThirdCorpus):
+        monkeypatch.setitem(type_handlers._mapping, corpus, [tracking_handler])
+
+    argtypes: list[Any] = [list[Corpus], OtherCorpus, ThirdCorpus, int]
+    assert prefetch_async_instances(argtypes, concurrency=concurrency) == 3
+    assert peak[0] == concurrency
+    assert type_handlers.instance_cache.get(Corpus) == ("Corpus",)
+    assert normalize_type(int) not in type_handlers.instance_cache
+
+
+@pytest.mark.usefixtures("clean_instance_cache")
+def test_prefetch_async_instances_with_failure(monkeypatch: MonkeyPatch) -> None:
+    async def failing(base_type: Any, type_args: tuple[Any, ...]) -> AsyncGenerator[Any, None]:
+        if base_type is Corpus:
+            raise ValueError
+        yield base_type
+
+    monkeypatch.setitem(type_handlers._mapping, Corpus, [failing])
+    assert prefetch_async_instances([Corpus], concurrency=1) == 0
+    assert Corpus not in type_handlers.instance_cache
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import collections.abc
+from typing import Any
+from typing import Callable
+from typing import ForwardRef
+from typing import List
+
+import pytest
+
+from pytest_static.recursion import RecursionGuard
+
+
+def make_expander(
+    guard: RecursionGuard, graph: dict[str, list[str]], calls: collections.Counter[str] | None = None
+) -> Callable[[str], list[str]]:
+    """Returns a function listing the paths through graph, expanding each node's children with the guard."""
+
+    def expand(node: str) -> list[str]:
+        def compute() -> list[str]:
+            if calls is not None:
+                calls[node] += 1
+            paths: list[str] = [node]
+            for child in graph[node]:
+                paths.extend(f"{node}.{path}" for path in expand(child))
+            return paths
+
+        return guard.expand("paths", node, compute, [])
+
+    return expand
+
+
+@pytest.mark.parametrize(
+    argnames=("max_depth", "expected"),
+    argvalues=[(0, ["a", "a.b"]), (1, ["a", "a.b", "a.b.a", "a.b.a.b"])],
+)
+def test_expand_cuts_off_recursion(max_depth: int, expected: list[str]) -> None:
+    guard: RecursionGuard = RecursionGuard(max_depth=max_depth)
+    assert make_expander(guard, {"a": ["b"], "b": ["a"]})("a") == expected
+    assert guard.recursive_keys == {"a", "b"}
+
+
+def test_expand_memoizes_each_level() -> None:
+    calls: collections.Counter[str] = collections.Counter()
+    expand: Callable[[str], list[str]] = make_expander(
+        RecursionGuard(max_depth=3), {"a": ["b", "c"], "b": ["a"], "c": ["a"]}, calls
+    )
+    assert len(expand("a")) == 45
+    assert calls["a"] == 4
+
+
+def test_is_cacheable() -> None:
+    guard: RecursionGuard = RecursionGuard()
+    guard.recursive_keys.add("a")
+    assert guard.is_cacheable("a")
+    assert guard.expand("test", "b", lambda: (guard.is_cacheable("a"), guard.is_cacheable("c")), None) == (False, True)
+
+
+def test_clear() -> None:
+    guard: RecursionGuard = RecursionGuard(max_depth=1)
+    make_expander(guard, {"a": ["a"]})("a")
+    guard.clear()
+    assert not guard.recursive_keys
+    assert not guard._memo
+
+
+@pytest.mark.parametrize(
+    argnames=("annotation", "expected"),
+    argvalues=[
+        (ForwardRef("Mapping"), collections.abc.Mapping),
+        ("Mapping", collections.abc.Mapping),
+        ("abc.Sequence", collections.abc.Sequence),
+        ("list[Mapping]", list[collections.abc.Mapping]),
+        (int, int),
+    ],
+)
+def test_resolve(annotation: Any, expected: Any) -> None:
+    guard: RecursionGuard = RecursionGuard()
+    with guard.using_namespace({"Mapping": collections.abc.Mapping, "abc": collections.abc}):
+        assert guard.resolve(annotation) == expected
+    assert guard.namespace == {}
+
+
+def test_normalize_resolves_nested_forward_references() -> None:
+    guard: RecursionGuard = RecursionGuard()
+    with guard.using_namespace({"Item": int}):
+        assert guard.normalize(List[ForwardRef("Item")]) == (list, (int,))
+    with guard.using_namespace({"Item": str}):
+        assert guard.normalize(List[ForwardRef("Item")]) == (list, (str,))
+    assert guard.normalize(List[ForwardRef("Item")]) == (list, (ForwardRef("Item"),))
+
+
+def test_resolve_with_missing_name() -> None:
+    with pytest.raises(TypeError, match="forward reference 'Missing'"):
+        RecursionGuard().resolve("Missing")
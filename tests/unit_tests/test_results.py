@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import types
+from typing import TYPE_CHECKING
+
+from pytest_static.results import CombinationResults
+from pytest_static.results import make_combination_digest
+
+
+if TYPE_CHECKING:
+    import pytest
+    from _pytest.pytester import Pytester
+
+
+def make_results(pytester: Pytester) -> CombinationResults:
+    config: pytest.Config = pytester.parseconfigure()
+    assert config.cache is not None
+    return CombinationResults(config.cache, pytester.path)
+
+
+def make_module(pytester: Pytester, helper_source: str) -> types.ModuleType:
+    module: types.ModuleType = types.ModuleType("test_module")
+    helper: types.ModuleType = types.ModuleType("helper")
+    helper.__file__ = str(pytester.makepyfile(helper=helper_source))
+    missing: types.ModuleType = types.ModuleType("missing")
+    missing.__file__ = str(pytester.path / "missing.py")
+    vars(module).update(helper=helper, missing=missing, stdlib=types, length=len)
+    return module
+
+
+def test_start_returns_passed_combinations_of_the_same_source(pytester: Pytester) -> None:
+    results: CombinationResults = make_results(pytester)
+    assert results.start("test_func", "a") == set()
+    results.passed["test_func"].add(make_combination_digest((1, 2)))
+    results.pytest_sessionfinish()
+
+    assert make_results(pytester).start("test_func", "a") == {make_combination_digest((1, 2))}
+    assert make_results(pytester).start("test_func", "b") == set()
+
+
+def test_get_source_hash(pytester: Pytester) -> None:
+    module: types.ModuleType = make_module(pytester, "VALUE = 1")
+    source_hash: str = make_results(pytester).get_source_hash(make_module, module, "int")
+    assert source_hash == make_results(pytester).get_source_hash(make_module, module, "int")
+    assert source_hash != make_results(pytester).get_source_hash(make_module, module, "str")
+    assert source_hash != make_results(pytester).get_source_hash(make_results, module, "int")
+    assert source_hash != make_results(pytester).get_source_hash(make_module, make_module(pytester, "VALUE = 2"), "int")
+
+
+def test_get_source_hash_with_transitive_import(pytester: Pytester) -> None:
+    module: types.ModuleType = make_module(pytester, "VALUE = 1")
+    deep: types.ModuleType = types.ModuleType("deep")
+    deep.__file__ = str(pytester.makepyfile(deep="VALUE = 1"))
+    vars(deep).update(helper=module.helper, test_module=module)
+    module.helper.deep = deep
+    source_hash: str = make_results(pytester).get_source_hash(make_module, module)
+
+    pytester.makepyfile(deep="VALUE = 2")
+    assert make_results(pytester).get_source_hash(make_module, module) != source_hash
+
+
+def test_get_source_hash_without_source(pytester: Pytester) -> None:
+    module: types.ModuleType = make_module(pytester, "VALUE = 1")
+    assert make_results(pytester).get_source_hash(len, module) != make_results(pytester).get_source_hash(abs, module)
+
+
+def test_make_combination_digest() -> None:
+    assert make_combination_digest((1, 23)) != make_combination_digest((12, 3))
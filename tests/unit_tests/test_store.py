@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from pytest_static.store import ParameterStore
+
+
+def test_set_and_get(tmp_path: Path) -> None:
+    store: ParameterStore = ParameterStore(tmp_path / "store")
+    store.set(("instances", int), (1, 2, 3))
+    assert ParameterStore(tmp_path / "store").get(("instances", int)) == (1, 2, 3)
+
+
+def test_get_missing(tmp_path: Path) -> None:
+    assert ParameterStore(tmp_path).get("missing", default=-1) == -1
+
+
+def test_set_unpicklable_is_skipped(tmp_path: Path) -> None:
+    store: ParameterStore = ParameterStore(tmp_path)
+    store.set("key", (lambda: None,))
+    assert store.get("key") is None
+
+
+def test_get_corrupt_entry(tmp_path: Path) -> None:
+    store: ParameterStore = ParameterStore(tmp_path)
+    store.set("key", (1,))
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"corrupt")
+    assert store.get("key") is None
+
+
+def test_clear(tmp_path: Path) -> None:
+    store: ParameterStore = ParameterStore(tmp_path / "store")
+    store.set("key", (1,))
+    store.clear()
+    assert store.get("key") is None
+    assert not (tmp_path / "store").exists()
@@ -0,0 +1,85 @@
+import dataclasses
+from typing import Any
+from typing import NamedTuple
+from typing import Optional
+
+import pytest
+from typing_extensions import NotRequired
+from typing_extensions import TypedDict
+
+from pytest_static.structured import StructuredField
+from pytest_static.structured import construct_structured
+from pytest_static.structured import get_structured_fields
+
+
+@dataclasses.dataclass
+class DataPoint:
+    x: int
+    y: "Optional[str]" = None
+    z: list[int] = dataclasses.field(default_factory=list)
+    cached: int = dataclasses.field(default=0, init=False)
+
+
+class TuplePoint(NamedTuple):
+    x: int
+    y: bool = False
+
+
+class DictPoint(TypedDict):
+    x: int
+    y: NotRequired[str]
+
+
+@pytest.mark.parametrize(
+    argnames=("cls", "expected"),
+    argvalues=[
+        (
+            DataPoint,
+            (
+                StructuredField("x", int, False),
+                StructuredField("y", Optional[str], True),
+                StructuredField("z", list[int], True),
+            ),
+        ),
+        (TuplePoint, (StructuredField("x", int, False), StructuredField("y", bool, True))),
+        (DictPoint, (StructuredField("x", int, False), StructuredField("y", str, True))),
+    ],
+)
+def test_get_structured_fields(cls: Any, expected: tuple[StructuredField, ...]) -> None:
+    assert get_structured_fields(cls) == expected
+
+
+def test_get_structured_fields_with_attrs() -> None:
+    attrs: Any = pytest.importorskip("attrs")
+
+    @attrs.define
+    class AttrsPoint:
+        x: int
+        _y: str = "y"
+
+    assert get_structured_fields(AttrsPoint) == (StructuredField("x", int, False), StructuredField("y", str, True))
+
+
+@pytest.mark.parametrize(argnames="cls", argvalues=[int, tuple, dict, "not a type"])
+def test_get_structured_fields_with_other_types(cls: Any) -> None:
+    assert get_structured_fields(cls) is None
+
+
+def test_get_structured_fields_is_cached() -> None:
+    assert get_structured_fields(DataPoint) is get_structured_fields(DataPoint)
+
+
+def test_construct_structured() -> None:
+    assert construct_structured(TuplePoint, ("y", "x"), True, 1) == TuplePoint(x=1, y=True)
+
+
+def test_get_structured_fields_with_self_reference() -> None:
+    @dataclasses.dataclass
+    class Node:
+        value: int
+        next: "Optional[Node]" = None
+
+    assert get_structured_fields(Node) == (
+        StructuredField("value", int, False),
+        StructuredField("next", Optional[Node], True),
+    )
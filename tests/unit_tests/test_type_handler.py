@@ -1,11 +1,45 @@
+import collections.abc
+from collections.abc import AsyncGenerator
 from typing import Any
 from typing import List
+from typing import NamedTuple
+from typing import Optional
 
 import pytest
 
 from pytest_static.custom_typing import T
 from pytest_static.custom_typing import TypeHandler
+from pytest_static.profiles import EXHAUSTIVE
+from pytest_static.profiles import SMOKE
+from pytest_static.profiles import STANDARD
 from pytest_static.type_handler import TypeHandlerRegistry
+from pytest_static.type_sets import DEFAULT_INSTANCE_SETS
+from pytest_static.type_sets import SMOKE_INSTANCE_SETS
+from tests.util import dummy_type_handler
+
+
+class UserId(int):
+    pass
+
+
+class VirtualSequence:
+    pass
+
+
+collections.abc.Sequence.register(VirtualSequence)
+
+
+async def async_handler(*_: Any) -> AsyncGenerator[Any, None]:
+    yield "a"
+
+
+class Items(List[int]):
+    pass
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
 
 
 class TestTypeHandlerRegistry:
@@ -61,3 +95,115 @@ class TestTypeHandlerRegistry:
 
         type_handler_registry__basic.clear(int)
         assert type_handler_registry__basic.get(int, None) == []
+
+    def test_register_invalidates_instance_cache(
+        self, type_handler_registry: TypeHandlerRegistry, basic_handler: TypeHandler
+    ) -> None:
+        type_handler_registry.instance_cache.set(int, (1,))
+        type_handler_registry.register(int)(basic_handler)
+        assert int not in type_handler_registry.instance_cache
+
+    def test_clear_invalidates_instance_cache(self, type_handler_registry__basic: TypeHandlerRegistry) -> None:
+        type_handler_registry__basic.instance_cache.set(int, (1,))
+        type_handler_registry__basic.clear(int)
+        assert int not in type_handler_registry__basic.instance_cache
+
+    def test_restore_undoes_later_registrations(
+        self, type_handler_registry__basic: TypeHandlerRegistry, basic_handler: TypeHandler
+    ) -> None:
+        snapshot = type_handler_registry__basic.snapshot()
+        type_handler_registry__basic.register(int, str, counter=lambda *_: 3)(dummy_type_handler)
+        type_handler_registry__basic.instance_cache.set(int, (1,))
+
+        type_handler_registry__basic.restore(snapshot)
+        assert type_handler_registry__basic.get(int, None) == [basic_handler]
+        assert type_handler_registry__basic.get(str, None) is None
+        assert type_handler_registry__basic.get_counter(dummy_type_handler) is None
+        assert int not in type_handler_registry__basic.instance_cache
+
+    def test_fingerprint_changes_with_registration(
+        self, type_handler_registry: TypeHandlerRegistry, basic_handler: TypeHandler
+    ) -> None:
+        empty: str = type_handler_registry.fingerprint()
+        type_handler_registry.register(int)(basic_handler)
+        registered: str = type_handler_registry.fingerprint()
+
+        assert registered != empty
+        assert TypeHandlerRegistry().fingerprint() == empty
+
+    def test_get_with_unregistered_subclass(
+        self, type_handler_registry__basic: TypeHandlerRegistry, basic_handler: TypeHandler
+    ) -> None:
+        assert type_handler_registry__basic.get(UserId) == [basic_handler]
+        assert type_handler_registry__basic[UserId] == [basic_handler]
+
+    def test_get_with_virtual_subclass(
+        self, type_handler_registry: TypeHandlerRegistry, basic_handler: TypeHandler
+    ) -> None:
+        type_handler_registry.register(collections.abc.Sequence)(basic_handler)
+        assert type_handler_registry.get(VirtualSequence) == [basic_handler]
+
+    def test_get_with_annotated_subclass(self, type_handler_registry: TypeHandlerRegistry) -> None:
+        type_handler_registry.register(tuple)(dummy_type_handler)
+        assert type_handler_registry.get(Point) is None
+
+    def test_get_with_uninherited_handler(
+        self, type_handler_registry: TypeHandlerRegistry, basic_handler: TypeHandler
+    ) -> None:
+        type_handler_registry.register(list, inherited=False)(dummy_type_handler)
+        assert type_handler_registry.get(Items) is None
+
+        type_handler_registry.register(collections.abc.MutableSequence, inherited=False)(dummy_type_handler)
+        type_handler_registry.register(collections.abc.Sequence)(basic_handler)
+        assert type_handler_registry.get(Items) == [basic_handler]
+
+    def test_get_with_structured_subclass(self, type_handler_registry: TypeHandlerRegistry) -> None:
+        type_handler_registry.register(tuple)(dummy_type_handler)
+        assert type_handler_registry.get(collections.namedtuple("Pair", "x y")) is None
+
+    def test_has_async_handlers(self, type_handler_registry: TypeHandlerRegistry) -> None:
+        type_handler_registry.register(int)(dummy_type_handler)
+        assert not type_handler_registry.has_async_handlers()
+        type_handler_registry.register(str)(async_handler)
+        assert type_handler_registry.has_async_handlers()
+
+    def test___getitem___with_unresolved(self, type_handler_registry: TypeHandlerRegistry) -> None:
+        with pytest.raises(KeyError):
+            type_handler_registry[UserId]
+
+    def test_register_refreshes_resolved_handlers(
+        self, type_handler_registry__basic: TypeHandlerRegistry, basic_handler: TypeHandler
+    ) -> None:
+        assert type_handler_registry__basic.get(UserId) == [basic_handler]
+        type_handler_registry__basic.register(UserId)(dummy_type_handler)
+        assert type_handler_registry__basic.get(UserId) == [dummy_type_handler]
+
+    def test_set_profile(self, type_handler_registry: TypeHandlerRegistry) -> None:
+        standard: str = type_handler_registry.fingerprint()
+        type_handler_registry.set_profile(SMOKE)
+
+        assert type_handler_registry.profile == SMOKE
+        assert type_handler_registry.instance_sets is SMOKE_INSTANCE_SETS
+        assert type_handler_registry.fingerprint() != standard
+
+    def test_set_profile_keeps_caches_of_each_profile(self, type_handler_registry: TypeHandlerRegistry) -> None:
+        type_handler_registry.instance_cache.set(int, (1,))
+        type_handler_registry.set_profile(EXHAUSTIVE)
+        assert int not in type_handler_registry.instance_cache
+
+        type_handler_registry.set_profile(STANDARD)
+        assert type_handler_registry.instance_cache.get(int) == (1,)
+
+    def test_set_profile_with_invalid(self, type_handler_registry: TypeHandlerRegistry) -> None:
+        with pytest.raises(ValueError, match="Unknown profile 'huge'"):
+            type_handler_registry.set_profile("huge")
+        assert type_handler_registry.profile == STANDARD
+
+    @pytest.mark.parametrize(argnames=("profile", "expected"), argvalues=[(SMOKE, SMOKE), (None, STANDARD)])
+    def test_using_profile(
+        self, type_handler_registry: TypeHandlerRegistry, profile: Optional[str], expected: str
+    ) -> None:
+        with type_handler_registry.using_profile(profile):
+            assert type_handler_registry.profile == expected
+        assert type_handler_registry.profile == STANDARD
+        assert type_handler_registry.instance_sets is DEFAULT_INSTANCE_SETS
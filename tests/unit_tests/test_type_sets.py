@@ -1,25 +1,74 @@
+import os
+import subprocess
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from pytest_static.custom_typing import InstanceSet
 from pytest_static.type_sets import BOOL_PARAMS
 from pytest_static.type_sets import BYTES_PARAMS
 from pytest_static.type_sets import COMPLEX_PARAMS
 from pytest_static.type_sets import DEFAULT_INSTANCE_SETS
 from pytest_static.type_sets import DIGITS
 from pytest_static.type_sets import ESCAPE_SEQUENCES
+from pytest_static.type_sets import EXHAUSTIVE_INSTANCE_SETS
 from pytest_static.type_sets import FLOAT_PARAMS
 from pytest_static.type_sets import FOREIGN_CHARS
 from pytest_static.type_sets import INT_PARAMS
 from pytest_static.type_sets import LOWERCASE_LETTERS
+from pytest_static.type_sets import PROFILES
 from pytest_static.type_sets import PUNCTUATION
+from pytest_static.type_sets import SMOKE_INSTANCE_SETS
 from pytest_static.type_sets import STR_PARAMS
 from pytest_static.type_sets import TRIPLE_QUOTES
 from pytest_static.type_sets import UNICODE_CHARS
 from pytest_static.type_sets import UPPERCASE_LETTERS
 from pytest_static.type_sets import WHITESPACE
+from pytest_static.type_sets import get_instance_sets_digest
 
 
 def test_type_sets() -> None:
     assert DEFAULT_INSTANCE_SETS
     for type_set in DEFAULT_INSTANCE_SETS.values():
         assert type_set is not None
+        assert isinstance(type_set, InstanceSet)
+
+
+@pytest.mark.parametrize(argnames="instance_sets", argvalues=list(PROFILES.values()), ids=list(PROFILES))
+def test_profiles_cover_default_types(instance_sets: Mapping[Any, InstanceSet[Any]]) -> None:
+    assert instance_sets.keys() == DEFAULT_INSTANCE_SETS.keys()
+
+
+def test_profiles_grow_from_smoke_to_exhaustive() -> None:
+    for typ, instances in DEFAULT_INSTANCE_SETS.items():
+        assert len(SMOKE_INSTANCE_SETS[typ]) <= len(instances) <= len(EXHAUSTIVE_INSTANCE_SETS[typ])
+        assert set(map(repr, instances)) <= set(map(repr, EXHAUSTIVE_INSTANCE_SETS[typ]))
+
+
+def _get_default_instance_sets_order(hash_seed: str) -> str:
+    code: str = "from pytest_static.type_sets import DEFAULT_INSTANCE_SETS; print(list(DEFAULT_INSTANCE_SETS.values()))"
+    result: subprocess.CompletedProcess[str] = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONHASHSEED": hash_seed},
+        text=True,
+    )
+    return result.stdout
+
+
+@pytest.mark.parametrize(argnames="hash_seed", argvalues=["1", "2", "random"])
+def test_type_sets_order_is_independent_of_hash_seed(hash_seed: str) -> None:
+    assert _get_default_instance_sets_order(hash_seed) == _get_default_instance_sets_order("0")
+
+
+def test_get_instance_sets_digest() -> None:
+    assert get_instance_sets_digest(DEFAULT_INSTANCE_SETS) == get_instance_sets_digest(dict(DEFAULT_INSTANCE_SETS))
+    assert get_instance_sets_digest(DEFAULT_INSTANCE_SETS) != get_instance_sets_digest(SMOKE_INSTANCE_SETS)
+    changed: dict[Any, InstanceSet[Any]] = {**DEFAULT_INSTANCE_SETS, bool: InstanceSet((True,))}
+    assert get_instance_sets_digest(DEFAULT_INSTANCE_SETS) != get_instance_sets_digest(changed)
 
 
 def test_bool_params() -> None:
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+from collections.abc import AsyncGenerator
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+from typing_extensions import Literal
+
+from pytest_static.util import copy_mutable
+from pytest_static.util import copy_mutable_instances
+from pytest_static.util import describe_callable
+from pytest_static.util import is_async_handler
+from pytest_static.util import is_immutable
+from pytest_static.util import iter_handler_results
+from pytest_static.util import iter_unique_instances
+from pytest_static.util import normalize_type
+
+
+@pytest.mark.parametrize(
+    argnames=("first", "second"),
+    argvalues=[
+        (List[int], list[int]),
+        (Dict[str, List[int]], dict[str, list[int]]),
+        (Optional[List[int]], Optional[list[int]]),
+        (List, list),
+    ],
+)
+def test_normalize_type_with_equivalent(first: Any, second: Any) -> None:
+    assert normalize_type(first) == normalize_type(second)
+
+
+@pytest.mark.parametrize(
+    argnames=("first", "second"),
+    argvalues=[
+        (Literal[1], Literal[True]),
+        (Literal[0], Literal[False]),
+        (list[int], list[str]),
+    ],
+)
+def test_normalize_type_with_distinct(first: Any, second: Any) -> None:
+    assert normalize_type(first) != normalize_type(second)
+
+
+def test_normalize_type_with_callable_is_hashable() -> None:
+    assert hash(normalize_type(Callable[[int, str], bool]))
+
+
+def first_handler(value: Any) -> Any:
+    return value
+
+
+def second_handler(value: Any) -> Any:
+    return value
+
+
+def test_describe_callable() -> None:
+    assert describe_callable(first_handler) == describe_callable(first_handler)
+    assert describe_callable(first_handler) != describe_callable(second_handler)
+    assert describe_callable(partial(first_handler, value=first_handler)) != describe_callable(
+        partial(first_handler, value=second_handler)
+    )
+
+
+async def async_handler(base_type: Any, type_args: tuple[Any, ...]) -> AsyncGenerator[Any, None]:
+    for value in (1, 2):
+        await asyncio.sleep(0)
+        yield value
+
+
+def test_is_async_handler() -> None:
+    assert is_async_handler(async_handler)
+    assert is_async_handler(partial(async_handler, int))
+    assert not is_async_handler(first_handler)
+
+
+def test_iter_handler_results() -> None:
+    assert list(iter_handler_results(async_handler(int, ()))) == [1, 2]
+    assert list(iter_handler_results(iter([3]))) == [3]
+
+
+@pytest.mark.parametrize(
+    argnames=("instances", "expected"),
+    argvalues=[
+        ((1, True, 1, 1.0, True, 0, False), [1, True, 1.0, 0, False]),
+        (([1], [True], [1], (1,), {"a": 1}, {"a": True}, {"a": 1}), [[1], [True], (1,), {"a": 1}, {"a": True}]),
+        (({1}, frozenset({1}), {True}, {1}), [{1}, frozenset({1}), {True}]),
+        (([[1]], [{1: [2]}], [[1]], [{1: [2]}]), [[[1]], [{1: [2]}]]),
+        (
+            (bytearray(b"a"), [bytearray(b"a")], bytearray(b"a"), bytearray(b"b")),
+            [bytearray(b"a"), [bytearray(b"a")], bytearray(b"b")],
+        ),
+    ],
+)
+def test_iter_unique_instances(instances: tuple[Any, ...], expected: list[Any]) -> None:
+    unique: list[Any] = list(iter_unique_instances(instances))
+    assert unique == expected
+    assert list(map(type, unique)) == list(map(type, expected))
+
+
+@pytest.mark.parametrize(
+    argnames=("value", "expected"),
+    argvalues=[
+        (None, True),
+        (1.5, True),
+        (b"a", True),
+        (int, True),
+        ((1, ("a", frozenset({2}))), True),
+        ((1, [2]), False),
+        ([1], False),
+        ({"a": 1}, False),
+        (bytearray(b"a"), False),
+    ],
+)
+def test_is_immutable(value: Any, expected: bool) -> None:
+    assert is_immutable(value) is expected
+
+
+def test_copy_mutable() -> None:
+    value: list[list[int]] = [[1]]
+    copied: list[list[int]] = copy_mutable(value)
+    assert copied == value
+    assert copied is not value
+    assert copied[0] is not value[0]
+
+
+def test_copy_mutable_with_uncopyable() -> None:
+    lock: Any = threading.Lock()
+    assert copy_mutable(lock) is lock
+
+
+def test_copy_mutable_instances() -> None:
+    immutable: tuple[Any, ...] = (1, "a", (None,))
+    assert copy_mutable_instances(immutable) is immutable
+
+    instances: tuple[Any, ...] = (1, [True])
+    copied: tuple[Any, ...] = copy_mutable_instances(instances)
+    assert copied == instances
+    assert copied[0] is instances[0]
+    assert copied[1] is not instances[1]